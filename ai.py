@@ -1,5 +1,7 @@
 # python imports
+import time
 import random
+import logging
 from math import *
 
 # chillin imports
@@ -11,21 +13,63 @@ from ks.models import (World, Police, Terrorist, Bomb, Position, Constants,
 from ks.commands import DefuseBomb, PlantBomb, Move, ECommandDirection
 
 # my imports
-from graph import Graph
+from graph import Graph, DistanceMatrix, components
 from sound import Sound
+from tracker import Tracker, Occupancy, SITE_REMOVED, AGENT_DIED, BOMBSITES_ECELL
+from codec import CommandEncoder
+from worker import DecisionWorker
+import profiler
+
+log = logging.getLogger("ai")
+
+
+class Point:
+
+    # An immutable and hashable x, y pair for positions made by strategies, Position models are mutable.
+    # Slotted like Position so it's as small, a namedtuple would take a tuple header more.
+    __slots__ = ("x", "y")
+
+    def __init__(self, x:int, y:int):
+        object.__setattr__(self, "x", x)
+        object.__setattr__(self, "y", y)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Point is immutable")
+
+    def __eq__(self, other):
+        return isinstance(other, Point) and self.x == other.x and self.y == other.y
+
+    def __hash__(self):
+        return hash((self.x, self.y))
+
+    def __repr__(self):
+        return "Point(x=%r, y=%r)" % (self.x, self.y)
+
+
+# Strategies that search the board to make a new plan, skipped once a tick runs out of its time budget:
+REPLANNING_STRATEGIES = {
+    "third_police_strategy",
+    "fifth_police_strategy",
+    "seventh_police_strategy",
+    "fifth_terrorist_strategy",
+}
 
 class AI(RealtimeAI):
 
-    def __init__(self, world):
+    def __init__(self, world, batch_commands=False, decision_worker=False, decide_budget=None):
         super(AI, self).__init__(world)
         self.done = False
-
-    DEBUG = True
-
-    @staticmethod
-    def print(values, end='\n'):
-        if AI.DEBUG:
-            print(values, end=end)
+        # With batch_commands a tick's commands are sent as one CommandBatch, see codec.BatchProtocol:
+        self.batch_commands = batch_commands
+        self.pending_commands = []
+        # With decision_worker one long-lived thread decides the latest snapshot, see worker.DecisionWorker.
+        # chillin must start a single decision thread then, i.e. "create_new_thread": false in game config.
+        self.worker = DecisionWorker(self) if decision_worker else None
+        # Fraction of a cycle a decision may take, None for no limit:
+        self.decide_budget = decide_budget
+        # Last move of each agent, repeated when a tick runs out of time before deciding the agent:
+        self.fallback_moves = {}
+        self.fallbacks = 0
 
     def initialize(self):
 
@@ -50,31 +94,39 @@ class AI(RealtimeAI):
             (-1, +0): ECommandDirection.Left
         }
 
-        self.BOMBSITES_ECELL = [
-            ECell.SmallBombSite,
-            ECell.MediumBombSite,
-            ECell.LargeBombSite,
-            ECell.VastBombSite,
-        ]
-
         self.ESOUND_INTENSITIES = [
             ESoundIntensity.Strong,
             ESoundIntensity.Normal,
             ESoundIntensity.Weak
         ]
 
+        # Order of sounds in a sound board cell:
+        self.SOUND_RANKS = [
+            ESoundIntensity.Strong,
+            ESoundIntensity.Normal,
+            ESoundIntensity.Weak,
+            "VISION"
+        ]
 
-        if self.my_side == "Police":
 
-            self.police_status = {}
-            for police in self.world.polices:
-                self.police_status[police.id] = police.status
+        # Board and agents changes between snapshots:
+        self.tracker = Tracker(self.world)
+
+        # Every command our agents can send, serialized once:
+        my_agents = self.world.polices if self.my_side == "Police" else self.world.terrorists
+        self.commands = CommandEncoder([agent.id for agent in my_agents], self.batch_commands)
+
+        if self.my_side == "Police":
 
             # Path to be followed for defusing a bomb:
             self.path = {}
             self.police_bomb_site = {}
             self.police_defusing_site = {}
 
+            # Bomb sites distances, computed once and recomputed only when board changes:
+            self.bomb_site_distances = None
+            self.sound = None
+
             self.update_bombsites()
 
             # Path to be followed by hearing an specific bomb sound:
@@ -93,6 +145,9 @@ class AI(RealtimeAI):
                 self.sixth_police_strategy,
                 self.seventh_police_strategy
             ]
+
+            # Plans of polices, agents following one are decided first when time is limited:
+            self.plans = [self.path, self.path2, self.path3]
         
         else:
 
@@ -101,14 +156,9 @@ class AI(RealtimeAI):
             self.terrorist_bomb_site = {}
 
             # Making free bombsites list:
-            self.free_bomb_sites = []
-            for i in range(self.world.height):
-                for j in range(self.world.width):
-                    if self.world.board[i][j] in self.BOMBSITES_ECELL:
-                        self.free_bomb_sites.append((i, j))
+            self.free_bomb_sites = list(self.tracker.sites)
             
-            self.print("All map bomb sites:")
-            self.print(self.free_bomb_sites)
+            log.debug("All map bomb sites: %s", self.free_bomb_sites)
 
             # Waiting counter to confuse polices after escape:
             self.waiting_counter = [0 for i in range(len(self.world.terrorists))]
@@ -124,6 +174,19 @@ class AI(RealtimeAI):
                 self.fifth_terrorist_strategy
             ]
 
+            self.plans = [self.path]
+
+        if self.worker is not None:
+            self.worker.start()
+
+        # Strategy chains are wrapped only when profiling is enabled in game config:
+        strategy_profiler = profiler.get_profiler()
+        if strategy_profiler is not None:
+            if self.my_side == "Police":
+                self.police_strategies = strategy_profiler.wrap_all(self.police_strategies)
+            else:
+                self.terrorist_strategies = strategy_profiler.wrap_all(self.terrorist_strategies)
+
     def update_bombsites(self):
 
         self.visited_cells = {}
@@ -132,30 +195,38 @@ class AI(RealtimeAI):
                 self._bfs((police.position.y, police.position.x))
                 break
 
+        # Components of the board reachable from alive polices:
+        self.board_components = components(self.world)
+        self.police_components = set()
+        for police in self.world.polices:
+            if police.status == EAgentStatus.Alive:
+                self.police_components |= self.board_components.around(police.position.y * self.world.width + police.position.x)
+
         # Sorting all bomb site places:
         self.bomb_sites = []
         tmp_bomb_sites = []
         for i in range(self.world.height):
             for j in range(self.world.width):
-                if self.world.board[i][j] in self.BOMBSITES_ECELL and self._valid_bombsite((i, j)):
+                if self.world.board[i][j] in BOMBSITES_ECELL and self._valid_bombsite((i, j)):
                     self.bomb_sites.append((i+j, i, j))
                     tmp_bomb_sites.append((i+j, i, j))
         self.bomb_sites.sort()
         tmp_bomb_sites.sort()
         
-        self.print("All map bomb sites:")
-        self.print(self.bomb_sites)
+        log.debug("All map bomb sites: %s", self.bomb_sites)
+
+        if self.bomb_site_distances is None or self.bomb_site_distances.outdated(self.world):
+            self.bomb_site_distances = DistanceMatrix(self.world, [(site[1], site[2]) for site in self.bomb_sites])
 
-        # Allocating bomb sites to polices:
+        # Allocating bomb sites to polices, after explosions there may be fewer valid sites than alive polices or none at all:
         self.police_bomb_sites = {}
-        P, B = 0, len(tmp_bomb_sites)
-        for police in self.world.polices:
-            if police.status == EAgentStatus.Alive:
-                P += 1
-        for police in self.world.polices:
-            if police.status == EAgentStatus.Dead:
+        alive_polices = [police for police in self.world.polices if police.status == EAgentStatus.Alive]
+        P, B = len(alive_polices), len(tmp_bomb_sites)
+        for rank, police in enumerate(alive_polices):
+            allocation_len = B//P + 1 if rank < B%P else B//P
+            if not allocation_len:
+                self.police_bomb_sites[police.id] = []
                 continue
-            allocation_len = B//P if B%P==0 else B//P +1 if police.id < B%P else B//P
             allocation_list = [tmp_bomb_sites[-1]]
             choice_list = [(self._bdistance(t, allocation_list[0]), t[1], t[2]) for t in tmp_bomb_sites]
             choice_list.sort()
@@ -164,71 +235,64 @@ class AI(RealtimeAI):
                 tmp_bomb_sites.remove((bombsite[1]+bombsite[2], bombsite[1], bombsite[2]))
             self.police_bomb_sites[police.id] = allocation_list
 
-        self.print("Map bomb site to polices allocation:")
-        self.print(self.police_bomb_sites)
+        log.debug("Map bomb site to polices allocation: %s", self.police_bomb_sites)
 
         # Sound board to determine what sounds could be heared from an specified cell
-        self.sound_board = Sound(self.world, [(site[1], site[2]) for site in self.bomb_sites]).fill()
-        self.print("Sound board: ")
-        for i in range(self.world.height):
-            for j in range(self.world.width):
-                l = self.sound_board[i][j]
-                a, b, c, v, site_pos = 0, 0, 0, 0, [None, None, None, None]
-                for sound in l:
-                    if sound[0] == ESoundIntensity.Strong:
-                        a += 1
-                        site_pos[0] = sound[1], sound[2]
-                    elif sound[0] == ESoundIntensity.Normal:
-                        b += 1
-                        site_pos[1] = sound[1], sound[2]
-                    elif sound[0] == ESoundIntensity.Weak:
-                        c += 1
-                        site_pos[2] = sound[1], sound[2]
-                    else:
-                        v += 1 
-                        site_pos[3] = sound[1], sound[2]
-                value, values = a*100+b*10+c, [1, 10, 11, 100, 101, 110, 111]
-                self.print(("%03d" %(value) if v == 0 else "VVV") if self.world.board[i][j] == ECell.Empty else "---", end=' ')
-            self.print("")
-
-
-        # Let each police circulate around an area that cell inside the area have all sound types
-        self.police_circulating_areas = {}
-        for police_id, bombsites in self.police_bomb_sites.items():
-
-            bombsite_areas = {}
+        sites = [(site[1], site[2]) for site in self.bomb_sites]
+        if self.sound is None or self.sound.outdated(self.world):
+            self.sound = Sound(self.world, sites)
+            self.sound_board = self.sound.fill()
+        else:
+            # Only changed bomb sites' sounds are updated:
+            for site in set(self.sound.site_index) - set(sites):
+                self.sound.remove_site(site)
+            for site in sites:
+                self.sound.add_site(site)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Sound board:")
             for i in range(self.world.height):
+                row = []
                 for j in range(self.world.width):
                     l = self.sound_board[i][j]
-                    a, b, c, v, site_pos, v_pos = 0, 0, 0, 0, [None, None, None], []
+                    a, b, c, v = 0, 0, 0, 0
                     for sound in l:
                         if sound[0] == ESoundIntensity.Strong:
                             a += 1
-                            site_pos[0] = sound[1], sound[2]
                         elif sound[0] == ESoundIntensity.Normal:
                             b += 1
-                            site_pos[1] = sound[1], sound[2]
                         elif sound[0] == ESoundIntensity.Weak:
                             c += 1
-                            site_pos[2] = sound[1], sound[2]
                         else:
                             v += 1
-                            v_pos.append((sound[1], sound[2]))
-                    # TODO Change!
-                    value, values = a*100+b*10+c, [10, 100, 110]
-                    site_pos.extend(v_pos)
-                    if self.world.board[i][j] == ECell.Empty and (v >= 1 or value in values):
-                        for pos in site_pos:
-                            if pos and pos in [(t[1], t[2]) for t in self.police_bomb_sites[police_id]]:
-                                if pos not in bombsite_areas:
-                                    bombsite_areas[pos] = []
-                                if (i, j) in self.visited_cells.keys():
-                                    bombsite_areas[pos].append((i+j, i, j))
-            self.print("Agent %d bombsite areas:" % police_id)
-            self.print(bombsite_areas)
+                    value = a*100+b*10+c
+                    row.append(("%03d" %(value) if v == 0 else "VVV") if self.world.board[i][j] == ECell.Empty else "---")
+                log.debug(" ".join(row))
+
+
+        # Let each police circulate around an area that cell inside the area have all sound types
+        self.police_circulating_areas = {}
+        for police_id, bombsites in self.police_bomb_sites.items():
+
+            # Circulating cells of each bomb site are found from cells hearing or seeing it unambiguously:
+            first_cells, site_areas = {}, {}
+            for bombsite in bombsites:
+                pos, cells = (bombsite[1], bombsite[2]), []
+                for rank, intensity in enumerate(self.SOUND_RANKS):
+                    for i, j in self.sound.site_cells(pos, intensity):
+                        if self._circulating_cell(i, j):
+                            # Vision sites of a cell are listed after its sounds in bomb sites order:
+                            cells.append((i * self.world.width + j, rank, self.sound.site_index[pos] if intensity == "VISION" else 0))
+                areas = [(i+j, i, j) for i, j in (divmod(cell[0], self.world.width) for cell in sorted(cells)) if (i, j) in self.visited_cells]
+                if areas:
+                    first_cells[pos] = min(cells)
+                    site_areas[pos] = areas
+            # Bomb sites are ordered as a row by row scan of the board meets them:
+            bombsite_areas = {pos: site_areas[pos] for pos in sorted(first_cells, key=first_cells.get)}
+            log.debug("Agent %d bombsite areas: %s", police_id, bombsite_areas)
            
             selected_areas = []
-            for first_site in list(bombsite_areas.values())[0]:
+            # None of the police's bomb sites may have a reachable circulating cell:
+            for first_site in next(iter(bombsite_areas.values()), []):
                 choice_list = [first_site]
                 for other_site in list(bombsite_areas.values())[1:]:
                     choice_list.append(self._nearest(choice_list[-1], other_site))
@@ -239,14 +303,13 @@ class AI(RealtimeAI):
             selected_areas = list(set(selected_areas))
             selected_areas.sort()
 
-            self.print("Agent %d selected areas:" % police_id)
-            for area in selected_areas:
-                self.print("(%d, %d) : %s" %(area[1], area[2], self.sound_board[area[1]][area[2]]))
-            self.print("---------- ---------- ----------")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Agent %d selected areas:", police_id)
+                for area in selected_areas:
+                    log.debug("(%d, %d) : %s", area[1], area[2], self.sound_board[area[1]][area[2]])
             self.police_circulating_areas[police_id] = selected_areas
             
-        self.print("Polices circulating areas:")
-        self.print(self.police_circulating_areas)
+        log.debug("Polices circulating areas: %s", self.police_circulating_areas)
 
         self.police_circulate_index = {}
         self.police_circulate_iter = {}
@@ -254,57 +317,81 @@ class AI(RealtimeAI):
             self.police_circulate_index[police_id] = len(areas)-1
             self.police_circulate_iter[police_id] = 1
 
-  
+    def update(self, snapshot):
+        # Called by chillin's thread, a running worker applies the snapshot itself when it's done with the previous one.
+        if self.worker is not None and self.worker.running:
+            self.worker.post(snapshot)
+        else:
+            self.apply_snapshot(snapshot)
+
+    def apply_snapshot(self, snapshot):
+        super(AI, self).update(snapshot)
+
     def decide(self):
+        if self.worker is not None:
+            self.worker.run()
+        else:
+            self.decide_tick()
+
+    def decide_tick(self):
+        self.tick_start = time.perf_counter()
+        try:
+            self.decide_agents()
+        finally:
+            self.flush_commands()
+
+    def decide_agents(self):
+
+        deadline = self._deadline()
+        reallocate = False
+        events = self.tracker.update()
+        # Agents and bombs positions of this snapshot:
+        self.occupancy = Occupancy(self.world, self.my_side)
 
         if self.my_side == "Police":
-            flag = True
             # Updating bombsites when a bomb explodes!
-            for i in range(self.world.height):
-                for j in range(self.world.width):
-                    if self.world.board[i][j] not in self.BOMBSITES_ECELL and (i+j, i, j) in self.bomb_sites:
-                        flag = False
-                        self.print("Unfortunately a bomb explosion has detected, restarting polices bombsites and circulating areas allocation.")
-                        for index, bomb in self.police_defusing_site.items():
-                            if bomb == (i, j):
-                                del self.police_defusing_site[index]
-                                break
-                        for index, bomb in self.police_bomb_site.items():
-                            if bomb == (i, j):
-                                del self.police_bomb_site[index]
-                                if index in self.path:
-                                    del self.path[index]
-                                break
-                        self.update_bombsites()
+            exploded = [pos for kind, pos in events if kind == SITE_REMOVED and (pos[0]+pos[1], pos[0], pos[1]) in self.bomb_sites]
+            if exploded:
+                log.info("Unfortunately a bomb explosion has detected, restarting polices bombsites and circulating areas allocation.")
+                for pos in exploded:
+                    for index, bomb in self.police_defusing_site.items():
+                        if bomb == pos:
+                            del self.police_defusing_site[index]
+                            break
+                    for index, bomb in self.police_bomb_site.items():
+                        if bomb == pos:
+                            del self.police_bomb_site[index]
+                            if index in self.path:
+                                del self.path[index]
+                            break
+                reallocate = True
             # Updating allocation when a police dies :(
-            if flag:
-                for police in self.world.polices:
-                    if police.status != self.police_status[police.id]:
-                        self.police_status[police.id] = police.status
-                        self.print("Unfortunately we have lost one of our agents :( restarting allocation.")
-                        self.update_bombsites()
-            
+            elif any(kind == AGENT_DIED and agent[0] == "Police" for kind, agent in events):
+                log.info("Unfortunately we have lost one of our agents :( restarting allocation.")
+                reallocate = True
+            if reallocate and deadline is None:
+                self.update_bombsites()
 
         else:
-            # Updating free bomb sites:
-            for i in range(self.world.height):
-                for j in range(self.world.width):
-                    if self.world.board[i][j] in self.BOMBSITES_ECELL and (i, j) not in self.free_bomb_sites and (i, j) not in self.terrorist_bomb_site.values() and not self._has_bomb((i, j)):
-                        self.print("Bombsite (%d, %d) freed." %(i, j))
-                        self.free_bomb_sites.append((i, j))
+            # Updating free bomb sites, only bomb site cells can be freed:
+            for pos in self.tracker.sites:
+                if pos not in self.free_bomb_sites and pos not in self.terrorist_bomb_site.values() and not self._has_bomb(pos):
+                    log.info("Bombsite (%d, %d) freed.", pos[0], pos[1])
+                    self.free_bomb_sites.append(pos)
 
         
         my_agents = self.world.polices if self.my_side == 'Police' else self.world.terrorists
+        if deadline is not None:
+            # Agents continuing a plan are cheap to decide, they go first:
+            my_agents = sorted(my_agents, key=lambda agent: not any(plan.get(agent.id) for plan in self.plans))
 
         for agent in my_agents:
             if agent.status == EAgentStatus.Dead:
                 continue
-            self.print("Agent %d position (%d, %d)" %(agent.id, agent.position.y, agent.position.x))
+            log.debug("Agent %d position (%d, %d)", agent.id, agent.position.y, agent.position.x)
             if self.my_side == 'Police':
-                self.print("Agent %d hearing: %s" %(agent.id, agent.bomb_sounds))
-                for strategy in self.police_strategies:
-                    if strategy(agent):
-                        break
+                log.debug("Agent %d hearing: %s", agent.id, agent.bomb_sounds)
+                self._apply_strategies(agent, self.police_strategies, deadline)
 
             else:
                 self.bomb_defuser_pos = None
@@ -312,15 +399,60 @@ class AI(RealtimeAI):
                     self.strong_sounds[agent.id] += 1
                 else:
                     self.strong_sounds[agent.id] = 0
-                for strategy in self.terrorist_strategies:
-                    if strategy(agent):
-                        break
+                self._apply_strategies(agent, self.terrorist_strategies, deadline)
+
+        if reallocate and deadline is not None:
+            # Re-allocation may take longer than a cycle on big boards, this tick's commands are sent before it
+            # and polices follow the previous allocation meanwhile:
+            self.flush_commands()
+            self.update_bombsites()
         
     
+    def _deadline(self):
+        # Time by which this tick's replanning must stop, None when decisions have no time budget.
+        if not self.decide_budget or not self.cycle_duration:
+            return None
+        return self.tick_start + self.decide_budget * self.cycle_duration
+
+    def _apply_strategies(self, agent, strategies:list, deadline:float):
+        # Strategies in priority order until one acts, past the deadline only cheap ones are tried
+        # and an agent none of them acted for gets its fallback move.
+        late = deadline is not None and time.perf_counter() > deadline
+        for strategy in strategies:
+            if late and strategy.__name__ in REPLANNING_STRATEGIES:
+                continue
+            if strategy(agent):
+                return
+        if late:
+            self._fallback(agent)
+
+    def _fallback(self, agent):
+        # Repeating the agent's last move, or the first free direction when that cell isn't free anymore.
+        directions = self._empty_directions(agent)
+        direction = self.fallback_moves.get(agent.id)
+        if direction not in directions:
+            direction = directions[0] if directions else None
+        if direction is not None:
+            self.fallbacks += 1
+            log.debug("Out of time, agent %d falls back to %s.", agent.id, direction)
+            self.move(agent.id, direction)
+
+    def queue_command(self, command_type, agent_id, direction):
+        # Commands of a tick are sent together by flush_commands at the end of decide.
+        self.pending_commands.append((command_type, agent_id, direction))
+        if command_type is Move:
+            self.fallback_moves[agent_id] = direction
+
+    def flush_commands(self):
+        keys, self.pending_commands = self.pending_commands, []
+        if keys and self.allowed_to_decide():
+            for msg in self.commands.encode(keys, self.current_cycle):
+                self._command_send_queue.put(msg)
+
     def plant(self, agent_id, bombsite_direction):
         strong_sound_const, police_vision = self.world.constants.sound_ranges[ESoundIntensity.Strong], self.world.constants.police_vision_distance
         if self.strong_sounds[agent_id] < strong_sound_const - (police_vision+2):
-            self.send_command(PlantBomb(id=agent_id, direction=bombsite_direction))
+            self.queue_command(PlantBomb, agent_id, bombsite_direction)
 
     def _plant(self, agent_id:int, end_pos:Position, start_pos:Position):
         sub = AI._sub_pos(end_pos, start_pos)
@@ -330,7 +462,7 @@ class AI(RealtimeAI):
         return False
 
     def defuse(self, agent_id, bombsite_direction):
-        self.send_command(DefuseBomb(id=agent_id, direction=bombsite_direction))
+        self.queue_command(DefuseBomb, agent_id, bombsite_direction)
     
     def _defuse(self, agent_id:int, end_pos:Position, start_pos:Position):
         sub = AI._sub_pos(end_pos, start_pos)
@@ -341,7 +473,7 @@ class AI(RealtimeAI):
 
     def move(self, agent_id, move_direction):
         
-        self.send_command(Move(id=agent_id, direction=move_direction))
+        self.queue_command(Move, agent_id, move_direction)
     
     def _move(self, agent_id:int, end_pos:Position, start_pos:Position):
         sub = AI._sub_pos(end_pos, start_pos)
@@ -360,7 +492,7 @@ class AI(RealtimeAI):
         if agent.id in self.path:
         # Walk to bomb or defuse it    
             if self.path[agent.id]:
-                if self._move(agent.id, Position(self.path[agent.id][0][1], self.path[agent.id][0][0]), agent.position):
+                if self._move(agent.id, Point(self.path[agent.id][0][1], self.path[agent.id][0][0]), agent.position):
                     self.path[agent.id].pop(0)
                 else:
                     del self.path[agent.id]
@@ -368,7 +500,7 @@ class AI(RealtimeAI):
             else:
                 bomb = self.police_bomb_site[agent.id]
                 del self.path[agent.id]
-                if not self._defuse(agent.id, Position(bomb[1], bomb[0]), agent.position):
+                if not self._defuse(agent.id, Point(bomb[1], bomb[0]), agent.position):
                     return False
             return True
         return False
@@ -396,7 +528,7 @@ class AI(RealtimeAI):
                     if len(self.path[agent.id]) * 0.5 + self.world.constants.bomb_defusion_time <= bomb.explosion_remaining_time:
                         # Walk to bomb or defuse it    
                         if self.path[agent.id]:
-                            if self._move(agent.id, Position(self.path[agent.id][0][1], self.path[agent.id][0][0]), agent.position):
+                            if self._move(agent.id, Point(self.path[agent.id][0][1], self.path[agent.id][0][0]), agent.position):
                                 self.path[agent.id].pop(0)
                             else:
                                 del self.path[agent.id]
@@ -413,7 +545,7 @@ class AI(RealtimeAI):
         # Let's continue the path2:
         if agent.id in self.path2: 
             if self.path2[agent.id]:
-                if self._move(agent.id, Position(self.path2[agent.id][0][1], self.path2[agent.id][0][0]), agent.position):
+                if self._move(agent.id, Point(self.path2[agent.id][0][1], self.path2[agent.id][0][0]), agent.position):
                     self.path2[agent.id].pop(0)
                     return True
                 else:
@@ -424,26 +556,19 @@ class AI(RealtimeAI):
     
     def fifth_police_strategy(self, agent:Police):
         # Using an extreme police power, sound board!
-        sounds = self.sound_board[agent.position.y][agent.position.x]
         # Collecting exact location of a bombsite for a possible hearing sound from agent's position:
-        site_pos, dest = [None, None, None], None
-        for sound in sounds:
-            if sound[0] == ESoundIntensity.Strong:
-                site_pos[0] = sound[1], sound[2]
-            elif sound[0] == ESoundIntensity.Normal:
-                site_pos[1] = sound[1], sound[2]
-            elif sound[0] == ESoundIntensity.Weak:
-                site_pos[2] = sound[1], sound[2]
+        site_pos = [self.sound.heard_site(agent.position.y, agent.position.x, sound) for sound in self.ESOUND_INTENSITIES]
+        dest = None
         # Listening to server for a sound with priority of strong, normal and week...
         if site_pos[0] and ESoundIntensity.Strong in agent.bomb_sounds:
-            self.print("Strong sound bomb found: (%d, %d)" %(site_pos[0][0], site_pos[0][1]))
+            log.info("Strong sound bomb found: (%d, %d)", site_pos[0][0], site_pos[0][1])
             dest = site_pos[0]
         elif site_pos[1] and ESoundIntensity.Normal in agent.bomb_sounds:
-            self.print("Normal sound bomb found: (%d, %d)" %(site_pos[1][0], site_pos[1][1]))
+            log.info("Normal sound bomb found: (%d, %d)", site_pos[1][0], site_pos[1][1])
             dest = site_pos[1]
         '''
         elif site_pos[2] and ESoundIntensity.Weak in agent.bomb_sounds:
-            self.print("Weak sound bomb found: (%d, %d)" %(site_pos[2][0], site_pos[2][1]))
+            log.info("Weak sound bomb found: (%d, %d)", site_pos[2][0], site_pos[2][1])
             dest = site_pos[2]
         '''
         # Checking that exact destination of a planted bomb is found!
@@ -457,7 +582,7 @@ class AI(RealtimeAI):
         self.path2[agent.id] = path
         self.police_defusing_site[agent.id] = dest
         if self.path2[agent.id]:
-            if self._move(agent.id, Position(self.path2[agent.id][0][1], self.path2[agent.id][0][0]), agent.position):
+            if self._move(agent.id, Point(self.path2[agent.id][0][1], self.path2[agent.id][0][0]), agent.position):
                 self.path2[agent.id].pop(0)
             else:
                 del self.path2[agent.id]
@@ -477,7 +602,7 @@ class AI(RealtimeAI):
             if not self.path3[agent.id]:
                 del self.path3[agent.id]
                 return False
-            if self._move(agent.id, Position(self.path3[agent.id][0][1], self.path3[agent.id][0][0]), agent.position):
+            if self._move(agent.id, Point(self.path3[agent.id][0][1], self.path3[agent.id][0][0]), agent.position):
                 self.path3[agent.id].pop(0)
                 return True
             else:
@@ -486,6 +611,9 @@ class AI(RealtimeAI):
         
     def seventh_police_strategy(self, agent:Police):
         # Let's find a path from agent's position to one of its circulating areas:
+        if not self.police_circulating_areas.get(agent.id):
+            # No bomb site is left to this police, it stays where it is.
+            return False
         g = Graph(self.world, (agent.position.y, agent.position.x), self._calculate_black_pos(agent))
         _index = self.police_circulate_index[agent.id]
         dest = self.police_circulating_areas[agent.id][_index]
@@ -494,15 +622,15 @@ class AI(RealtimeAI):
             self.police_circulate_iter[agent.id] *= -1
         if len(self.police_circulating_areas[agent.id]) > 1:
             self.police_circulate_index[agent.id] += self.police_circulate_iter[agent.id]
-        self.print("Source : (%d, %d)" %(agent.position.y, agent.position.x))
-        self.print("Destination : (%d, %d)" %(dest[1], dest[2]))
+        log.debug("Source : (%d, %d)", agent.position.y, agent.position.x)
+        log.debug("Destination : (%d, %d)", dest[1], dest[2])
         path = g.bfs((dest[1], dest[2]), False)
         if path is None:
             return False
         self.path3[agent.id] = path
-        self.print(self.path3[agent.id])
+        log.debug("Agent %d circulating path: %s", agent.id, self.path3[agent.id])
         if self.path3[agent.id]:
-            if self._move(agent.id, Position(self.path3[agent.id][0][1], self.path3[agent.id][0][0]), agent.position):
+            if self._move(agent.id, Point(self.path3[agent.id][0][1], self.path3[agent.id][0][0]), agent.position):
                 self.path3[agent.id].pop(0)
                 return True
             else:
@@ -537,8 +665,7 @@ class AI(RealtimeAI):
                     del self.path[agent.id]
                 self.waiting_counter[agent.id] = 1
                 self.move(agent.id, selected_direction)
-                self.print("Escaping from two or more polices to: ", end='')
-                self.print(selected_direction)
+                log.debug("Escaping from two or more polices to: %s", selected_direction)
                 return True
         elif len(police_positions) == 1:
             police_pos = police_positions[0]
@@ -552,10 +679,11 @@ class AI(RealtimeAI):
                     black_pos.append(self.bomb_defuser_pos)
                     g = Graph(self.world, (agent.position.y, agent.position.x), black_pos)
                     dest = self._terrorist_destination(agent, (police_pos.y, police_pos.x))
-                    path = g.bfs(dest)
-                    if police.defusion_remaining_time and police.defusion_remaining_time < len(path):
+                    # No free bomb site may be left, or none reachable:
+                    path = g.bfs(dest) if dest else None
+                    if path and police.defusion_remaining_time and police.defusion_remaining_time < len(path):
                         aim_point = path[police.defusion_remaining_time-1]
-                        if self._distance(police.position, Position(aim_point[1], aim_point[0])) > self.world.constants.police_vision_distance:
+                        if self._distance(police.position, Point(aim_point[1], aim_point[0])) > self.world.constants.police_vision_distance:
                             # Escapeeeeeeee.
                             police_pos = None
                             self.terrorist_bomb_site[agent.id] = dest
@@ -586,25 +714,26 @@ class AI(RealtimeAI):
                 if not stay:
                     g = Graph(self.world, (police_pos.y, police_pos.x))
                     police_path = g.bfs((agent.position.y, agent.position.x))
-                    self.print("Police speculated path while escaping:")
-                    self.print(police_path)
+                    log.debug("Police speculated path while escaping: %s", police_path)
                     if police_path:
-                        selected_direction = self._escape_direction(agent, Position(police_path[0][1], police_path[0][0]))[0]
+                        selected_direction = self._escape_direction(agent, Point(police_path[0][1], police_path[0][0]))[0]
                         if agent.id in self.terrorist_bomb_site:
                             del self.terrorist_bomb_site[agent.id]
                         if agent.id in self.path:
                             del self.path[agent.id]
                         self.waiting_counter[agent.id] = 1
-                        self.move(agent.id, selected_direction)
+                        # Every escape direction may be blocked:
+                        if selected_direction is not None:
+                            self.move(agent.id, selected_direction)
             return True
         return False
 
     def _escape_direction(self, agent:Terrorist, police_pos:tuple):
         # Escaping from misreable police:
-        self.print("Near police detected at (%d, %d)" % (police_pos.y, police_pos.x))
+        log.debug("Near police detected at (%d, %d)", police_pos.y, police_pos.x)
         directions, selected_direction, escape_priority_queue = self._empty_directions(agent), None, []
         delta_x, delta_y = AI._sub_pos(police_pos, agent.position)
-        self.print("Escaping with (delta_y=%d, delta_x=%d)..." %(delta_y, delta_x))
+        log.debug("Escaping with (delta_y=%d, delta_x=%d)...", delta_y, delta_x)
         if delta_x == 0:
             if delta_y > 0:
                 escape_priority_queue = [ECommandDirection.Up, ECommandDirection.Left, ECommandDirection.Right]
@@ -655,7 +784,9 @@ class AI(RealtimeAI):
             if bomb.explosion_remaining_time == 1:
                 dis = self._distance(agent.position, bomb.position)
                 if dis == 1:
-                    self.move(agent.id, self._empty_directions(agent)[0])
+                    directions = self._empty_directions(agent)
+                    if directions:
+                        self.move(agent.id, directions[0])
                     return True
                 elif dis == 2:
                     return True
@@ -665,9 +796,11 @@ class AI(RealtimeAI):
         if agent.planting_remaining_time != -1:  
             strong_sound_const, police_vision = self.world.constants.sound_ranges[ESoundIntensity.Strong], self.world.constants.police_vision_distance
             if self.strong_sounds[agent.id] >= strong_sound_const - (police_vision+2):
-                self.print("Near police detected while terrorist %d was planting a bomb." %(agent.id))
+                log.info("Near police detected while terrorist %d was planting a bomb.", agent.id)
                 # Survive is better than planting this bomb.
-                self.move(agent.id, self._bombsite_direction(agent))
+                direction = self._bombsite_direction(agent)
+                if direction is not None:
+                    self.move(agent.id, direction)
                 # When a terrorist is planting a bomb and there is no police around, we let him complete his operation:)
             return True
         return False
@@ -677,8 +810,8 @@ class AI(RealtimeAI):
         if agent.id in self.path:
             if self.path[agent.id]:
                 path = self.path[agent.id]
-                if self._move(agent.id, Position(path[0][1], path[0][0]), agent.position):
-                    self.print("Agent %d is moving: (%d, %d) --> (%d, %d)" %(agent.id, agent.position.y, agent.position.x, path[0][0], path[0][1]))
+                if self._move(agent.id, Point(path[0][1], path[0][0]), agent.position):
+                    log.debug("Agent %d is moving: (%d, %d) --> (%d, %d)", agent.id, agent.position.y, agent.position.x, path[0][0], path[0][1])
                     path.pop(0)
                     return True
                 else:
@@ -688,8 +821,8 @@ class AI(RealtimeAI):
                 dest = self.terrorist_bomb_site[agent.id]
                 del self.terrorist_bomb_site[agent.id]
                 del self.path[agent.id]
-                if self._plant(agent.id, Position(dest[1], dest[0]), agent.position):
-                     self.print("Agent %d is planting a bomb!" %agent.id)
+                if self._plant(agent.id, Point(dest[1], dest[0]), agent.position):
+                     log.info("Agent %d is planting a bomb!", agent.id)
                      return True
         return False
     
@@ -700,14 +833,14 @@ class AI(RealtimeAI):
             path = g.bfs(dest)
             if path:
                 # Move!
-                if self._move(agent.id, Position(path[0][1], path[0][0]), agent.position):
+                if self._move(agent.id, Point(path[0][1], path[0][0]), agent.position):
                     path.pop(0)    
                     self.path[agent.id] = path
                     return True
             else:
                 # Hey terrorist, you are adjacent to a bombsite... Hurry up and plant!
                 del self.terrorist_bomb_site[agent.id]
-                if self._plant(agent.id, Position(dest[1], dest[0]), agent.position):
+                if self._plant(agent.id, Point(dest[1], dest[0]), agent.position):
                     return True
                 # Your way is closed:) please wait.
         return False
@@ -717,19 +850,25 @@ class AI(RealtimeAI):
         if agent.id in self.terrorist_bomb_site:
             dest = self.terrorist_bomb_site[agent.id]
         else:
-            # Let's find a path to nearest free bomb site for this lucky terrorist:
+            # Let's find a path to nearest free bomb site for this lucky terrorist, one search from agent's position reaches all of them.
+            # Sites are scored with only the defuser police blocked, other agents move away before the terrorist gets there.
+            # The search runs when a first site passes the filter, there's often none left late in a game:
+            g = None
             bombsite_index, min_distance = -1, float("inf")
             for index, bombsite in enumerate(self.free_bomb_sites):
                 if police_danger_pos and abs(bombsite[0]-police_danger_pos[0]) + abs(bombsite[1]-police_danger_pos[1]) <= self.world.constants.police_vision_distance:
                     continue
-                path = Graph(self.world, (agent.position.y, agent.position.x), [self.bomb_defuser_pos] if self.bomb_defuser_pos else []).bfs(bombsite)
-                distance = float("inf") if path is None else len(path) // self._ecell_score(self.world.board[bombsite[0]][bombsite[1]]) 
+                if g is None:
+                    g = Graph(self.world, (agent.position.y, agent.position.x), [self.bomb_defuser_pos] if self.bomb_defuser_pos else [])
+                moves = g.distance(bombsite)
+                # Path length excludes the bomb site itself:
+                distance = float("inf") if moves is None else max(moves-1, 0) // self._ecell_score(self.world.board[bombsite[0]][bombsite[1]])
                 if distance < min_distance:
                     bombsite_index, min_distance = index, distance
             if bombsite_index != -1:
                 # There exists a bombsite!
                 dest = self.free_bomb_sites[bombsite_index]
-                self.print("Terrorist with id %d wants bombsite (%d, %d)." %(agent.id, dest[0], dest[1]))
+                log.info("Terrorist with id %d wants bombsite (%d, %d).", agent.id, dest[0], dest[1])
                 self.terrorist_bomb_site[agent.id] = dest
                 self.free_bomb_sites.pop(bombsite_index)
         return dest
@@ -739,8 +878,7 @@ class AI(RealtimeAI):
         position, empty_directions = agent.position, []
         for direction in self.DIRECTIONS:
             pos = AI._sum_pos_tuples((position.x, position.y), self.DIR_TO_POS[direction])
-            agents_pos = self._calculate_black_pos(agent)
-            if self.world.board[pos[1]][pos[0]] == ECell.Empty and (pos[1], pos[0]) not in agents_pos:
+            if self.world.board[pos[1]][pos[0]] == ECell.Empty and not self.occupancy.has((pos[1], pos[0])):
                 empty_directions.append(direction)
         return empty_directions
     
@@ -748,14 +886,11 @@ class AI(RealtimeAI):
         position = agent.position
         for direction in self.DIRECTIONS:
             pos = pos = AI._sum_pos_tuples((position.x, position.y), self.DIR_TO_POS[direction])
-            if self.world.board[pos[1]][pos[0]] in self.BOMBSITES_ECELL:
+            if self.world.board[pos[1]][pos[0]] in BOMBSITES_ECELL:
                 return direction
 
     def _has_bomb(self, position):
-        for bomb in self.world.bombs:
-            if position[1] == bomb.position.x and position[0] == bomb.position.y:
-                return True
-        return False
+        return position in self.tracker.bombs
 
     @staticmethod
     def _sum_pos_tuples(t1, t2):
@@ -771,12 +906,7 @@ class AI(RealtimeAI):
     
     def _calculate_black_pos(self, agent):
         # Alive agent positions around an specified agent: 
-        black_pos = []
-        my_agents = self.world.polices if self.my_side == 'Police' else self.world.terrorists
-        for my_agent in my_agents:
-            if my_agent.status is not EAgentStatus.Dead and my_agent != agent and AI._distance(my_agent.position, agent.position) == 1:
-                black_pos.append((my_agent.position.y, my_agent.position.x))
-        return black_pos
+        return self.occupancy.neighbours((agent.position.y, agent.position.x))
 
 
     def _mdistance(self, t1, t2):
@@ -784,9 +914,9 @@ class AI(RealtimeAI):
         return abs(t1[1]-t2[1]) + abs(t1[2]-t2[2])
     
     def _bdistance(self, t1, t2):
-        g = Graph(self.world, (t1[1], t1[2]))
-        path = g.bfs((t2[1], t2[2]))
-        return float("inf") if path is None else len(path)
+        moves = self.bomb_site_distances.distance((t1[1], t1[2]), (t2[1], t2[2]))
+        # Path length excludes the destination bomb site itself:
+        return float("inf") if moves is None else max(moves-1, 0)
     
     def _pathdistance(self, l:list):
         # Calculating manhataan distance taken when following a path.(list of positions)
@@ -806,15 +936,17 @@ class AI(RealtimeAI):
                 min_value = distance
         return min_point
 
+    def _circulating_cell(self, i:int, j:int):
+        # An empty cell seeing a bomb site or hearing a strong or normal sound without a weak one.
+        if self.world.board[i][j] != ECell.Empty:
+            return False
+        if self.sound.seen_sites(i, j):
+            return True
+        return self.sound.heard_site(i, j, ESoundIntensity.Weak) is None and (self.sound.heard_site(i, j, ESoundIntensity.Strong) is not None or self.sound.heard_site(i, j, ESoundIntensity.Normal) is not None)
+
     def _valid_bombsite(self, pos:tuple):
-        # Checking wether there exists at least one path from polices to a bombsite or not.
-        res = False
-        for police in self.world.polices:
-            path = Graph(self.world, (police.position.y, police.position.x)).bfs(pos, pop_destination=False)
-            if path is not None:
-                res = True
-                break
-        return res
+        # Checking wether there exists at least one path from alive polices to a bombsite or not.
+        return not self.board_components.around(pos[0] * self.world.width + pos[1]).isdisjoint(self.police_components)
     
     def _bfs(self, source:tuple):
         self.visited_cells[source] = 0
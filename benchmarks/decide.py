@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+
+# python imports
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+
+# project imports
+from ks.models import Position, ECell, EAgentStatus
+from ks.commands import Move, ECommandDirection
+
+# my imports
+from ai import AI
+from codec import LazyWorld
+from mapgen import generate
+from simulator import SIDES, DIRECTIONS
+from stats import percentiles
+
+SIZES = [30, 60]
+# Smallest board with an open cell inside its walls:
+MIN_SIZE = 3
+TICKS = 100
+
+
+class BenchAI(AI):
+
+    # An AI whose commands are kept in sent instead of being put in chillin's send queue.
+    def __init__(self, world):
+        super(BenchAI, self).__init__(world)
+        self.sent = []
+        self.set_command_send_queue(self)
+
+    def put(self, msg):
+        pass
+
+    def flush_commands(self):
+        self.sent += self.pending_commands
+        super(BenchAI, self).flush_commands()
+
+
+class Timer:
+
+    # Calls, successful calls and total time of a wrapped method.
+    def __init__(self, function):
+        self.function = function
+        self.calls, self.hits, self.time = 0, 0, 0.0
+
+    def __call__(self, *args):
+        start = time.perf_counter()
+        result = self.function(*args)
+        self.time += time.perf_counter() - start
+        self.calls += 1
+        self.hits += bool(result)
+        return result
+
+    def report(self):
+        return {"calls": self.calls, "acted": self.hits, "total_ms": self.time * 1000}
+
+
+def make_world(size, seed):
+    # A generated map, its agents stand on distinct open cells and every bomb site is reachable.
+    # Small boards have room for fewer agents and bomb sites.
+    return generate(size, seed=seed)
+
+
+def apply_moves(world, side, commands):
+    # Moves agents of a side into empty cells, other commands don't change the snapshot.
+    agents = {agent.id: agent for agent in (world.polices if side == "Police" else world.terrorists)}
+    for command_type, agent_id, direction in commands:
+        agent = agents.get(agent_id)
+        if command_type is not Move or agent is None or agent.status == EAgentStatus.Dead:
+            continue
+        dx, dy = DIRECTIONS[direction]
+        x, y = agent.position.x + dx, agent.position.y + dy
+        if world.board[y][x] == ECell.Empty:
+            agent.position = Position(x=x, y=y)
+
+
+def play(side, size, ticks, seed, trace=False):
+    # Runs a game of given ticks, returns initialize time, decide latencies, timers and when traced,
+    # peak memory and allocated blocks left by each tick.
+    world = make_world(size, seed)
+    ai = BenchAI(LazyWorld())
+    ai.my_side = side
+    ai.world.deserialize(world.serialize())
+    ai.update_bombsites = update_bombsites = Timer(ai.update_bombsites)
+    if trace:
+        tracemalloc.start()
+    start = time.perf_counter()
+    ai.initialize()
+    initialize_time = time.perf_counter() - start
+    strategies = "police_strategies" if side == "Police" else "terrorist_strategies"
+    timers = [Timer(strategy) for strategy in getattr(ai, strategies)]
+    setattr(ai, strategies, timers)
+
+    latencies, peaks, blocks, commands = [], [], [], 0
+    for tick in range(ticks):
+        ai.world.deserialize(world.serialize())
+        ai.current_cycle = tick
+        ai.sent = []
+        if trace:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            blocks_before = sys.getallocatedblocks()
+        start = time.perf_counter()
+        ai.decide()
+        latencies.append((time.perf_counter() - start) * 1000)
+        if trace:
+            peaks.append((tracemalloc.get_traced_memory()[1] - before) / 1024)
+            blocks.append(sys.getallocatedblocks() - blocks_before)
+        commands += len(ai.sent)
+        apply_moves(world, side, ai.sent)
+    if trace:
+        tracemalloc.stop()
+    return initialize_time * 1000, latencies, update_bombsites, timers, (peaks, blocks), commands
+
+
+def run(side, size, ticks, seed):
+    initialize_ms, latencies, update_bombsites, timers, _, commands = play(side, size, ticks, seed)
+    # Allocations are traced in a second game, tracing slows down the timed one:
+    collections = sum(stats["collections"] for stats in gc.get_stats())
+    _, _, _, _, (peaks, blocks), _ = play(side, size, ticks, seed, trace=True)
+    collections = sum(stats["collections"] for stats in gc.get_stats()) - collections
+    return {
+        "initialize_ms": initialize_ms,
+        "decide_ms": percentiles(latencies),
+        "update_bombsites": update_bombsites.report(),
+        "strategies": {timer.function.__name__: timer.report() for timer in timers},
+        "allocations": {
+            "tick_peak_kb": percentiles(peaks),
+            "tick_blocks": percentiles(blocks),
+            "gc_collections": collections,
+        },
+        "commands": commands,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AI.initialize and AI.decide latencies on generated games, as JSON.")
+    parser.add_argument("sizes", type=int, nargs="*", default=SIZES, help="board sizes, %d at least" % MIN_SIZE)
+    parser.add_argument("--ticks", type=int, default=TICKS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="JSON file to write, stdout by default")
+    args = parser.parse_args()
+    if any(size < MIN_SIZE for size in args.sizes):
+        parser.error("boards must be %dx%d at least" % (MIN_SIZE, MIN_SIZE))
+
+    report = {"ticks": args.ticks, "seed": args.seed, "python": sys.version.split()[0], "runs": []}
+    for size in args.sizes:
+        for side in SIDES:
+            result = run(side, size, args.ticks, args.seed)
+            report["runs"].append(dict(side=side, board="%dx%d" % (size, size), **result))
+            print("%-9s %7s  p50 %7.3f ms  p99 %7.3f ms  max %7.3f ms" % (
+                side, "%dx%d" % (size, size), result["decide_ms"]["p50"], result["decide_ms"]["p99"], result["decide_ms"]["max"]),
+                file=sys.stderr)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+# python imports
+import random
+import sys
+import time
+
+# project imports
+from ks.models import World, Position, Bomb, ECell, ESoundIntensity
+
+# my imports
+from codec import LazyWorld
+from mapgen import generate
+
+SIZES = [15, 30, 60, 120]
+BOMBS = 2
+REPEAT = 50
+
+
+def make_snapshot(size, seed=0):
+    # Serialized generated map in the middle of a game: bombs planted on some bomb sites and agents hearing sounds.
+    world = generate(size, seed=seed)
+    rnd = random.Random(seed)
+    sounds = lambda: [rnd.choice(list(ESoundIntensity)) for _ in range(rnd.randrange(4))]
+    sites = [(i, j) for i, row in enumerate(world.board) for j, cell in enumerate(row)
+             if cell not in (ECell.Empty, ECell.Wall)]
+    for i, j in rnd.sample(sites, min(len(sites), BOMBS)):
+        world.bombs.append(Bomb(Position(x=j, y=i), 20, 0, -1))
+    for terrorist in world.terrorists:
+        terrorist.footstep_sounds = sounds()
+    for police in world.polices:
+        police.footstep_sounds, police.bomb_sounds = sounds(), sounds()
+    world.scores = {"Police": 12.0, "Terrorist": 7.5}
+    return world.serialize()
+
+
+def measure(world_type, snapshot, **kwargs):
+    world = world_type(**kwargs)
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        world.deserialize(snapshot)
+        # Fields a tick usually touches, lazy worlds decode them here:
+        world.polices, world.terrorists, world.bombs, world.board[1][1], world.constants
+    return (time.perf_counter() - start) / REPEAT, world
+
+
+def main(sizes):
+    print("%8s %10s %14s %14s" % ("board", "bytes", "generated (ms)", "lazy (ms)"))
+    for size in sizes:
+        snapshot = make_snapshot(size)
+        generated_time, generated = measure(World, snapshot)
+        # Same snapshot on every tick, so the lazy world reuses its board:
+        lazy_time, lazy = measure(LazyWorld, snapshot)
+        assert generated.serialize() == lazy.serialize() == snapshot, "decoders disagree"
+        print("%8s %10d %14.3f %14.3f" % ("%dx%d" % (size, size), len(snapshot), generated_time*1000, lazy_time*1000))
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or SIZES)
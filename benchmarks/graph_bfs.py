@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+
+# python imports
+import sys
+import time
+
+# project imports
+from ks.models import ECell
+
+# my imports
+from graph import ListGraph, ArrayGraph
+from mapgen import generate
+
+SIZES = [20, 50, 100, 200, 500]
+REPEAT = 3
+
+
+def make_search(size, seed=0):
+    # A generated map, the search goes from the first police to the bomb site farthest from it.
+    world = generate(size, seed=seed)
+    position = world.polices[0].position
+    source = (position.y, position.x)
+    sites = [(i, j) for i, row in enumerate(world.board) for j, cell in enumerate(row)
+             if cell not in (ECell.Empty, ECell.Wall)]
+    destination = max(sites, key=lambda t: abs(t[0] - source[0]) + abs(t[1] - source[1]))
+    return world, source, destination
+
+
+def measure(backend, world, source, destination):
+    best, path = float("inf"), None
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        path = backend(world, source).bfs(destination)
+        best = min(best, time.perf_counter() - start)
+    return best, path
+
+
+def main(sizes):
+    print("%8s %12s %12s %8s" % ("board", "list (ms)", "array (ms)", "speedup"))
+    for size in sizes:
+        world, source, destination = make_search(size)
+        list_time, list_path = measure(ListGraph, world, source, destination)
+        array_time, array_path = measure(ArrayGraph, world, source, destination)
+        assert list_path == array_path, "backends found different paths"
+        print("%8s %12.2f %12.2f %7.1fx" % ("%dx%d" % (size, size), list_time*1000, array_time*1000, list_time/array_time))
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or SIZES)
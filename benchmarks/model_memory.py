@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+# python imports
+import sys
+import tracemalloc
+from contextlib import contextmanager
+
+# project imports
+from ks import models
+
+# my imports
+from ai import Point
+from benchmarks.deserialize import make_snapshot
+
+SIZES = [30, 60]
+TICKS = 100
+TEMPORARIES = 10000
+MODELS = ['Constants', 'Position', 'Bomb', 'Terrorist', 'Police', 'World']
+
+
+@contextmanager
+def dict_models():
+    # Subclasses without __slots__ get a __dict__ back, generated deserialize creates them by module name.
+    slotted = {name: getattr(models, name) for name in MODELS}
+    for name, cls in slotted.items():
+        setattr(models, name, type(name, (cls,), {}))
+    try:
+        yield
+    finally:
+        for name, cls in slotted.items():
+            setattr(models, name, cls)
+
+
+def measure(snapshots):
+    # Memory held by the last decoded world and peak memory while decoding a game's snapshots one by one.
+    world_type = models.World
+    tracemalloc.start()
+    for snapshot in snapshots:
+        world = world_type()
+        world.deserialize(snapshot)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, peak
+
+
+def temporaries(make):
+    tracemalloc.start()
+    positions = [make(k, k) for k in range(TEMPORARIES)]
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return current / len(positions)
+
+
+def main(sizes):
+    print("%8s %16s %16s %16s %16s" % ("board", "dict world (KB)", "slots world (KB)", "dict peak (KB)", "slots peak (KB)"))
+    for size in sizes:
+        snapshots = [make_snapshot(size, seed) for seed in range(TICKS)]
+        with dict_models():
+            dict_current, dict_peak = measure(snapshots)
+        slots_current, slots_peak = measure(snapshots)
+        print("%8s %16.1f %16.1f %16.1f %16.1f" % ("%dx%d" % (size, size), dict_current/1024, slots_current/1024, dict_peak/1024, slots_peak/1024))
+
+    with dict_models():
+        dict_position = temporaries(models.Position)
+    print("bytes per temporary position: dict Position %.1f, slots Position %.1f, Point %.1f" % (
+        dict_position, temporaries(models.Position), temporaries(Point)))
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or SIZES)
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+# python imports
+import os
+import sys
+import time
+
+# my imports
+from replay import Replay, read_messages
+
+REPLAY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "2019-02-21_21-58-39.cr")
+REPEAT = 5
+
+
+def timed(function):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        result = function()
+    return (time.perf_counter() - start) / REPEAT * 1000, result
+
+
+def main(path):
+    index_path = path + '.bench.idx'
+    if os.path.exists(index_path):
+        os.remove(index_path)
+    stream_time, messages = timed(lambda: list(read_messages(path)))
+    print("%-28s %10.3f ms, %d messages" % ("stream all messages", stream_time, len(messages)))
+    start = time.perf_counter()
+    replay = Replay(path, index_path)
+    print("%-28s %10.3f ms, %d cycles" % ("open and build index", (time.perf_counter() - start) * 1000, len(replay)))
+    replay.close()
+    open_time, replay = timed(lambda: Replay(path, index_path))
+    print("%-28s %10.3f ms" % ("open with index", open_time))
+    last = len(replay) - 1
+    seek_time, _ = timed(lambda: replay.cycle(last))
+    print("%-28s %10.3f ms" % ("seek to last cycle", seek_time))
+    scan_time, _ = timed(lambda: list(replay.iter_cycles(0))[last])
+    print("%-28s %10.3f ms" % ("scan to last cycle", scan_time))
+    replay.close()
+    os.remove(index_path)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1] if len(sys.argv) > 1 else REPLAY)
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+# python imports
+import argparse
+import json
+import math
+import sys
+
+# my imports
+from ai import AI
+from mapgen import generate
+from codec import LazyWorld
+from simulator import SIDES, play
+
+SIZES = [15, 30, 60, 120, 200, 300]
+AGENTS = [1, 5, 10, 20]
+TICKS = 10
+
+
+def measure(size, agents, ticks, seed):
+    # initialize and mean decide times of both sides on a generated map, in ms.
+    _, clients = play(generate(size, seed=seed, agents=agents), AI(LazyWorld()), AI(LazyWorld()), ticks)
+    return {side: {
+        "initialize_ms": client.initialize_time * 1000,
+        "decide_ms": sum(client.tick_times) / len(client.tick_times) * 1000,
+    } for side, client in clients.items()}
+
+
+def growth(runs, agents, side, key):
+    # Exponents of cost against board cells between successive sizes, 1 is linear and 2 quadratic.
+    points = [(run["size"] ** 2, run[side][key]) for run in runs if run["agents"] == agents]
+    return [math.log(b / a) / math.log(m / n) if a > 0 and b > 0 else None for (n, a), (m, b) in zip(points, points[1:])]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="How AI.initialize and AI.decide costs grow with board size and agents.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--agents", type=int, nargs="+", default=AGENTS)
+    parser.add_argument("--ticks", type=int, default=TICKS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="JSON file to write, stdout by default")
+    args = parser.parse_args()
+
+    runs = []
+    print("%8s %7s %18s %18s %18s %18s" % ("board", "agents", "police init (ms)", "police tick (ms)",
+                                          "terrorist init (ms)", "terrorist tick (ms)"), file=sys.stderr)
+    for agents in args.agents:
+        for size in args.sizes:
+            run = dict(size=size, agents=agents, **measure(size, agents, args.ticks, args.seed))
+            runs.append(run)
+            print("%8s %7d %18.2f %18.3f %18.2f %18.3f" % ("%dx%d" % (size, size), agents,
+                  run["Police"]["initialize_ms"], run["Police"]["decide_ms"],
+                  run["Terrorist"]["initialize_ms"], run["Terrorist"]["decide_ms"]), file=sys.stderr, flush=True)
+
+    report = {"ticks": args.ticks, "seed": args.seed, "runs": runs, "growth": {
+        "%s %s %d" % (side, key, agents): growth(runs, agents, side, key)
+        for agents in args.agents for side in SIDES for key in ("initialize_ms", "decide_ms")
+    }}
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == '__main__':
+    main()
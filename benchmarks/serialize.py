@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+# python imports
+import sys
+import time
+
+# chillin imports
+from chillin_client.helpers.parser import Parser
+from chillin_client.helpers.messages import Message, RealtimeCommand
+
+# project imports
+from ks.models import World
+from ks.commands import Move, PlantBomb, DefuseBomb, ECommandDirection
+
+# my imports
+from codec import CommandEncoder
+from benchmarks.deserialize import make_snapshot
+
+SIZES = [15, 30, 60, 120, 240]
+REPEAT = 20
+COMMANDS = 10000
+
+
+def measure(world):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        s = world.serialize()
+    return (time.perf_counter() - start) / REPEAT, s
+
+
+def main(sizes):
+    print("%8s %10s %14s" % ("board", "bytes", "serialize (ms)"))
+    for size in sizes:
+        snapshot = make_snapshot(size)
+        world = World()
+        world.deserialize(snapshot)
+        serialize_time, s = measure(world)
+        # Round trip: decoding the output and encoding it again gives the same bytes.
+        decoded = World()
+        decoded.deserialize(s)
+        assert s == snapshot == decoded.serialize(), "round trip changed the snapshot"
+        print("%8s %10d %14.3f" % ("%dx%d" % (size, size), len(s), serialize_time*1000))
+
+    # A tick's commands, sent as chillin does it and from CommandEncoder's frames:
+    keys = [(Move, 1, ECommandDirection.Up), (PlantBomb, 2, ECommandDirection.Left), (DefuseBomb, 3, ECommandDirection.Down)]
+    start = time.perf_counter()
+    for cycle in range(COMMANDS):
+        for command_type, agent_id, direction in keys:
+            msg = RealtimeCommand(cycle=cycle)
+            msg.type, msg.payload = Parser.get_tuplestring(command_type(id=agent_id, direction=direction))
+            Message(msg.name(), Parser.get_string(msg.serialize())).serialize()
+    print("%8s %10s %14.4f" % ("command", "", (time.perf_counter() - start) / (COMMANDS * len(keys)) * 1000))
+
+    encoder = CommandEncoder([1, 2, 3], batch=True)
+    start = time.perf_counter()
+    for cycle in range(COMMANDS):
+        encoder.encode(keys, cycle)
+    print("%8s %10s %14.4f" % ("cached", "", (time.perf_counter() - start) / (COMMANDS * len(keys)) * 1000))
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or SIZES)
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+# python imports
+import sys
+import time
+
+# my imports
+from ai import AI
+from mapgen import generate
+from codec import LazyWorld
+from simulator import Game, SIDES, play
+
+SIZES = [30, 60]
+CYCLES = 2000
+GAME_CYCLES = 300
+
+
+def engine(size):
+    # Cycles per second of the rules and both sides' snapshots, without AIs.
+    game = Game(generate(size))
+    game.constants.max_cycles = CYCLES
+    start = time.perf_counter()
+    while not game.done:
+        for side in SIDES:
+            game.snapshot(side)
+        game.step({})
+    return game.cycle / (time.perf_counter() - start)
+
+
+def main(sizes):
+    print("%8s %16s %16s %20s" % ("board", "engine (cyc/s)", "games (cyc/s)", "scores"))
+    for size in sizes:
+        start = time.perf_counter()
+        game, _ = play(generate(size), AI(LazyWorld()), AI(LazyWorld()), GAME_CYCLES)
+        games = game.cycle / (time.perf_counter() - start)
+        scores = "%g - %g" % (game.world.scores["Police"], game.world.scores["Terrorist"])
+        print("%8s %16.0f %16.0f %20s" % ("%dx%d" % (size, size), engine(size), games, scores))
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or SIZES)
@@ -0,0 +1,299 @@
+# -*- coding: utf-8 -*-
+
+# python imports
+import sys
+import errno
+import socket
+import logging
+import threading
+import importlib.metadata
+from struct import Struct
+
+# chillin imports
+from chillin_client.protocol import Protocol
+from chillin_client.helpers.parser import Parser
+from chillin_client.helpers.messages import Message, RealtimeCommand
+
+# project imports
+from ks.models import (World, Constants, ECell)
+from ks.commands import (Move, PlantBomb, DefuseBomb, ECommandDirection)
+
+# Compact board of ks worlds, wire format is the same as generated code's.
+
+LITTLE_ENDIAN = sys.byteorder == 'little'
+
+# Presence bytes and values of world's width and height:
+SIZE = Struct('=BiBi')
+
+# World fields decoded on first access by LazyWorld, in their wire order:
+LAZY_FIELDS = ['board', 'scores', 'bombs', 'terrorists', 'polices', 'constants']
+# Fields kept from the previous snapshot while their bytes don't change:
+REUSED_FIELDS = {'board', 'constants'}
+
+# Frame sizes of chillin network and cycles of realtime commands:
+UINT = Struct('I')
+log = logging.getLogger("codec")
+
+# chillin-client version BatchProtocol and CommandEncoder frames are written for, as pinned in requirements:
+CHILLIN_VERSION = "1.3.1"
+# Commands an agent can send, all of them are (id, direction) pairs:
+COMMAND_TYPES = [Move, PlantBomb, DefuseBomb]
+
+# ECell of each raw board code:
+ECELLS = {cell.value & 0xff: cell for cell in ECell}
+CELLS = [ECELLS.get(code) for code in range(256)]
+
+
+class Board:
+
+    # A board stored as raw ECell codes, cell (i, j) is codes[offset + i * stride + j * step].
+    # Usually codes is one flat bytearray, with step 2 it can be a read-only view of a board on the wire.
+    # board[i][j] still gives an ECell for old code, hot loops can work on raw codes directly.
+    def __init__(self, codes:bytearray, width:int, height:int, stride:int=None, offset:int=0, step:int=1):
+        self.codes = codes
+        self.width = width
+        self.height = height
+        self.stride = width if stride is None else stride
+        self.offset = offset
+        self.step = step
+        self.rows = [BoardRow(self, offset + i * self.stride) for i in range(height)]
+
+    def __getitem__(self, i:int):
+        return self.rows[i]
+
+    def __len__(self):
+        return self.height
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def mask(self, cells):
+        # Flat bitmap of the board, 1 means the cell is one of given ECells.
+        table = bytearray(256)
+        for cell in cells:
+            table[cell.value & 0xff] = 1
+        if self.offset == 0 and self.step == 1 and self.stride == self.width:
+            return self.codes.translate(table)
+        mask = bytearray()
+        for row in self.rows:
+            mask += self.codes[row.start:row.start + self.width * self.step:self.step].translate(table)
+        return mask
+
+
+class BoardRow:
+
+    def __init__(self, board:Board, start:int):
+        self.codes = board.codes
+        self.width = board.width
+        self.step = board.step
+        self.start = start
+
+    def _index(self, j:int):
+        if j < 0:
+            j += self.width
+        if not 0 <= j < self.width:
+            raise IndexError("board index out of range")
+        return self.start + j * self.step
+
+    def __getitem__(self, j:int):
+        return CELLS[self.codes[self._index(j)]]
+
+    def __setitem__(self, j:int, cell:ECell):
+        self.codes[self._index(j)] = cell.value
+
+    def __len__(self):
+        return self.width
+
+    def __iter__(self):
+        return (CELLS[code] for code in self.codes[self.start:self.start + self.width * self.step:self.step])
+
+
+def read_board_view(s:bytes, offset:int):
+    # A Board over the snapshot bytes themselves, without copying any cell. The board has to be regular on the wire:
+    # each row is a presence byte and the same length prefix, each cell is a presence byte and its code.
+    # None means the board has missing or uneven cells.
+    height, first = read_length(s, offset)
+    if not height:
+        return Board(bytearray(), 0, 0), first
+    if not s[first]:
+        return None, offset
+    width, cells = read_length(s, first + 1)
+    header, stride = s[first:cells], cells - first + 2 * width
+    ones = b'\x01' * width
+    end = first + height * stride
+    for start in range(first, end, stride):
+        if not s.startswith(header, start) or s[start + len(header):start + stride:2] != ones:
+            return None, offset
+    return Board(s, width, height, stride, cells + 1, 2), end
+
+
+def read_length(mv:memoryview, offset:int):
+    # Lengths are unsigned ints without their trailing zero bytes, prefixed by their byte count.
+    n = mv[offset]
+    offset += 1
+    if LITTLE_ENDIAN:
+        value = int.from_bytes(mv[offset:offset + n], 'little')
+    else:
+        value = int.from_bytes(mv[offset:offset + n], 'big') << (8 * (4 - n))
+    return value, offset + n
+
+
+def _lazy_field(index:int, name:str):
+    # A property over World's slot of a field, the field and all fields before it are decoded on first access.
+    slot = World.__dict__[name]
+
+    def get(self):
+        if self._next <= index:
+            self._decode_through(index)
+        return slot.__get__(self)
+
+    def set(self, value):
+        if self._next <= index:
+            self._decode_through(index)
+        slot.__set__(self, value)
+
+    return property(get, set)
+
+
+class LazyWorld(World):
+
+    # A World over the bytes of the last snapshot, width and height are decoded right away and other fields on first access.
+    # The board is a zero-copy Board view of the snapshot when it's regular. Board and constants objects of the previous snapshot
+    # are reused while their bytes are the same, so caches keyed by board identity hit across ticks.
+    # deserialize must be given a whole world payload, like RealtimeAI.update does.
+    __slots__ = ['_buffer', '_offset', '_next', '_previous', '_lock']
+
+    board = _lazy_field(0, 'board')
+    scores = _lazy_field(1, 'scores')
+    bombs = _lazy_field(2, 'bombs')
+    terrorists = _lazy_field(3, 'terrorists')
+    polices = _lazy_field(4, 'polices')
+    constants = _lazy_field(5, 'constants')
+
+    def __init__(self, *args, **kwargs):
+        # Index of the first field not decoded yet and its offset in buffer:
+        self._buffer, self._offset, self._next = None, 0, len(LAZY_FIELDS)
+        # (bytes, object) of each reused field:
+        self._previous = {}
+        # Snapshots are received and decided in different threads:
+        self._lock = threading.Lock()
+        super(LazyWorld, self).__init__(*args, **kwargs)
+
+    def deserialize(self, s, offset=0):
+        s = s if isinstance(s, bytes) else bytes(s)
+        with self._lock:
+            self._next = len(LAZY_FIELDS)
+            if not (s[offset] and s[offset + 5]):
+                return World.deserialize(self, s, offset)
+            _, self.width, _, self.height = SIZE.unpack_from(s, offset)
+            self._buffer, self._offset, self._next = s, offset + SIZE.size, 0
+        return len(s)
+
+    def _decode_through(self, index:int):
+        with self._lock:
+            s = self._buffer
+            while self._next <= index:
+                name, offset = LAZY_FIELDS[self._next], self._offset
+                data, value = self._previous.get(name, (None, None))
+                if data is not None and s.startswith(data, offset):
+                    # Wire format is self-delimiting, same leading bytes means the same field:
+                    end = offset + len(data)
+                else:
+                    value, end = self._read(name, s, offset)
+                    if name in REUSED_FIELDS:
+                        self._previous[name] = (s[offset:end], value)
+                World.__dict__[name].__set__(self, value)
+                self._offset, self._next = end, self._next + 1
+
+    def _read(self, name:str, s:bytes, offset:int):
+        # A field with its presence byte at offset.
+        if not s[offset]:
+            return None, offset + 1
+        if name == 'board':
+            board, end = read_board_view(s, offset + 1)
+            if board is not None:
+                return board, end
+        if name == 'constants':
+            constants = Constants()
+            return constants, constants.deserialize(s, offset + 1)
+        return getattr(World, '_read_' + name)(s, offset + 1)
+
+
+class CommandBatch:
+
+    # Frames of a tick's commands joined together, written to the socket at once by BatchProtocol.
+    def __init__(self, data:bytes, count:int):
+        self.data = data
+        self.count = count
+
+
+class CommandEncoder:
+
+    # Serialized commands of agents, built once at initialize. A command is a (command type, agent id, direction) key.
+    # payloads gives the (type, payload) pair BaseAI._send_command would make from the command, frames gives the
+    # whole network frame of it without its trailing cycle.
+    def __init__(self, agent_ids, batch:bool=False):
+        self.batch = batch
+        self.payloads = {}
+        self.frames = {}
+        for command_type in COMMAND_TYPES:
+            for agent_id in agent_ids:
+                for direction in ECommandDirection:
+                    self._add((command_type, agent_id, direction))
+
+    def _add(self, key):
+        command_type, agent_id, direction = key
+        self.payloads[key] = Parser.get_tuplestring(command_type(id=agent_id, direction=direction))
+        msg = RealtimeCommand(cycle=0)
+        msg.type, msg.payload = self.payloads[key]
+        data = Message(msg.name(), Parser.get_string(msg.serialize())).serialize()
+        # Cycle is the last field of both messages, so it's the last 4 bytes of the frame:
+        self.frames[key] = UINT.pack(len(data)) + data[:-UINT.size]
+
+    def encode(self, keys, cycle:int):
+        # Items to put in chillin's command send queue for given commands of a cycle.
+        for key in keys:
+            if key not in self.payloads:
+                self._add(key)
+        if self.batch:
+            cycle = UINT.pack(cycle)
+            return [CommandBatch(b''.join(self.frames[key] + cycle for key in keys), len(keys))]
+        messages = []
+        for key in keys:
+            msg = RealtimeCommand(cycle=cycle)
+            msg.type, msg.payload = self.payloads[key]
+            messages.append(msg)
+        return messages
+
+
+class BatchProtocol(Protocol):
+
+    # Chillin's protocol that writes a CommandBatch with one socket call, other messages are sent as before.
+    def send_msg(self, msg):
+        if not isinstance(msg, CommandBatch):
+            return super(BatchProtocol, self).send_msg(msg)
+        try:
+            self._network._sock.sendall(msg.data)
+        except socket.error as e:
+            if not e.errno in [errno.EPIPE, errno.ECONNRESET]:
+                raise e
+
+
+def install_batch_protocol(client):
+    # GameClient has no hook for its protocol, so its private Core is patched. Frames of a CommandBatch are laid out
+    # like the messages of the pinned chillin-client, on other versions nothing is patched and False tells the AI
+    # to send a RealtimeCommand for each command instead of frames the server may not read.
+    try:
+        version = importlib.metadata.version("chillin-client")
+    except importlib.metadata.PackageNotFoundError:
+        version = None
+    if version != CHILLIN_VERSION:
+        log.warning("Command batches need chillin-client %s, found %s; commands are sent one by one.",
+                    CHILLIN_VERSION, version or "no installed version")
+        return False
+    core = getattr(client, '_core', None)
+    if not isinstance(getattr(core, '_protocol', None), Protocol) or not hasattr(getattr(core, '_network', None), '_sock'):
+        log.warning("Client has no chillin-client %s core to send command batches with; commands are sent one by one.", CHILLIN_VERSION)
+        return False
+    core._protocol = BatchProtocol(core._network)
+    return True
@@ -1,6 +1,87 @@
+from array import array
+
 from ks.models import (World, ECell)
+from codec import Board
+
+# (board, flat empty-cell bitmap) of the most recently flattened board:
+_flat_board = (None, None)
+
+def empty_cells(world:World):
+    # Flattening the board into a row-major bitmap, 1 means an empty cell.
+    # Each snapshot brings a new board, so it's flattened once and shared by all graphs of a tick.
+    global _flat_board
+    board, cells = _flat_board
+    if board is not world.board:
+        board = world.board
+        if isinstance(board, Board):
+            cells = board.mask([ECell.Empty])
+        else:
+            cells = bytearray(cell == ECell.Empty for row in board for cell in row)
+        _flat_board = (board, cells)
+    return cells
+
+
+# (flat empty-cell bitmap, components) of the most recently labeled board:
+_board_components = (None, None)
+
+def components(world:World):
+    # Connected components of the board are relabeled only when its empty cells change.
+    global _board_components
+    cells = empty_cells(world)
+    key, labels = _board_components
+    if key != cells:
+        key, labels = bytes(cells), Components(world)
+        _board_components = (key, labels)
+    return labels
+
+
+class Components:
+
+    def __init__(self, world:World):
+        # Labeling connected empty cells with one flood fill per component, -1 means a non-empty cell.
+        self.width = width = world.width
+        self.size = size = world.width * world.height
+        cells = empty_cells(world)
+        self.labels = labels = array('i', [-1]) * size
+        queue = array('i', [0]) * size
+        label = 0
+        for v in range(size):
+            if not cells[v] or labels[v] != -1:
+                continue
+            labels[v] = label
+            queue[0] = v
+            head, tail = 0, 1
+            while head < tail:
+                u = queue[head]
+                head += 1
+                for t in self.adjacent(u):
+                    if t != -1 and cells[t] and labels[t] == -1:
+                        labels[t] = label
+                        queue[tail] = t
+                        tail += 1
+            label += 1
+
+    def adjacent(self, v:int):
+        width, size, col = self.width, self.size, v % self.width
+        return (
+            v - width if v >= width else -1,
+            v + width if v + width < size else -1,
+            v - 1 if col > 0 else -1,
+            v + 1 if col < width - 1 else -1,
+        )
 
-class Graph:
+    def around(self, v:int):
+        # Components a cell belongs to, a non-empty cell(e.g. a bomb site) touches its adjacent empty cells' components.
+        if self.labels[v] != -1:
+            return {self.labels[v]}
+        return {self.labels[t] for t in self.adjacent(v) if t != -1 and self.labels[t] != -1}
+
+    def connected(self, first:int, second:int):
+        # False means there is no path between two cells whatever cells are blocked.
+        return first == second or second in self.adjacent(first) or not self.around(first).isdisjoint(self.around(second))
+
+
+class ListGraph:
 
     def __init__(self, world:World, source:tuple, black_pos:list=[]):
         self.world = world
@@ -8,7 +89,9 @@ class Graph:
         self.black_pos = black_pos
         self.queue = [source]
         self.pre = {source:None}
-    
+        # Distance of each discovered cell from source, filled by distance_field:
+        self.dist = None
+
     def bfs(self, destination:tuple, pop_destination=True):
         while self.queue and self.queue[0] != destination:
             x, y = self.queue[0]
@@ -16,7 +99,7 @@ class Graph:
             for t in adjacent:
                 if self.promising(t, destination):
                     self.queue.append(t)
-                    self.pre[t] = self.queue[0]   
+                    self.pre[t] = self.queue[0]
             self.queue.pop(0)
         if self.queue:
             # Empty path means source and destination are adjacent!
@@ -32,7 +115,171 @@ class Graph:
         else:
             # None means there is no path to destination.
             return None
-    
+
     def promising(self, t:tuple, destination:tuple):
         return (self.world.board[t[0]][t[1]] == ECell.Empty or t == destination) and t not in self.black_pos and t not in self.pre
-        
+
+    def distance_field(self):
+        # One search from source to every reachable cell like ArrayGraph's, non-empty cells(e.g. bomb sites) are dead ends.
+        if self.dist is not None:
+            return self
+        board, height, width = self.world.board, self.world.height, self.world.width
+        self.dist = dist = {self.source: 0}
+        queue = [self.source]
+        for v in queue:
+            if v != self.source and board[v[0]][v[1]] != ECell.Empty:
+                continue
+            x, y = v
+            for t in [(x-1, y), (x+1, y), (x, y-1), (x, y+1)]:
+                if 0 <= t[0] < height and 0 <= t[1] < width and t not in dist and t not in self.black_pos:
+                    dist[t] = dist[v] + 1
+                    queue.append(t)
+        return self
+
+    def distance(self, destination:tuple):
+        # Number of moves from source to destination cell, None means there is no path to destination.
+        return self.distance_field().dist.get(destination)
+
+
+class ArrayGraph:
+
+    def __init__(self, world:World, source:tuple, black_pos:list=[]):
+        self.world = world
+        self.width = world.width
+        self.size = world.width * world.height
+        self.cells = empty_cells(world)
+        self.source = source
+        # Blocked cells bitmap:
+        self.blocked = bytearray(self.size)
+        for pos in black_pos:
+            self.blocked[self.index(pos)] = 1
+        # Predecessor of each discovered cell, -1 means not discovered yet:
+        self.pre = array('i', [-1]) * self.size
+        # Ring buffer queue, each cell is pushed at most once so size cells are enough:
+        self.queue = array('i', [0]) * self.size
+        self.head, self.tail = 0, 0
+        # Distance of each discovered cell from source, filled by distance_field:
+        self.dist = None
+        s = self.index(source)
+        self.pre[s] = s
+        self._push(s)
+
+    def index(self, pos:tuple):
+        return pos[0] * self.width + pos[1]
+
+    def position(self, index:int):
+        return divmod(index, self.width)
+
+    def _push(self, v:int):
+        self.queue[self.tail % self.size] = v
+        self.tail += 1
+
+    def bfs(self, destination:tuple, pop_destination=True):
+        # Like ListGraph, there's no path to no destination:
+        if destination is None:
+            return None
+        d = self.index(destination)
+        if self.pre[d] == -1:
+            # Different components have no path, there's no need to search:
+            if not components(self.world).connected(self.index(self.source), d):
+                return None
+            # Destination is reachable even when it's not an empty cell(e.g. a bomb site):
+            if not self._search(d):
+                # None means there is no path to destination.
+                return None
+        # Empty path means source and destination are adjacent!
+        path = []
+        s, it = self.index(self.source), d
+        while it != s:
+            path.append(self.position(it))
+            it = self.pre[it]
+        if pop_destination and path:
+            path.pop(0)
+        path.reverse()
+        return path
+
+    def distance_field(self):
+        # One search from source to every reachable cell, non-empty cells(e.g. bomb sites) are dead ends.
+        # Afterwards bfs(destination) only rebuilds the path and distance(destination) is a lookup.
+        if self.dist is not None:
+            return self
+        if self.head:
+            # A targeted search has skipped some non-empty cells, restarting:
+            self.pre = array('i', [-1]) * self.size
+            s = self.index(self.source)
+            self.pre[s] = s
+            self.queue[0] = s
+            self.head, self.tail = 0, 1
+        self._search(-1)
+        # Queue holds cells in discovery order, so each predecessor's distance is known before its successors:
+        pre, queue = self.pre, self.queue
+        self.dist = dist = array('i', [-1]) * self.size
+        dist[queue[0]] = 0
+        for k in range(1, self.tail):
+            v = queue[k]
+            dist[v] = dist[pre[v]] + 1
+        return self
+
+    def distance(self, destination:tuple):
+        # Number of moves from source to destination cell, None means there is no path to destination.
+        d = self.distance_field().dist[self.index(destination)]
+        return None if d == -1 else d
+
+    def _search(self, d:int):
+        # Expanding the frontier until destination is discovered, search state is kept for next calls.
+        # Destination -1 expands the whole reachable area with every non-empty cell as a destination.
+        width, size, cells, blocked, pre, queue = self.width, self.size, self.cells, self.blocked, self.pre, self.queue
+        s, head, tail = self.index(self.source), self.head, self.tail
+        while head < tail:
+            v = queue[head % size]
+            head += 1
+            # A previous non-empty destination is a dead end:
+            if v != s and not cells[v]:
+                continue
+            col = v % width
+            adjacent = (
+                v - width if v >= width else -1,
+                v + width if v + width < size else -1,
+                v - 1 if col > 0 else -1,
+                v + 1 if col < width - 1 else -1,
+            )
+            for t in adjacent:
+                if t != -1 and pre[t] == -1 and not blocked[t] and (cells[t] or t == d or d == -1):
+                    pre[t] = v
+                    queue[tail % size] = t
+                    tail += 1
+                    if t == d:
+                        # v is expanded again on the next call to visit its remaining neighbours:
+                        self.head, self.tail = head - 1, tail
+                        return True
+        self.head, self.tail = head, tail
+        return False
+
+
+# Default backend used by the AI:
+Graph = ArrayGraph
+
+
+class DistanceMatrix:
+
+    def __init__(self, world:World, sites:list):
+        # All pairs distances between sites, one distance field per site stored in a flat int32 table.
+        self.sites = list(sites)
+        self.site_index = {site: k for k, site in enumerate(self.sites)}
+        # Board the table is computed for:
+        self.cells = bytes(empty_cells(world))
+        n = len(self.sites)
+        self.table = array('i', [-1]) * (n * n)
+        for k, site in enumerate(self.sites):
+            g = Graph(world, site).distance_field()
+            for l, other in enumerate(self.sites):
+                self.table[k * n + l] = g.dist[g.index(other)]
+
+    def outdated(self, world:World):
+        # Distances are valid as long as empty cells of the board don't change.
+        return empty_cells(world) != self.cells
+
+    def distance(self, first:tuple, second:tuple):
+        # Number of moves from first site to second one, None means there is no path.
+        d = self.table[self.site_index[first] * len(self.sites) + self.site_index[second]]
+        return None if d == -1 else d
@@ -1,12 +1,11 @@
 # -*- coding: utf-8 -*-
+# Generated by ksgen.py from commands.ks, edit the schema and regenerate this file instead.
 
 # python imports
 import sys
 import struct
 from enum import Enum
 
-PY3 = sys.version_info > (3,)
-
 
 class ECommandDirection(Enum):
 	Up = 0
@@ -15,8 +14,35 @@ class ECommandDirection(Enum):
 	Left = 3
 
 
+_E_COMMAND_DIRECTION = {member.value & 0xff: member for member in ECommandDirection}
+_E_COMMAND_DIRECTION_ITEMS = {member: bytes((1, member.value & 0xff)) for member in ECommandDirection}
+_E_COMMAND_DIRECTION_ITEMS[None] = b'\x00'
+_UINT = struct.Struct('=I')
+_MOVE_0 = struct.Struct('=BiBB')
+_INT = struct.Struct('=i')
+_PLANT_BOMB_0 = struct.Struct('=BiBB')
+_DEFUSE_BOMB_0 = struct.Struct('=BiBB')
+
+
+_BIG_ENDIAN = sys.byteorder == 'big'
+
+
+def _read_length(s, offset):
+	# Lengths are native unsigned ints without their trailing zero bytes, prefixed by their byte count.
+	n = s[offset]
+	value = int.from_bytes(s[offset + 1:offset + 1 + n], sys.byteorder)
+	return (value << 8 * (4 - n) if _BIG_ENDIAN else value), offset + 1 + n
+
+
+def _write_length(n):
+	tmp = _UINT.pack(n).rstrip(b'\x00')
+	return bytes((len(tmp),)) + tmp
+
+
 class Move(object):
 
+	__slots__ = ['id', 'direction']
+
 	@staticmethod
 	def name():
 		return 'Move'
@@ -32,46 +58,50 @@ class Move(object):
 	
 
 	def serialize(self):
-		s = b''
-		
-		# serialize self.id
-		s += b'\x00' if self.id is None else b'\x01'
-		if self.id is not None:
-			s += struct.pack('i', self.id)
+		s = []
 		
-		# serialize self.direction
-		s += b'\x00' if self.direction is None else b'\x01'
-		if self.direction is not None:
-			s += struct.pack('b', self.direction.value)
+		# serialize self.id, self.direction
+		if self.id is not None and self.direction is not None:
+			s.append(_MOVE_0.pack(1, self.id, 1, self.direction.value & 0xff))
+		else:
+			if self.id is None:
+				s.append(b'\x00')
+			else:
+				s.append(b'\x01')
+				s.append(_INT.pack(self.id))
+			s.append(_E_COMMAND_DIRECTION_ITEMS[self.direction])
 		
-		return s
+		return b''.join(s)
 	
 
 	def deserialize(self, s, offset=0):
-		# deserialize self.id
-		tmp0 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp0:
-			self.id = struct.unpack('i', s[offset:offset + 4])[0]
-			offset += 4
-		else:
-			self.id = None
-		
-		# deserialize self.direction
-		tmp1 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp1:
-			tmp2 = struct.unpack('b', s[offset:offset + 1])[0]
-			offset += 1
-			self.direction = ECommandDirection(tmp2)
+		# deserialize self.id, self.direction
+		if s[offset] and s[offset + 5]:
+			_, self.id, _, tmp0 = _MOVE_0.unpack_from(s, offset)
+			self.direction = _E_COMMAND_DIRECTION[tmp0]
+			offset += 7
 		else:
-			self.direction = None
+			if s[offset]:
+				self.id = _INT.unpack_from(s, offset + 1)[0]
+				offset += 5
+			else:
+				self.id = None
+				offset += 1
+			if s[offset]:
+				self.direction = _E_COMMAND_DIRECTION[s[offset + 1]]
+				offset += 2
+			else:
+				self.direction = None
+				offset += 1
 		
 		return offset
+	
 
 
 class PlantBomb(object):
 
+	__slots__ = ['id', 'direction']
+
 	@staticmethod
 	def name():
 		return 'PlantBomb'
@@ -87,46 +117,50 @@ class PlantBomb(object):
 	
 
 	def serialize(self):
-		s = b''
+		s = []
 		
-		# serialize self.id
-		s += b'\x00' if self.id is None else b'\x01'
-		if self.id is not None:
-			s += struct.pack('i', self.id)
-		
-		# serialize self.direction
-		s += b'\x00' if self.direction is None else b'\x01'
-		if self.direction is not None:
-			s += struct.pack('b', self.direction.value)
+		# serialize self.id, self.direction
+		if self.id is not None and self.direction is not None:
+			s.append(_PLANT_BOMB_0.pack(1, self.id, 1, self.direction.value & 0xff))
+		else:
+			if self.id is None:
+				s.append(b'\x00')
+			else:
+				s.append(b'\x01')
+				s.append(_INT.pack(self.id))
+			s.append(_E_COMMAND_DIRECTION_ITEMS[self.direction])
 		
-		return s
+		return b''.join(s)
 	
 
 	def deserialize(self, s, offset=0):
-		# deserialize self.id
-		tmp3 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp3:
-			self.id = struct.unpack('i', s[offset:offset + 4])[0]
-			offset += 4
+		# deserialize self.id, self.direction
+		if s[offset] and s[offset + 5]:
+			_, self.id, _, tmp0 = _PLANT_BOMB_0.unpack_from(s, offset)
+			self.direction = _E_COMMAND_DIRECTION[tmp0]
+			offset += 7
 		else:
-			self.id = None
-		
-		# deserialize self.direction
-		tmp4 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp4:
-			tmp5 = struct.unpack('b', s[offset:offset + 1])[0]
-			offset += 1
-			self.direction = ECommandDirection(tmp5)
-		else:
-			self.direction = None
+			if s[offset]:
+				self.id = _INT.unpack_from(s, offset + 1)[0]
+				offset += 5
+			else:
+				self.id = None
+				offset += 1
+			if s[offset]:
+				self.direction = _E_COMMAND_DIRECTION[s[offset + 1]]
+				offset += 2
+			else:
+				self.direction = None
+				offset += 1
 		
 		return offset
+	
 
 
 class DefuseBomb(object):
 
+	__slots__ = ['id', 'direction']
+
 	@staticmethod
 	def name():
 		return 'DefuseBomb'
@@ -142,39 +176,41 @@ class DefuseBomb(object):
 	
 
 	def serialize(self):
-		s = b''
-		
-		# serialize self.id
-		s += b'\x00' if self.id is None else b'\x01'
-		if self.id is not None:
-			s += struct.pack('i', self.id)
+		s = []
 		
-		# serialize self.direction
-		s += b'\x00' if self.direction is None else b'\x01'
-		if self.direction is not None:
-			s += struct.pack('b', self.direction.value)
+		# serialize self.id, self.direction
+		if self.id is not None and self.direction is not None:
+			s.append(_DEFUSE_BOMB_0.pack(1, self.id, 1, self.direction.value & 0xff))
+		else:
+			if self.id is None:
+				s.append(b'\x00')
+			else:
+				s.append(b'\x01')
+				s.append(_INT.pack(self.id))
+			s.append(_E_COMMAND_DIRECTION_ITEMS[self.direction])
 		
-		return s
+		return b''.join(s)
 	
 
 	def deserialize(self, s, offset=0):
-		# deserialize self.id
-		tmp6 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp6:
-			self.id = struct.unpack('i', s[offset:offset + 4])[0]
-			offset += 4
+		# deserialize self.id, self.direction
+		if s[offset] and s[offset + 5]:
+			_, self.id, _, tmp0 = _DEFUSE_BOMB_0.unpack_from(s, offset)
+			self.direction = _E_COMMAND_DIRECTION[tmp0]
+			offset += 7
 		else:
-			self.id = None
-		
-		# deserialize self.direction
-		tmp7 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp7:
-			tmp8 = struct.unpack('b', s[offset:offset + 1])[0]
-			offset += 1
-			self.direction = ECommandDirection(tmp8)
-		else:
-			self.direction = None
+			if s[offset]:
+				self.id = _INT.unpack_from(s, offset + 1)[0]
+				offset += 5
+			else:
+				self.id = None
+				offset += 1
+			if s[offset]:
+				self.direction = _E_COMMAND_DIRECTION[s[offset + 1]]
+				offset += 2
+			else:
+				self.direction = None
+				offset += 1
 		
 		return offset
+	
@@ -1,12 +1,11 @@
 # -*- coding: utf-8 -*-
+# Generated by ksgen.py from models.ks, edit the schema and regenerate this file instead.
 
 # python imports
 import sys
 import struct
 from enum import Enum
 
-PY3 = sys.version_info > (3,)
-
 
 class ECell(Enum):
 	Empty = 0
@@ -28,8 +27,264 @@ class EAgentStatus(Enum):
 	Dead = 1
 
 
+_E_CELL = {member.value & 0xff: member for member in ECell}
+_E_CELL_ITEMS = {member: bytes((1, member.value & 0xff)) for member in ECell}
+_E_CELL_ITEMS[None] = b'\x00'
+_E_SOUND_INTENSITY = {member.value & 0xff: member for member in ESoundIntensity}
+_E_SOUND_INTENSITY_ITEMS = {member: bytes((1, member.value & 0xff)) for member in ESoundIntensity}
+_E_SOUND_INTENSITY_ITEMS[None] = b'\x00'
+_E_AGENT_STATUS = {member.value & 0xff: member for member in EAgentStatus}
+_E_AGENT_STATUS_ITEMS = {member: bytes((1, member.value & 0xff)) for member in EAgentStatus}
+_E_AGENT_STATUS_ITEMS[None] = b'\x00'
+_UINT = struct.Struct('=I')
+_CONSTANTS_0 = struct.Struct('=BiBiBiBiBiBiBfBfBfBfBiBiBiBi')
+_INT = struct.Struct('=i')
+_FLOAT = struct.Struct('=f')
+_POSITION_0 = struct.Struct('=BiBi')
+_BOMB_0 = struct.Struct('=BBiBiBiBiBi')
+_TERRORIST_0 = struct.Struct('=BiBBiBiBi')
+_POLICE_0 = struct.Struct('=BiBBiBiBi')
+_WORLD_0 = struct.Struct('=BiBi')
+_MAP_E_SOUND_INTENSITY_INT_ITEM = struct.Struct('=BBBi')
+_LIST_BOMB_ITEM = struct.Struct('=BBBiBiBiBiBi')
+
+
+_BIG_ENDIAN = sys.byteorder == 'big'
+
+
+def _read_length(s, offset):
+	# Lengths are native unsigned ints without their trailing zero bytes, prefixed by their byte count.
+	n = s[offset]
+	value = int.from_bytes(s[offset + 1:offset + 1 + n], sys.byteorder)
+	return (value << 8 * (4 - n) if _BIG_ENDIAN else value), offset + 1 + n
+
+
+def _write_length(n):
+	tmp = _UINT.pack(n).rstrip(b'\x00')
+	return bytes((len(tmp),)) + tmp
+
+
+def _read_map_ESoundIntensity_int(s, offset):
+	n, offset = _read_length(s, offset)
+	end = offset + 7 * n
+	ones = b'\x01' * n
+	if len(s) >= end and s[offset:end:7] == ones and s[offset + 2:end:7] == ones:
+		return {_E_SOUND_INTENSITY[tmp0]: tmp1 for _, tmp0, _, tmp1 in _MAP_E_SOUND_INTENSITY_INT_ITEM.iter_unpack(s[offset:end])}, end
+	items = {}
+	for _ in range(n):
+		if s[offset]:
+			key = _E_SOUND_INTENSITY[s[offset + 1]]
+			offset += 2
+		else:
+			key = None
+			offset += 1
+		if s[offset]:
+			value = _INT.unpack_from(s, offset + 1)[0]
+			offset += 5
+		else:
+			value = None
+			offset += 1
+		items[key] = value
+	return items, offset
+
+
+def _write_map_ESoundIntensity_int(s, items):
+	s.append(_write_length(len(items)))
+	for key, value in items.items():
+		s.append(_E_SOUND_INTENSITY_ITEMS[key])
+		if value is None:
+			s.append(b'\x00')
+		else:
+			s.append(b'\x01')
+			s.append(_INT.pack(value))
+
+
+def _read_list_ESoundIntensity(s, offset):
+	n, offset = _read_length(s, offset)
+	end = offset + 2 * n
+	if len(s) >= end and s[offset:end:2] == b'\x01' * n:
+		return list(map(_E_SOUND_INTENSITY.__getitem__, s[offset + 1:end:2])), end
+	items = []
+	for _ in range(n):
+		if s[offset]:
+			item = _E_SOUND_INTENSITY[s[offset + 1]]
+			offset += 2
+		else:
+			item = None
+			offset += 1
+		items.append(item)
+	return items, offset
+
+
+def _write_list_ESoundIntensity(s, items):
+	s.append(_write_length(len(items)))
+	s.append(b''.join(map(_E_SOUND_INTENSITY_ITEMS.__getitem__, items)))
+
+
+def _read_list_list_ECell(s, offset):
+	n, offset = _read_length(s, offset)
+	items = []
+	for _ in range(n):
+		if s[offset]:
+			item, offset = _read_list_ECell(s, offset + 1)
+		else:
+			item = None
+			offset += 1
+		items.append(item)
+	return items, offset
+
+
+def _write_list_list_ECell(s, items):
+	s.append(_write_length(len(items)))
+	for item in items:
+		if item is None:
+			s.append(b'\x00')
+		else:
+			s.append(b'\x01')
+			_write_list_ECell(s, item)
+
+
+def _read_map_string_float(s, offset):
+	n, offset = _read_length(s, offset)
+	items = {}
+	for _ in range(n):
+		if s[offset]:
+			tmp0, offset = _read_length(s, offset + 1)
+			key = str(s[offset:offset + tmp0], 'ISO-8859-1')
+			offset += tmp0
+		else:
+			key = None
+			offset += 1
+		if s[offset]:
+			value = _FLOAT.unpack_from(s, offset + 1)[0]
+			offset += 5
+		else:
+			value = None
+			offset += 1
+		items[key] = value
+	return items, offset
+
+
+def _write_map_string_float(s, items):
+	s.append(_write_length(len(items)))
+	for key, value in items.items():
+		if key is None:
+			s.append(b'\x00')
+		else:
+			s.append(b'\x01')
+			s.append(_write_length(len(key)))
+			s.append(key.encode('ISO-8859-1'))
+		if value is None:
+			s.append(b'\x00')
+		else:
+			s.append(b'\x01')
+			s.append(_FLOAT.pack(value))
+
+
+def _read_list_Bomb(s, offset):
+	n, offset = _read_length(s, offset)
+	end = offset + 27 * n
+	ones = b'\x01' * n
+	if len(s) >= end and s[offset:end:27] == ones and s[offset + 1:end:27] == ones and s[offset + 2:end:27] == ones and s[offset + 7:end:27] == ones and s[offset + 12:end:27] == ones and s[offset + 17:end:27] == ones and s[offset + 22:end:27] == ones:
+		return [Bomb(Position(tmp0, tmp1), tmp2, tmp3, tmp4) for _, _, _, tmp0, _, tmp1, _, tmp2, _, tmp3, _, tmp4 in _LIST_BOMB_ITEM.iter_unpack(s[offset:end])], end
+	items = []
+	for _ in range(n):
+		if s[offset]:
+			item = Bomb()
+			offset = item.deserialize(s, offset + 1)
+		else:
+			item = None
+			offset += 1
+		items.append(item)
+	return items, offset
+
+
+def _write_list_Bomb(s, items):
+	s.append(_write_length(len(items)))
+	for item in items:
+		if item is None:
+			s.append(b'\x00')
+		else:
+			s.append(b'\x01')
+			s.append(item.serialize())
+
+
+def _read_list_Terrorist(s, offset):
+	n, offset = _read_length(s, offset)
+	items = []
+	for _ in range(n):
+		if s[offset]:
+			item = Terrorist()
+			offset = item.deserialize(s, offset + 1)
+		else:
+			item = None
+			offset += 1
+		items.append(item)
+	return items, offset
+
+
+def _write_list_Terrorist(s, items):
+	s.append(_write_length(len(items)))
+	for item in items:
+		if item is None:
+			s.append(b'\x00')
+		else:
+			s.append(b'\x01')
+			s.append(item.serialize())
+
+
+def _read_list_Police(s, offset):
+	n, offset = _read_length(s, offset)
+	items = []
+	for _ in range(n):
+		if s[offset]:
+			item = Police()
+			offset = item.deserialize(s, offset + 1)
+		else:
+			item = None
+			offset += 1
+		items.append(item)
+	return items, offset
+
+
+def _write_list_Police(s, items):
+	s.append(_write_length(len(items)))
+	for item in items:
+		if item is None:
+			s.append(b'\x00')
+		else:
+			s.append(b'\x01')
+			s.append(item.serialize())
+
+
+def _read_list_ECell(s, offset):
+	n, offset = _read_length(s, offset)
+	end = offset + 2 * n
+	if len(s) >= end and s[offset:end:2] == b'\x01' * n:
+		return list(map(_E_CELL.__getitem__, s[offset + 1:end:2])), end
+	items = []
+	for _ in range(n):
+		if s[offset]:
+			item = _E_CELL[s[offset + 1]]
+			offset += 2
+		else:
+			item = None
+			offset += 1
+		items.append(item)
+	return items, offset
+
+
+def _write_list_ECell(s, items):
+	s.append(_write_length(len(items)))
+	s.append(b''.join(map(_E_CELL_ITEMS.__getitem__, items)))
+
+
 class Constants(object):
 
+	__slots__ = ['bomb_planting_time', 'bomb_defusion_time', 'bomb_explosion_time', 'bomb_planting_score', 'bomb_defusion_score', 'bomb_explosion_score', 'score_coefficient_small_bomb_site', 'score_coefficient_medium_bomb_site', 'score_coefficient_large_bomb_site', 'score_coefficient_vast_bomb_site', 'terrorist_vision_distance', 'terrorist_death_score', 'police_death_score', 'police_vision_distance', 'sound_ranges', 'max_cycles']
+
+	_read_sound_ranges = staticmethod(_read_map_ESoundIntensity_int)
+
 	@staticmethod
 	def name():
 		return 'Constants'
@@ -59,277 +314,214 @@ class Constants(object):
 	
 
 	def serialize(self):
-		s = b''
-		
-		# serialize self.bomb_planting_time
-		s += b'\x00' if self.bomb_planting_time is None else b'\x01'
-		if self.bomb_planting_time is not None:
-			s += struct.pack('i', self.bomb_planting_time)
-		
-		# serialize self.bomb_defusion_time
-		s += b'\x00' if self.bomb_defusion_time is None else b'\x01'
-		if self.bomb_defusion_time is not None:
-			s += struct.pack('i', self.bomb_defusion_time)
-		
-		# serialize self.bomb_explosion_time
-		s += b'\x00' if self.bomb_explosion_time is None else b'\x01'
-		if self.bomb_explosion_time is not None:
-			s += struct.pack('i', self.bomb_explosion_time)
+		s = []
 		
-		# serialize self.bomb_planting_score
-		s += b'\x00' if self.bomb_planting_score is None else b'\x01'
-		if self.bomb_planting_score is not None:
-			s += struct.pack('i', self.bomb_planting_score)
-		
-		# serialize self.bomb_defusion_score
-		s += b'\x00' if self.bomb_defusion_score is None else b'\x01'
-		if self.bomb_defusion_score is not None:
-			s += struct.pack('i', self.bomb_defusion_score)
-		
-		# serialize self.bomb_explosion_score
-		s += b'\x00' if self.bomb_explosion_score is None else b'\x01'
-		if self.bomb_explosion_score is not None:
-			s += struct.pack('i', self.bomb_explosion_score)
-		
-		# serialize self.score_coefficient_small_bomb_site
-		s += b'\x00' if self.score_coefficient_small_bomb_site is None else b'\x01'
-		if self.score_coefficient_small_bomb_site is not None:
-			s += struct.pack('f', self.score_coefficient_small_bomb_site)
-		
-		# serialize self.score_coefficient_medium_bomb_site
-		s += b'\x00' if self.score_coefficient_medium_bomb_site is None else b'\x01'
-		if self.score_coefficient_medium_bomb_site is not None:
-			s += struct.pack('f', self.score_coefficient_medium_bomb_site)
-		
-		# serialize self.score_coefficient_large_bomb_site
-		s += b'\x00' if self.score_coefficient_large_bomb_site is None else b'\x01'
-		if self.score_coefficient_large_bomb_site is not None:
-			s += struct.pack('f', self.score_coefficient_large_bomb_site)
-		
-		# serialize self.score_coefficient_vast_bomb_site
-		s += b'\x00' if self.score_coefficient_vast_bomb_site is None else b'\x01'
-		if self.score_coefficient_vast_bomb_site is not None:
-			s += struct.pack('f', self.score_coefficient_vast_bomb_site)
-		
-		# serialize self.terrorist_vision_distance
-		s += b'\x00' if self.terrorist_vision_distance is None else b'\x01'
-		if self.terrorist_vision_distance is not None:
-			s += struct.pack('i', self.terrorist_vision_distance)
-		
-		# serialize self.terrorist_death_score
-		s += b'\x00' if self.terrorist_death_score is None else b'\x01'
-		if self.terrorist_death_score is not None:
-			s += struct.pack('i', self.terrorist_death_score)
-		
-		# serialize self.police_death_score
-		s += b'\x00' if self.police_death_score is None else b'\x01'
-		if self.police_death_score is not None:
-			s += struct.pack('i', self.police_death_score)
-		
-		# serialize self.police_vision_distance
-		s += b'\x00' if self.police_vision_distance is None else b'\x01'
-		if self.police_vision_distance is not None:
-			s += struct.pack('i', self.police_vision_distance)
+		# serialize self.bomb_planting_time, self.bomb_defusion_time, self.bomb_explosion_time, self.bomb_planting_score, self.bomb_defusion_score, self.bomb_explosion_score, self.score_coefficient_small_bomb_site, self.score_coefficient_medium_bomb_site, self.score_coefficient_large_bomb_site, self.score_coefficient_vast_bomb_site, self.terrorist_vision_distance, self.terrorist_death_score, self.police_death_score, self.police_vision_distance
+		if self.bomb_planting_time is not None and self.bomb_defusion_time is not None and self.bomb_explosion_time is not None and self.bomb_planting_score is not None and self.bomb_defusion_score is not None and self.bomb_explosion_score is not None and self.score_coefficient_small_bomb_site is not None and self.score_coefficient_medium_bomb_site is not None and self.score_coefficient_large_bomb_site is not None and self.score_coefficient_vast_bomb_site is not None and self.terrorist_vision_distance is not None and self.terrorist_death_score is not None and self.police_death_score is not None and self.police_vision_distance is not None:
+			s.append(_CONSTANTS_0.pack(1, self.bomb_planting_time, 1, self.bomb_defusion_time, 1, self.bomb_explosion_time, 1, self.bomb_planting_score, 1, self.bomb_defusion_score, 1, self.bomb_explosion_score, 1, self.score_coefficient_small_bomb_site, 1, self.score_coefficient_medium_bomb_site, 1, self.score_coefficient_large_bomb_site, 1, self.score_coefficient_vast_bomb_site, 1, self.terrorist_vision_distance, 1, self.terrorist_death_score, 1, self.police_death_score, 1, self.police_vision_distance))
+		else:
+			if self.bomb_planting_time is None:
+				s.append(b'\x00')
+			else:
+				s.append(b'\x01')
+				s.append(_INT.pack(self.bomb_planting_time))
+			if self.bomb_defusion_time is None:
+				s.append(b'\x00')
+			else:
+				s.append(b'\x01')
+				s.append(_INT.pack(self.bomb_defusion_time))
+			if self.bomb_explosion_time is None:
+				s.append(b'\x00')
+			else:
+				s.append(b'\x01')
+				s.append(_INT.pack(self.bomb_explosion_time))
+			if self.bomb_planting_score is None:
+				s.append(b'\x00')
+			else:
+				s.append(b'\x01')
+				s.append(_INT.pack(self.bomb_planting_score))
+			if self.bomb_defusion_score is None:
+				s.append(b'\x00')
+			else:
+				s.append(b'\x01')
+				s.append(_INT.pack(self.bomb_defusion_score))
+			if self.bomb_explosion_score is None:
+				s.append(b'\x00')
+			else:
+				s.append(b'\x01')
+				s.append(_INT.pack(self.bomb_explosion_score))
+			if self.score_coefficient_small_bomb_site is None:
+				s.append(b'\x00')
+			else:
+				s.append(b'\x01')
+				s.append(_FLOAT.pack(self.score_coefficient_small_bomb_site))
+			if self.score_coefficient_medium_bomb_site is None:
+				s.append(b'\x00')
+			else:
+				s.append(b'\x01')
+				s.append(_FLOAT.pack(self.score_coefficient_medium_bomb_site))
+			if self.score_coefficient_large_bomb_site is None:
+				s.append(b'\x00')
+			else:
+				s.append(b'\x01')
+				s.append(_FLOAT.pack(self.score_coefficient_large_bomb_site))
+			if self.score_coefficient_vast_bomb_site is None:
+				s.append(b'\x00')
+			else:
+				s.append(b'\x01')
+				s.append(_FLOAT.pack(self.score_coefficient_vast_bomb_site))
+			if self.terrorist_vision_distance is None:
+				s.append(b'\x00')
+			else:
+				s.append(b'\x01')
+				s.append(_INT.pack(self.terrorist_vision_distance))
+			if self.terrorist_death_score is None:
+				s.append(b'\x00')
+			else:
+				s.append(b'\x01')
+				s.append(_INT.pack(self.terrorist_death_score))
+			if self.police_death_score is None:
+				s.append(b'\x00')
+			else:
+				s.append(b'\x01')
+				s.append(_INT.pack(self.police_death_score))
+			if self.police_vision_distance is None:
+				s.append(b'\x00')
+			else:
+				s.append(b'\x01')
+				s.append(_INT.pack(self.police_vision_distance))
 		
 		# serialize self.sound_ranges
-		s += b'\x00' if self.sound_ranges is None else b'\x01'
-		if self.sound_ranges is not None:
-			tmp0 = b''
-			tmp0 += struct.pack('I', len(self.sound_ranges))
-			while len(tmp0) and tmp0[-1] == b'\x00'[0]:
-				tmp0 = tmp0[:-1]
-			s += struct.pack('B', len(tmp0))
-			s += tmp0
-			
-			for tmp1 in self.sound_ranges:
-				s += b'\x00' if tmp1 is None else b'\x01'
-				if tmp1 is not None:
-					s += struct.pack('b', tmp1.value)
-				s += b'\x00' if self.sound_ranges[tmp1] is None else b'\x01'
-				if self.sound_ranges[tmp1] is not None:
-					s += struct.pack('i', self.sound_ranges[tmp1])
+		if self.sound_ranges is None:
+			s.append(b'\x00')
+		else:
+			s.append(b'\x01')
+			_write_map_ESoundIntensity_int(s, self.sound_ranges)
 		
 		# serialize self.max_cycles
-		s += b'\x00' if self.max_cycles is None else b'\x01'
-		if self.max_cycles is not None:
-			s += struct.pack('i', self.max_cycles)
+		if self.max_cycles is None:
+			s.append(b'\x00')
+		else:
+			s.append(b'\x01')
+			s.append(_INT.pack(self.max_cycles))
 		
-		return s
+		return b''.join(s)
 	
 
 	def deserialize(self, s, offset=0):
-		# deserialize self.bomb_planting_time
-		tmp2 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp2:
-			self.bomb_planting_time = struct.unpack('i', s[offset:offset + 4])[0]
-			offset += 4
-		else:
-			self.bomb_planting_time = None
-		
-		# deserialize self.bomb_defusion_time
-		tmp3 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp3:
-			self.bomb_defusion_time = struct.unpack('i', s[offset:offset + 4])[0]
-			offset += 4
-		else:
-			self.bomb_defusion_time = None
-		
-		# deserialize self.bomb_explosion_time
-		tmp4 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp4:
-			self.bomb_explosion_time = struct.unpack('i', s[offset:offset + 4])[0]
-			offset += 4
-		else:
-			self.bomb_explosion_time = None
-		
-		# deserialize self.bomb_planting_score
-		tmp5 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp5:
-			self.bomb_planting_score = struct.unpack('i', s[offset:offset + 4])[0]
-			offset += 4
-		else:
-			self.bomb_planting_score = None
-		
-		# deserialize self.bomb_defusion_score
-		tmp6 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp6:
-			self.bomb_defusion_score = struct.unpack('i', s[offset:offset + 4])[0]
-			offset += 4
-		else:
-			self.bomb_defusion_score = None
-		
-		# deserialize self.bomb_explosion_score
-		tmp7 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp7:
-			self.bomb_explosion_score = struct.unpack('i', s[offset:offset + 4])[0]
-			offset += 4
-		else:
-			self.bomb_explosion_score = None
-		
-		# deserialize self.score_coefficient_small_bomb_site
-		tmp8 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp8:
-			self.score_coefficient_small_bomb_site = struct.unpack('f', s[offset:offset + 4])[0]
-			offset += 4
-		else:
-			self.score_coefficient_small_bomb_site = None
-		
-		# deserialize self.score_coefficient_medium_bomb_site
-		tmp9 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp9:
-			self.score_coefficient_medium_bomb_site = struct.unpack('f', s[offset:offset + 4])[0]
-			offset += 4
-		else:
-			self.score_coefficient_medium_bomb_site = None
-		
-		# deserialize self.score_coefficient_large_bomb_site
-		tmp10 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp10:
-			self.score_coefficient_large_bomb_site = struct.unpack('f', s[offset:offset + 4])[0]
-			offset += 4
+		# deserialize self.bomb_planting_time, self.bomb_defusion_time, self.bomb_explosion_time, self.bomb_planting_score, self.bomb_defusion_score, self.bomb_explosion_score, self.score_coefficient_small_bomb_site, self.score_coefficient_medium_bomb_site, self.score_coefficient_large_bomb_site, self.score_coefficient_vast_bomb_site, self.terrorist_vision_distance, self.terrorist_death_score, self.police_death_score, self.police_vision_distance
+		if s[offset] and s[offset + 5] and s[offset + 10] and s[offset + 15] and s[offset + 20] and s[offset + 25] and s[offset + 30] and s[offset + 35] and s[offset + 40] and s[offset + 45] and s[offset + 50] and s[offset + 55] and s[offset + 60] and s[offset + 65]:
+			_, self.bomb_planting_time, _, self.bomb_defusion_time, _, self.bomb_explosion_time, _, self.bomb_planting_score, _, self.bomb_defusion_score, _, self.bomb_explosion_score, _, self.score_coefficient_small_bomb_site, _, self.score_coefficient_medium_bomb_site, _, self.score_coefficient_large_bomb_site, _, self.score_coefficient_vast_bomb_site, _, self.terrorist_vision_distance, _, self.terrorist_death_score, _, self.police_death_score, _, self.police_vision_distance = _CONSTANTS_0.unpack_from(s, offset)
+			offset += 70
 		else:
-			self.score_coefficient_large_bomb_site = None
-		
-		# deserialize self.score_coefficient_vast_bomb_site
-		tmp11 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp11:
-			self.score_coefficient_vast_bomb_site = struct.unpack('f', s[offset:offset + 4])[0]
-			offset += 4
-		else:
-			self.score_coefficient_vast_bomb_site = None
-		
-		# deserialize self.terrorist_vision_distance
-		tmp12 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp12:
-			self.terrorist_vision_distance = struct.unpack('i', s[offset:offset + 4])[0]
-			offset += 4
-		else:
-			self.terrorist_vision_distance = None
-		
-		# deserialize self.terrorist_death_score
-		tmp13 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp13:
-			self.terrorist_death_score = struct.unpack('i', s[offset:offset + 4])[0]
-			offset += 4
-		else:
-			self.terrorist_death_score = None
-		
-		# deserialize self.police_death_score
-		tmp14 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp14:
-			self.police_death_score = struct.unpack('i', s[offset:offset + 4])[0]
-			offset += 4
-		else:
-			self.police_death_score = None
-		
-		# deserialize self.police_vision_distance
-		tmp15 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp15:
-			self.police_vision_distance = struct.unpack('i', s[offset:offset + 4])[0]
-			offset += 4
-		else:
-			self.police_vision_distance = None
-		
-		# deserialize self.sound_ranges
-		tmp16 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp16:
-			tmp17 = struct.unpack('B', s[offset:offset + 1])[0]
-			offset += 1
-			tmp18 = s[offset:offset + tmp17]
-			offset += tmp17
-			tmp18 += b'\x00' * (4 - tmp17)
-			tmp19 = struct.unpack('I', tmp18)[0]
-			
-			self.sound_ranges = {}
-			for tmp20 in range(tmp19):
-				tmp23 = struct.unpack('B', s[offset:offset + 1])[0]
+			if s[offset]:
+				self.bomb_planting_time = _INT.unpack_from(s, offset + 1)[0]
+				offset += 5
+			else:
+				self.bomb_planting_time = None
+				offset += 1
+			if s[offset]:
+				self.bomb_defusion_time = _INT.unpack_from(s, offset + 1)[0]
+				offset += 5
+			else:
+				self.bomb_defusion_time = None
 				offset += 1
-				if tmp23:
-					tmp24 = struct.unpack('b', s[offset:offset + 1])[0]
-					offset += 1
-					tmp21 = ESoundIntensity(tmp24)
-				else:
-					tmp21 = None
-				tmp25 = struct.unpack('B', s[offset:offset + 1])[0]
+			if s[offset]:
+				self.bomb_explosion_time = _INT.unpack_from(s, offset + 1)[0]
+				offset += 5
+			else:
+				self.bomb_explosion_time = None
 				offset += 1
-				if tmp25:
-					tmp22 = struct.unpack('i', s[offset:offset + 4])[0]
-					offset += 4
-				else:
-					tmp22 = None
-				self.sound_ranges[tmp21] = tmp22
+			if s[offset]:
+				self.bomb_planting_score = _INT.unpack_from(s, offset + 1)[0]
+				offset += 5
+			else:
+				self.bomb_planting_score = None
+				offset += 1
+			if s[offset]:
+				self.bomb_defusion_score = _INT.unpack_from(s, offset + 1)[0]
+				offset += 5
+			else:
+				self.bomb_defusion_score = None
+				offset += 1
+			if s[offset]:
+				self.bomb_explosion_score = _INT.unpack_from(s, offset + 1)[0]
+				offset += 5
+			else:
+				self.bomb_explosion_score = None
+				offset += 1
+			if s[offset]:
+				self.score_coefficient_small_bomb_site = _FLOAT.unpack_from(s, offset + 1)[0]
+				offset += 5
+			else:
+				self.score_coefficient_small_bomb_site = None
+				offset += 1
+			if s[offset]:
+				self.score_coefficient_medium_bomb_site = _FLOAT.unpack_from(s, offset + 1)[0]
+				offset += 5
+			else:
+				self.score_coefficient_medium_bomb_site = None
+				offset += 1
+			if s[offset]:
+				self.score_coefficient_large_bomb_site = _FLOAT.unpack_from(s, offset + 1)[0]
+				offset += 5
+			else:
+				self.score_coefficient_large_bomb_site = None
+				offset += 1
+			if s[offset]:
+				self.score_coefficient_vast_bomb_site = _FLOAT.unpack_from(s, offset + 1)[0]
+				offset += 5
+			else:
+				self.score_coefficient_vast_bomb_site = None
+				offset += 1
+			if s[offset]:
+				self.terrorist_vision_distance = _INT.unpack_from(s, offset + 1)[0]
+				offset += 5
+			else:
+				self.terrorist_vision_distance = None
+				offset += 1
+			if s[offset]:
+				self.terrorist_death_score = _INT.unpack_from(s, offset + 1)[0]
+				offset += 5
+			else:
+				self.terrorist_death_score = None
+				offset += 1
+			if s[offset]:
+				self.police_death_score = _INT.unpack_from(s, offset + 1)[0]
+				offset += 5
+			else:
+				self.police_death_score = None
+				offset += 1
+			if s[offset]:
+				self.police_vision_distance = _INT.unpack_from(s, offset + 1)[0]
+				offset += 5
+			else:
+				self.police_vision_distance = None
+				offset += 1
+		
+		# deserialize self.sound_ranges
+		if s[offset]:
+			self.sound_ranges, offset = self._read_sound_ranges(s, offset + 1)
 		else:
 			self.sound_ranges = None
+			offset += 1
 		
 		# deserialize self.max_cycles
-		tmp26 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp26:
-			self.max_cycles = struct.unpack('i', s[offset:offset + 4])[0]
-			offset += 4
+		if s[offset]:
+			self.max_cycles = _INT.unpack_from(s, offset + 1)[0]
+			offset += 5
 		else:
 			self.max_cycles = None
+			offset += 1
 		
 		return offset
+	
 
 
 class Position(object):
 
+	__slots__ = ['x', 'y']
+
 	@staticmethod
 	def name():
 		return 'Position'
@@ -345,45 +537,53 @@ class Position(object):
 	
 
 	def serialize(self):
-		s = b''
-		
-		# serialize self.x
-		s += b'\x00' if self.x is None else b'\x01'
-		if self.x is not None:
-			s += struct.pack('i', self.x)
-		
-		# serialize self.y
-		s += b'\x00' if self.y is None else b'\x01'
-		if self.y is not None:
-			s += struct.pack('i', self.y)
+		s = []
 		
-		return s
+		# serialize self.x, self.y
+		if self.x is not None and self.y is not None:
+			s.append(_POSITION_0.pack(1, self.x, 1, self.y))
+		else:
+			if self.x is None:
+				s.append(b'\x00')
+			else:
+				s.append(b'\x01')
+				s.append(_INT.pack(self.x))
+			if self.y is None:
+				s.append(b'\x00')
+			else:
+				s.append(b'\x01')
+				s.append(_INT.pack(self.y))
+		
+		return b''.join(s)
 	
 
 	def deserialize(self, s, offset=0):
-		# deserialize self.x
-		tmp27 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp27:
-			self.x = struct.unpack('i', s[offset:offset + 4])[0]
-			offset += 4
-		else:
-			self.x = None
-		
-		# deserialize self.y
-		tmp28 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp28:
-			self.y = struct.unpack('i', s[offset:offset + 4])[0]
-			offset += 4
+		# deserialize self.x, self.y
+		if s[offset] and s[offset + 5]:
+			_, self.x, _, self.y = _POSITION_0.unpack_from(s, offset)
+			offset += 10
 		else:
-			self.y = None
+			if s[offset]:
+				self.x = _INT.unpack_from(s, offset + 1)[0]
+				offset += 5
+			else:
+				self.x = None
+				offset += 1
+			if s[offset]:
+				self.y = _INT.unpack_from(s, offset + 1)[0]
+				offset += 5
+			else:
+				self.y = None
+				offset += 1
 		
 		return offset
+	
 
 
 class Bomb(object):
 
+	__slots__ = ['position', 'explosion_remaining_time', 'planter_id', 'defuser_id']
+
 	@staticmethod
 	def name():
 		return 'Bomb'
@@ -401,73 +601,78 @@ class Bomb(object):
 	
 
 	def serialize(self):
-		s = b''
-		
-		# serialize self.position
-		s += b'\x00' if self.position is None else b'\x01'
-		if self.position is not None:
-			s += self.position.serialize()
-		
-		# serialize self.explosion_remaining_time
-		s += b'\x00' if self.explosion_remaining_time is None else b'\x01'
-		if self.explosion_remaining_time is not None:
-			s += struct.pack('i', self.explosion_remaining_time)
-		
-		# serialize self.planter_id
-		s += b'\x00' if self.planter_id is None else b'\x01'
-		if self.planter_id is not None:
-			s += struct.pack('i', self.planter_id)
+		s = []
 		
-		# serialize self.defuser_id
-		s += b'\x00' if self.defuser_id is None else b'\x01'
-		if self.defuser_id is not None:
-			s += struct.pack('i', self.defuser_id)
-		
-		return s
+		# serialize self.position, self.explosion_remaining_time, self.planter_id, self.defuser_id
+		if self.position is not None and self.position.x is not None and self.position.y is not None and self.explosion_remaining_time is not None and self.planter_id is not None and self.defuser_id is not None:
+			s.append(_BOMB_0.pack(1, 1, self.position.x, 1, self.position.y, 1, self.explosion_remaining_time, 1, self.planter_id, 1, self.defuser_id))
+		else:
+			if self.position is None:
+				s.append(b'\x00')
+			else:
+				s.append(b'\x01')
+				s.append(self.position.serialize())
+			if self.explosion_remaining_time is None:
+				s.append(b'\x00')
+			else:
+				s.append(b'\x01')
+				s.append(_INT.pack(self.explosion_remaining_time))
+			if self.planter_id is None:
+				s.append(b'\x00')
+			else:
+				s.append(b'\x01')
+				s.append(_INT.pack(self.planter_id))
+			if self.defuser_id is None:
+				s.append(b'\x00')
+			else:
+				s.append(b'\x01')
+				s.append(_INT.pack(self.defuser_id))
+		
+		return b''.join(s)
 	
 
 	def deserialize(self, s, offset=0):
-		# deserialize self.position
-		tmp29 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp29:
-			self.position = Position()
-			offset = self.position.deserialize(s, offset)
-		else:
-			self.position = None
-		
-		# deserialize self.explosion_remaining_time
-		tmp30 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp30:
-			self.explosion_remaining_time = struct.unpack('i', s[offset:offset + 4])[0]
-			offset += 4
-		else:
-			self.explosion_remaining_time = None
-		
-		# deserialize self.planter_id
-		tmp31 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp31:
-			self.planter_id = struct.unpack('i', s[offset:offset + 4])[0]
-			offset += 4
-		else:
-			self.planter_id = None
-		
-		# deserialize self.defuser_id
-		tmp32 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp32:
-			self.defuser_id = struct.unpack('i', s[offset:offset + 4])[0]
-			offset += 4
+		# deserialize self.position, self.explosion_remaining_time, self.planter_id, self.defuser_id
+		if s[offset] and s[offset + 1] and s[offset + 6] and s[offset + 11] and s[offset + 16] and s[offset + 21]:
+			_, _, tmp0, _, tmp1, _, self.explosion_remaining_time, _, self.planter_id, _, self.defuser_id = _BOMB_0.unpack_from(s, offset)
+			self.position = Position(tmp0, tmp1)
+			offset += 26
 		else:
-			self.defuser_id = None
+			if s[offset]:
+				self.position = Position()
+				offset = self.position.deserialize(s, offset + 1)
+			else:
+				self.position = None
+				offset += 1
+			if s[offset]:
+				self.explosion_remaining_time = _INT.unpack_from(s, offset + 1)[0]
+				offset += 5
+			else:
+				self.explosion_remaining_time = None
+				offset += 1
+			if s[offset]:
+				self.planter_id = _INT.unpack_from(s, offset + 1)[0]
+				offset += 5
+			else:
+				self.planter_id = None
+				offset += 1
+			if s[offset]:
+				self.defuser_id = _INT.unpack_from(s, offset + 1)[0]
+				offset += 5
+			else:
+				self.defuser_id = None
+				offset += 1
 		
 		return offset
+	
 
 
 class Terrorist(object):
 
+	__slots__ = ['id', 'position', 'planting_remaining_time', 'footstep_sounds', 'status']
+
+	_read_footstep_sounds = staticmethod(_read_list_ESoundIntensity)
+
 	@staticmethod
 	def name():
 		return 'Terrorist'
@@ -486,114 +691,93 @@ class Terrorist(object):
 	
 
 	def serialize(self):
-		s = b''
+		s = []
 		
-		# serialize self.id
-		s += b'\x00' if self.id is None else b'\x01'
-		if self.id is not None:
-			s += struct.pack('i', self.id)
-		
-		# serialize self.position
-		s += b'\x00' if self.position is None else b'\x01'
-		if self.position is not None:
-			s += self.position.serialize()
-		
-		# serialize self.planting_remaining_time
-		s += b'\x00' if self.planting_remaining_time is None else b'\x01'
-		if self.planting_remaining_time is not None:
-			s += struct.pack('i', self.planting_remaining_time)
+		# serialize self.id, self.position, self.planting_remaining_time
+		if self.id is not None and self.position is not None and self.position.x is not None and self.position.y is not None and self.planting_remaining_time is not None:
+			s.append(_TERRORIST_0.pack(1, self.id, 1, 1, self.position.x, 1, self.position.y, 1, self.planting_remaining_time))
+		else:
+			if self.id is None:
+				s.append(b'\x00')
+			else:
+				s.append(b'\x01')
+				s.append(_INT.pack(self.id))
+			if self.position is None:
+				s.append(b'\x00')
+			else:
+				s.append(b'\x01')
+				s.append(self.position.serialize())
+			if self.planting_remaining_time is None:
+				s.append(b'\x00')
+			else:
+				s.append(b'\x01')
+				s.append(_INT.pack(self.planting_remaining_time))
 		
 		# serialize self.footstep_sounds
-		s += b'\x00' if self.footstep_sounds is None else b'\x01'
-		if self.footstep_sounds is not None:
-			tmp33 = b''
-			tmp33 += struct.pack('I', len(self.footstep_sounds))
-			while len(tmp33) and tmp33[-1] == b'\x00'[0]:
-				tmp33 = tmp33[:-1]
-			s += struct.pack('B', len(tmp33))
-			s += tmp33
-			
-			for tmp34 in self.footstep_sounds:
-				s += b'\x00' if tmp34 is None else b'\x01'
-				if tmp34 is not None:
-					s += struct.pack('b', tmp34.value)
+		if self.footstep_sounds is None:
+			s.append(b'\x00')
+		else:
+			s.append(b'\x01')
+			_write_list_ESoundIntensity(s, self.footstep_sounds)
 		
 		# serialize self.status
-		s += b'\x00' if self.status is None else b'\x01'
-		if self.status is not None:
-			s += struct.pack('b', self.status.value)
+		s.append(_E_AGENT_STATUS_ITEMS[self.status])
 		
-		return s
+		return b''.join(s)
 	
 
 	def deserialize(self, s, offset=0):
-		# deserialize self.id
-		tmp35 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp35:
-			self.id = struct.unpack('i', s[offset:offset + 4])[0]
-			offset += 4
-		else:
-			self.id = None
-		
-		# deserialize self.position
-		tmp36 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp36:
-			self.position = Position()
-			offset = self.position.deserialize(s, offset)
-		else:
-			self.position = None
-		
-		# deserialize self.planting_remaining_time
-		tmp37 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp37:
-			self.planting_remaining_time = struct.unpack('i', s[offset:offset + 4])[0]
-			offset += 4
+		# deserialize self.id, self.position, self.planting_remaining_time
+		if s[offset] and s[offset + 5] and s[offset + 6] and s[offset + 11] and s[offset + 16]:
+			_, self.id, _, _, tmp0, _, tmp1, _, self.planting_remaining_time = _TERRORIST_0.unpack_from(s, offset)
+			self.position = Position(tmp0, tmp1)
+			offset += 21
 		else:
-			self.planting_remaining_time = None
+			if s[offset]:
+				self.id = _INT.unpack_from(s, offset + 1)[0]
+				offset += 5
+			else:
+				self.id = None
+				offset += 1
+			if s[offset]:
+				self.position = Position()
+				offset = self.position.deserialize(s, offset + 1)
+			else:
+				self.position = None
+				offset += 1
+			if s[offset]:
+				self.planting_remaining_time = _INT.unpack_from(s, offset + 1)[0]
+				offset += 5
+			else:
+				self.planting_remaining_time = None
+				offset += 1
 		
 		# deserialize self.footstep_sounds
-		tmp38 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp38:
-			tmp39 = struct.unpack('B', s[offset:offset + 1])[0]
-			offset += 1
-			tmp40 = s[offset:offset + tmp39]
-			offset += tmp39
-			tmp40 += b'\x00' * (4 - tmp39)
-			tmp41 = struct.unpack('I', tmp40)[0]
-			
-			self.footstep_sounds = []
-			for tmp42 in range(tmp41):
-				tmp44 = struct.unpack('B', s[offset:offset + 1])[0]
-				offset += 1
-				if tmp44:
-					tmp45 = struct.unpack('b', s[offset:offset + 1])[0]
-					offset += 1
-					tmp43 = ESoundIntensity(tmp45)
-				else:
-					tmp43 = None
-				self.footstep_sounds.append(tmp43)
+		if s[offset]:
+			self.footstep_sounds, offset = self._read_footstep_sounds(s, offset + 1)
 		else:
 			self.footstep_sounds = None
+			offset += 1
 		
 		# deserialize self.status
-		tmp46 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp46:
-			tmp47 = struct.unpack('b', s[offset:offset + 1])[0]
-			offset += 1
-			self.status = EAgentStatus(tmp47)
+		if s[offset]:
+			self.status = _E_AGENT_STATUS[s[offset + 1]]
+			offset += 2
 		else:
 			self.status = None
+			offset += 1
 		
 		return offset
+	
 
 
 class Police(object):
 
+	__slots__ = ['id', 'position', 'defusion_remaining_time', 'footstep_sounds', 'bomb_sounds', 'status']
+
+	_read_footstep_sounds = staticmethod(_read_list_ESoundIntensity)
+	_read_bomb_sounds = staticmethod(_read_list_ESoundIntensity)
+
 	@staticmethod
 	def name():
 		return 'Police'
@@ -613,154 +797,110 @@ class Police(object):
 	
 
 	def serialize(self):
-		s = b''
-		
-		# serialize self.id
-		s += b'\x00' if self.id is None else b'\x01'
-		if self.id is not None:
-			s += struct.pack('i', self.id)
+		s = []
 		
-		# serialize self.position
-		s += b'\x00' if self.position is None else b'\x01'
-		if self.position is not None:
-			s += self.position.serialize()
-		
-		# serialize self.defusion_remaining_time
-		s += b'\x00' if self.defusion_remaining_time is None else b'\x01'
-		if self.defusion_remaining_time is not None:
-			s += struct.pack('i', self.defusion_remaining_time)
+		# serialize self.id, self.position, self.defusion_remaining_time
+		if self.id is not None and self.position is not None and self.position.x is not None and self.position.y is not None and self.defusion_remaining_time is not None:
+			s.append(_POLICE_0.pack(1, self.id, 1, 1, self.position.x, 1, self.position.y, 1, self.defusion_remaining_time))
+		else:
+			if self.id is None:
+				s.append(b'\x00')
+			else:
+				s.append(b'\x01')
+				s.append(_INT.pack(self.id))
+			if self.position is None:
+				s.append(b'\x00')
+			else:
+				s.append(b'\x01')
+				s.append(self.position.serialize())
+			if self.defusion_remaining_time is None:
+				s.append(b'\x00')
+			else:
+				s.append(b'\x01')
+				s.append(_INT.pack(self.defusion_remaining_time))
 		
 		# serialize self.footstep_sounds
-		s += b'\x00' if self.footstep_sounds is None else b'\x01'
-		if self.footstep_sounds is not None:
-			tmp48 = b''
-			tmp48 += struct.pack('I', len(self.footstep_sounds))
-			while len(tmp48) and tmp48[-1] == b'\x00'[0]:
-				tmp48 = tmp48[:-1]
-			s += struct.pack('B', len(tmp48))
-			s += tmp48
-			
-			for tmp49 in self.footstep_sounds:
-				s += b'\x00' if tmp49 is None else b'\x01'
-				if tmp49 is not None:
-					s += struct.pack('b', tmp49.value)
+		if self.footstep_sounds is None:
+			s.append(b'\x00')
+		else:
+			s.append(b'\x01')
+			_write_list_ESoundIntensity(s, self.footstep_sounds)
 		
 		# serialize self.bomb_sounds
-		s += b'\x00' if self.bomb_sounds is None else b'\x01'
-		if self.bomb_sounds is not None:
-			tmp50 = b''
-			tmp50 += struct.pack('I', len(self.bomb_sounds))
-			while len(tmp50) and tmp50[-1] == b'\x00'[0]:
-				tmp50 = tmp50[:-1]
-			s += struct.pack('B', len(tmp50))
-			s += tmp50
-			
-			for tmp51 in self.bomb_sounds:
-				s += b'\x00' if tmp51 is None else b'\x01'
-				if tmp51 is not None:
-					s += struct.pack('b', tmp51.value)
+		if self.bomb_sounds is None:
+			s.append(b'\x00')
+		else:
+			s.append(b'\x01')
+			_write_list_ESoundIntensity(s, self.bomb_sounds)
 		
 		# serialize self.status
-		s += b'\x00' if self.status is None else b'\x01'
-		if self.status is not None:
-			s += struct.pack('b', self.status.value)
+		s.append(_E_AGENT_STATUS_ITEMS[self.status])
 		
-		return s
+		return b''.join(s)
 	
 
 	def deserialize(self, s, offset=0):
-		# deserialize self.id
-		tmp52 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp52:
-			self.id = struct.unpack('i', s[offset:offset + 4])[0]
-			offset += 4
-		else:
-			self.id = None
-		
-		# deserialize self.position
-		tmp53 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp53:
-			self.position = Position()
-			offset = self.position.deserialize(s, offset)
+		# deserialize self.id, self.position, self.defusion_remaining_time
+		if s[offset] and s[offset + 5] and s[offset + 6] and s[offset + 11] and s[offset + 16]:
+			_, self.id, _, _, tmp0, _, tmp1, _, self.defusion_remaining_time = _POLICE_0.unpack_from(s, offset)
+			self.position = Position(tmp0, tmp1)
+			offset += 21
 		else:
-			self.position = None
-		
-		# deserialize self.defusion_remaining_time
-		tmp54 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp54:
-			self.defusion_remaining_time = struct.unpack('i', s[offset:offset + 4])[0]
-			offset += 4
-		else:
-			self.defusion_remaining_time = None
+			if s[offset]:
+				self.id = _INT.unpack_from(s, offset + 1)[0]
+				offset += 5
+			else:
+				self.id = None
+				offset += 1
+			if s[offset]:
+				self.position = Position()
+				offset = self.position.deserialize(s, offset + 1)
+			else:
+				self.position = None
+				offset += 1
+			if s[offset]:
+				self.defusion_remaining_time = _INT.unpack_from(s, offset + 1)[0]
+				offset += 5
+			else:
+				self.defusion_remaining_time = None
+				offset += 1
 		
 		# deserialize self.footstep_sounds
-		tmp55 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp55:
-			tmp56 = struct.unpack('B', s[offset:offset + 1])[0]
-			offset += 1
-			tmp57 = s[offset:offset + tmp56]
-			offset += tmp56
-			tmp57 += b'\x00' * (4 - tmp56)
-			tmp58 = struct.unpack('I', tmp57)[0]
-			
-			self.footstep_sounds = []
-			for tmp59 in range(tmp58):
-				tmp61 = struct.unpack('B', s[offset:offset + 1])[0]
-				offset += 1
-				if tmp61:
-					tmp62 = struct.unpack('b', s[offset:offset + 1])[0]
-					offset += 1
-					tmp60 = ESoundIntensity(tmp62)
-				else:
-					tmp60 = None
-				self.footstep_sounds.append(tmp60)
+		if s[offset]:
+			self.footstep_sounds, offset = self._read_footstep_sounds(s, offset + 1)
 		else:
 			self.footstep_sounds = None
+			offset += 1
 		
 		# deserialize self.bomb_sounds
-		tmp63 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp63:
-			tmp64 = struct.unpack('B', s[offset:offset + 1])[0]
-			offset += 1
-			tmp65 = s[offset:offset + tmp64]
-			offset += tmp64
-			tmp65 += b'\x00' * (4 - tmp64)
-			tmp66 = struct.unpack('I', tmp65)[0]
-			
-			self.bomb_sounds = []
-			for tmp67 in range(tmp66):
-				tmp69 = struct.unpack('B', s[offset:offset + 1])[0]
-				offset += 1
-				if tmp69:
-					tmp70 = struct.unpack('b', s[offset:offset + 1])[0]
-					offset += 1
-					tmp68 = ESoundIntensity(tmp70)
-				else:
-					tmp68 = None
-				self.bomb_sounds.append(tmp68)
+		if s[offset]:
+			self.bomb_sounds, offset = self._read_bomb_sounds(s, offset + 1)
 		else:
 			self.bomb_sounds = None
+			offset += 1
 		
 		# deserialize self.status
-		tmp71 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp71:
-			tmp72 = struct.unpack('b', s[offset:offset + 1])[0]
-			offset += 1
-			self.status = EAgentStatus(tmp72)
+		if s[offset]:
+			self.status = _E_AGENT_STATUS[s[offset + 1]]
+			offset += 2
 		else:
 			self.status = None
+			offset += 1
 		
 		return offset
+	
 
 
 class World(object):
 
+	__slots__ = ['width', 'height', 'board', 'scores', 'bombs', 'terrorists', 'polices', 'constants']
+
+	_read_board = staticmethod(_read_list_list_ECell)
+	_read_scores = staticmethod(_read_map_string_float)
+	_read_bombs = staticmethod(_read_list_Bomb)
+	_read_terrorists = staticmethod(_read_list_Terrorist)
+	_read_polices = staticmethod(_read_list_Police)
+
 	@staticmethod
 	def name():
 		return 'World'
@@ -782,297 +922,129 @@ class World(object):
 	
 
 	def serialize(self):
-		s = b''
-		
-		# serialize self.width
-		s += b'\x00' if self.width is None else b'\x01'
-		if self.width is not None:
-			s += struct.pack('i', self.width)
+		s = []
 		
-		# serialize self.height
-		s += b'\x00' if self.height is None else b'\x01'
-		if self.height is not None:
-			s += struct.pack('i', self.height)
+		# serialize self.width, self.height
+		if self.width is not None and self.height is not None:
+			s.append(_WORLD_0.pack(1, self.width, 1, self.height))
+		else:
+			if self.width is None:
+				s.append(b'\x00')
+			else:
+				s.append(b'\x01')
+				s.append(_INT.pack(self.width))
+			if self.height is None:
+				s.append(b'\x00')
+			else:
+				s.append(b'\x01')
+				s.append(_INT.pack(self.height))
 		
 		# serialize self.board
-		s += b'\x00' if self.board is None else b'\x01'
-		if self.board is not None:
-			tmp73 = b''
-			tmp73 += struct.pack('I', len(self.board))
-			while len(tmp73) and tmp73[-1] == b'\x00'[0]:
-				tmp73 = tmp73[:-1]
-			s += struct.pack('B', len(tmp73))
-			s += tmp73
-			
-			for tmp74 in self.board:
-				s += b'\x00' if tmp74 is None else b'\x01'
-				if tmp74 is not None:
-					tmp75 = b''
-					tmp75 += struct.pack('I', len(tmp74))
-					while len(tmp75) and tmp75[-1] == b'\x00'[0]:
-						tmp75 = tmp75[:-1]
-					s += struct.pack('B', len(tmp75))
-					s += tmp75
-					
-					for tmp76 in tmp74:
-						s += b'\x00' if tmp76 is None else b'\x01'
-						if tmp76 is not None:
-							s += struct.pack('b', tmp76.value)
+		if self.board is None:
+			s.append(b'\x00')
+		else:
+			s.append(b'\x01')
+			_write_list_list_ECell(s, self.board)
 		
 		# serialize self.scores
-		s += b'\x00' if self.scores is None else b'\x01'
-		if self.scores is not None:
-			tmp77 = b''
-			tmp77 += struct.pack('I', len(self.scores))
-			while len(tmp77) and tmp77[-1] == b'\x00'[0]:
-				tmp77 = tmp77[:-1]
-			s += struct.pack('B', len(tmp77))
-			s += tmp77
-			
-			for tmp78 in self.scores:
-				s += b'\x00' if tmp78 is None else b'\x01'
-				if tmp78 is not None:
-					tmp79 = b''
-					tmp79 += struct.pack('I', len(tmp78))
-					while len(tmp79) and tmp79[-1] == b'\x00'[0]:
-						tmp79 = tmp79[:-1]
-					s += struct.pack('B', len(tmp79))
-					s += tmp79
-					
-					s += tmp78.encode('ISO-8859-1') if PY3 else tmp78
-				s += b'\x00' if self.scores[tmp78] is None else b'\x01'
-				if self.scores[tmp78] is not None:
-					s += struct.pack('f', self.scores[tmp78])
+		if self.scores is None:
+			s.append(b'\x00')
+		else:
+			s.append(b'\x01')
+			_write_map_string_float(s, self.scores)
 		
 		# serialize self.bombs
-		s += b'\x00' if self.bombs is None else b'\x01'
-		if self.bombs is not None:
-			tmp80 = b''
-			tmp80 += struct.pack('I', len(self.bombs))
-			while len(tmp80) and tmp80[-1] == b'\x00'[0]:
-				tmp80 = tmp80[:-1]
-			s += struct.pack('B', len(tmp80))
-			s += tmp80
-			
-			for tmp81 in self.bombs:
-				s += b'\x00' if tmp81 is None else b'\x01'
-				if tmp81 is not None:
-					s += tmp81.serialize()
+		if self.bombs is None:
+			s.append(b'\x00')
+		else:
+			s.append(b'\x01')
+			_write_list_Bomb(s, self.bombs)
 		
 		# serialize self.terrorists
-		s += b'\x00' if self.terrorists is None else b'\x01'
-		if self.terrorists is not None:
-			tmp82 = b''
-			tmp82 += struct.pack('I', len(self.terrorists))
-			while len(tmp82) and tmp82[-1] == b'\x00'[0]:
-				tmp82 = tmp82[:-1]
-			s += struct.pack('B', len(tmp82))
-			s += tmp82
-			
-			for tmp83 in self.terrorists:
-				s += b'\x00' if tmp83 is None else b'\x01'
-				if tmp83 is not None:
-					s += tmp83.serialize()
+		if self.terrorists is None:
+			s.append(b'\x00')
+		else:
+			s.append(b'\x01')
+			_write_list_Terrorist(s, self.terrorists)
 		
 		# serialize self.polices
-		s += b'\x00' if self.polices is None else b'\x01'
-		if self.polices is not None:
-			tmp84 = b''
-			tmp84 += struct.pack('I', len(self.polices))
-			while len(tmp84) and tmp84[-1] == b'\x00'[0]:
-				tmp84 = tmp84[:-1]
-			s += struct.pack('B', len(tmp84))
-			s += tmp84
-			
-			for tmp85 in self.polices:
-				s += b'\x00' if tmp85 is None else b'\x01'
-				if tmp85 is not None:
-					s += tmp85.serialize()
+		if self.polices is None:
+			s.append(b'\x00')
+		else:
+			s.append(b'\x01')
+			_write_list_Police(s, self.polices)
 		
 		# serialize self.constants
-		s += b'\x00' if self.constants is None else b'\x01'
-		if self.constants is not None:
-			s += self.constants.serialize()
+		if self.constants is None:
+			s.append(b'\x00')
+		else:
+			s.append(b'\x01')
+			s.append(self.constants.serialize())
 		
-		return s
+		return b''.join(s)
 	
 
 	def deserialize(self, s, offset=0):
-		# deserialize self.width
-		tmp86 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp86:
-			self.width = struct.unpack('i', s[offset:offset + 4])[0]
-			offset += 4
+		# deserialize self.width, self.height
+		if s[offset] and s[offset + 5]:
+			_, self.width, _, self.height = _WORLD_0.unpack_from(s, offset)
+			offset += 10
 		else:
-			self.width = None
-		
-		# deserialize self.height
-		tmp87 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp87:
-			self.height = struct.unpack('i', s[offset:offset + 4])[0]
-			offset += 4
-		else:
-			self.height = None
+			if s[offset]:
+				self.width = _INT.unpack_from(s, offset + 1)[0]
+				offset += 5
+			else:
+				self.width = None
+				offset += 1
+			if s[offset]:
+				self.height = _INT.unpack_from(s, offset + 1)[0]
+				offset += 5
+			else:
+				self.height = None
+				offset += 1
 		
 		# deserialize self.board
-		tmp88 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp88:
-			tmp89 = struct.unpack('B', s[offset:offset + 1])[0]
-			offset += 1
-			tmp90 = s[offset:offset + tmp89]
-			offset += tmp89
-			tmp90 += b'\x00' * (4 - tmp89)
-			tmp91 = struct.unpack('I', tmp90)[0]
-			
-			self.board = []
-			for tmp92 in range(tmp91):
-				tmp94 = struct.unpack('B', s[offset:offset + 1])[0]
-				offset += 1
-				if tmp94:
-					tmp95 = struct.unpack('B', s[offset:offset + 1])[0]
-					offset += 1
-					tmp96 = s[offset:offset + tmp95]
-					offset += tmp95
-					tmp96 += b'\x00' * (4 - tmp95)
-					tmp97 = struct.unpack('I', tmp96)[0]
-					
-					tmp93 = []
-					for tmp98 in range(tmp97):
-						tmp100 = struct.unpack('B', s[offset:offset + 1])[0]
-						offset += 1
-						if tmp100:
-							tmp101 = struct.unpack('b', s[offset:offset + 1])[0]
-							offset += 1
-							tmp99 = ECell(tmp101)
-						else:
-							tmp99 = None
-						tmp93.append(tmp99)
-				else:
-					tmp93 = None
-				self.board.append(tmp93)
+		if s[offset]:
+			self.board, offset = self._read_board(s, offset + 1)
 		else:
 			self.board = None
+			offset += 1
 		
 		# deserialize self.scores
-		tmp102 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp102:
-			tmp103 = struct.unpack('B', s[offset:offset + 1])[0]
-			offset += 1
-			tmp104 = s[offset:offset + tmp103]
-			offset += tmp103
-			tmp104 += b'\x00' * (4 - tmp103)
-			tmp105 = struct.unpack('I', tmp104)[0]
-			
-			self.scores = {}
-			for tmp106 in range(tmp105):
-				tmp109 = struct.unpack('B', s[offset:offset + 1])[0]
-				offset += 1
-				if tmp109:
-					tmp110 = struct.unpack('B', s[offset:offset + 1])[0]
-					offset += 1
-					tmp111 = s[offset:offset + tmp110]
-					offset += tmp110
-					tmp111 += b'\x00' * (4 - tmp110)
-					tmp112 = struct.unpack('I', tmp111)[0]
-					
-					tmp107 = s[offset:offset + tmp112].decode('ISO-8859-1') if PY3 else s[offset:offset + tmp112]
-					offset += tmp112
-				else:
-					tmp107 = None
-				tmp113 = struct.unpack('B', s[offset:offset + 1])[0]
-				offset += 1
-				if tmp113:
-					tmp108 = struct.unpack('f', s[offset:offset + 4])[0]
-					offset += 4
-				else:
-					tmp108 = None
-				self.scores[tmp107] = tmp108
+		if s[offset]:
+			self.scores, offset = self._read_scores(s, offset + 1)
 		else:
 			self.scores = None
+			offset += 1
 		
 		# deserialize self.bombs
-		tmp114 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp114:
-			tmp115 = struct.unpack('B', s[offset:offset + 1])[0]
-			offset += 1
-			tmp116 = s[offset:offset + tmp115]
-			offset += tmp115
-			tmp116 += b'\x00' * (4 - tmp115)
-			tmp117 = struct.unpack('I', tmp116)[0]
-			
-			self.bombs = []
-			for tmp118 in range(tmp117):
-				tmp120 = struct.unpack('B', s[offset:offset + 1])[0]
-				offset += 1
-				if tmp120:
-					tmp119 = Bomb()
-					offset = tmp119.deserialize(s, offset)
-				else:
-					tmp119 = None
-				self.bombs.append(tmp119)
+		if s[offset]:
+			self.bombs, offset = self._read_bombs(s, offset + 1)
 		else:
 			self.bombs = None
+			offset += 1
 		
 		# deserialize self.terrorists
-		tmp121 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp121:
-			tmp122 = struct.unpack('B', s[offset:offset + 1])[0]
-			offset += 1
-			tmp123 = s[offset:offset + tmp122]
-			offset += tmp122
-			tmp123 += b'\x00' * (4 - tmp122)
-			tmp124 = struct.unpack('I', tmp123)[0]
-			
-			self.terrorists = []
-			for tmp125 in range(tmp124):
-				tmp127 = struct.unpack('B', s[offset:offset + 1])[0]
-				offset += 1
-				if tmp127:
-					tmp126 = Terrorist()
-					offset = tmp126.deserialize(s, offset)
-				else:
-					tmp126 = None
-				self.terrorists.append(tmp126)
+		if s[offset]:
+			self.terrorists, offset = self._read_terrorists(s, offset + 1)
 		else:
 			self.terrorists = None
+			offset += 1
 		
 		# deserialize self.polices
-		tmp128 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp128:
-			tmp129 = struct.unpack('B', s[offset:offset + 1])[0]
-			offset += 1
-			tmp130 = s[offset:offset + tmp129]
-			offset += tmp129
-			tmp130 += b'\x00' * (4 - tmp129)
-			tmp131 = struct.unpack('I', tmp130)[0]
-			
-			self.polices = []
-			for tmp132 in range(tmp131):
-				tmp134 = struct.unpack('B', s[offset:offset + 1])[0]
-				offset += 1
-				if tmp134:
-					tmp133 = Police()
-					offset = tmp133.deserialize(s, offset)
-				else:
-					tmp133 = None
-				self.polices.append(tmp133)
+		if s[offset]:
+			self.polices, offset = self._read_polices(s, offset + 1)
 		else:
 			self.polices = None
+			offset += 1
 		
 		# deserialize self.constants
-		tmp135 = struct.unpack('B', s[offset:offset + 1])[0]
-		offset += 1
-		if tmp135:
+		if s[offset]:
 			self.constants = Constants()
-			offset = self.constants.deserialize(s, offset)
+			offset = self.constants.deserialize(s, offset + 1)
 		else:
 			self.constants = None
+			offset += 1
 		
 		return offset
+	
@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+# Generated by ksgen.py from replay.ks, edit the schema and regenerate this file instead.
+
+# python imports
+import sys
+import struct
+from enum import Enum
+
+
+_UINT = struct.Struct('=I')
+_FLOAT = struct.Struct('=f')
+
+
+_BIG_ENDIAN = sys.byteorder == 'big'
+
+
+def _read_length(s, offset):
+	# Lengths are native unsigned ints without their trailing zero bytes, prefixed by their byte count.
+	n = s[offset]
+	value = int.from_bytes(s[offset + 1:offset + 1 + n], sys.byteorder)
+	return (value << 8 * (4 - n) if _BIG_ENDIAN else value), offset + 1 + n
+
+
+def _write_length(n):
+	tmp = _UINT.pack(n).rstrip(b'\x00')
+	return bytes((len(tmp),)) + tmp
+
+
+def _read_map_string_list_string(s, offset):
+	n, offset = _read_length(s, offset)
+	items = {}
+	for _ in range(n):
+		if s[offset]:
+			tmp0, offset = _read_length(s, offset + 1)
+			key = str(s[offset:offset + tmp0], 'ISO-8859-1')
+			offset += tmp0
+		else:
+			key = None
+			offset += 1
+		if s[offset]:
+			value, offset = _read_list_string(s, offset + 1)
+		else:
+			value = None
+			offset += 1
+		items[key] = value
+	return items, offset
+
+
+def _write_map_string_list_string(s, items):
+	s.append(_write_length(len(items)))
+	for key, value in items.items():
+		if key is None:
+			s.append(b'\x00')
+		else:
+			s.append(b'\x01')
+			s.append(_write_length(len(key)))
+			s.append(key.encode('ISO-8859-1'))
+		if value is None:
+			s.append(b'\x00')
+		else:
+			s.append(b'\x01')
+			_write_list_string(s, value)
+
+
+def _read_map_string_string(s, offset):
+	n, offset = _read_length(s, offset)
+	items = {}
+	for _ in range(n):
+		if s[offset]:
+			tmp0, offset = _read_length(s, offset + 1)
+			key = str(s[offset:offset + tmp0], 'ISO-8859-1')
+			offset += tmp0
+		else:
+			key = None
+			offset += 1
+		if s[offset]:
+			tmp1, offset = _read_length(s, offset + 1)
+			value = str(s[offset:offset + tmp1], 'ISO-8859-1')
+			offset += tmp1
+		else:
+			value = None
+			offset += 1
+		items[key] = value
+	return items, offset
+
+
+def _write_map_string_string(s, items):
+	s.append(_write_length(len(items)))
+	for key, value in items.items():
+		if key is None:
+			s.append(b'\x00')
+		else:
+			s.append(b'\x01')
+			s.append(_write_length(len(key)))
+			s.append(key.encode('ISO-8859-1'))
+		if value is None:
+			s.append(b'\x00')
+		else:
+			s.append(b'\x01')
+			s.append(_write_length(len(value)))
+			s.append(value.encode('ISO-8859-1'))
+
+
+def _read_list_string(s, offset):
+	n, offset = _read_length(s, offset)
+	items = []
+	for _ in range(n):
+		if s[offset]:
+			tmp0, offset = _read_length(s, offset + 1)
+			item = str(s[offset:offset + tmp0], 'ISO-8859-1')
+			offset += tmp0
+		else:
+			item = None
+			offset += 1
+		items.append(item)
+	return items, offset
+
+
+def _write_list_string(s, items):
+	s.append(_write_length(len(items)))
+	for item in items:
+		if item is None:
+			s.append(b'\x00')
+		else:
+			s.append(b'\x01')
+			s.append(_write_length(len(item)))
+			s.append(item.encode('ISO-8859-1'))
+
+
+class GameInfo(object):
+
+	__slots__ = ['game_name', 'sides', 'cycle_duration', 'sides_color']
+
+	_read_sides = staticmethod(_read_map_string_list_string)
+	_read_sides_color = staticmethod(_read_map_string_string)
+
+	@staticmethod
+	def name():
+		return 'GameInfo'
+
+
+	def __init__(self, game_name=None, sides=None, cycle_duration=None, sides_color=None):
+		self.initialize(game_name, sides, cycle_duration, sides_color)
+	
+
+	def initialize(self, game_name=None, sides=None, cycle_duration=None, sides_color=None):
+		self.game_name = game_name
+		self.sides = sides
+		self.cycle_duration = cycle_duration
+		self.sides_color = sides_color
+	
+
+	def serialize(self):
+		s = []
+		
+		# serialize self.game_name
+		if self.game_name is None:
+			s.append(b'\x00')
+		else:
+			s.append(b'\x01')
+			s.append(_write_length(len(self.game_name)))
+			s.append(self.game_name.encode('ISO-8859-1'))
+		
+		# serialize self.sides
+		if self.sides is None:
+			s.append(b'\x00')
+		else:
+			s.append(b'\x01')
+			_write_map_string_list_string(s, self.sides)
+		
+		# serialize self.cycle_duration
+		if self.cycle_duration is None:
+			s.append(b'\x00')
+		else:
+			s.append(b'\x01')
+			s.append(_FLOAT.pack(self.cycle_duration))
+		
+		# serialize self.sides_color
+		if self.sides_color is None:
+			s.append(b'\x00')
+		else:
+			s.append(b'\x01')
+			_write_map_string_string(s, self.sides_color)
+		
+		return b''.join(s)
+	
+
+	def deserialize(self, s, offset=0):
+		# deserialize self.game_name
+		if s[offset]:
+			tmp0, offset = _read_length(s, offset + 1)
+			self.game_name = str(s[offset:offset + tmp0], 'ISO-8859-1')
+			offset += tmp0
+		else:
+			self.game_name = None
+			offset += 1
+		
+		# deserialize self.sides
+		if s[offset]:
+			self.sides, offset = self._read_sides(s, offset + 1)
+		else:
+			self.sides = None
+			offset += 1
+		
+		# deserialize self.cycle_duration
+		if s[offset]:
+			self.cycle_duration = _FLOAT.unpack_from(s, offset + 1)[0]
+			offset += 5
+		else:
+			self.cycle_duration = None
+			offset += 1
+		
+		# deserialize self.sides_color
+		if s[offset]:
+			self.sides_color, offset = self._read_sides_color(s, offset + 1)
+		else:
+			self.sides_color = None
+			offset += 1
+		
+		return offset
+	
+
+
+class SceneActions(object):
+
+	__slots__ = ['types', 'payloads']
+
+	_read_types = staticmethod(_read_list_string)
+	_read_payloads = staticmethod(_read_list_string)
+
+	@staticmethod
+	def name():
+		return 'SceneActions'
+
+
+	def __init__(self, types=None, payloads=None):
+		self.initialize(types, payloads)
+	
+
+	def initialize(self, types=None, payloads=None):
+		self.types = types
+		self.payloads = payloads
+	
+
+	def serialize(self):
+		s = []
+		
+		# serialize self.types
+		if self.types is None:
+			s.append(b'\x00')
+		else:
+			s.append(b'\x01')
+			_write_list_string(s, self.types)
+		
+		# serialize self.payloads
+		if self.payloads is None:
+			s.append(b'\x00')
+		else:
+			s.append(b'\x01')
+			_write_list_string(s, self.payloads)
+		
+		return b''.join(s)
+	
+
+	def deserialize(self, s, offset=0):
+		# deserialize self.types
+		if s[offset]:
+			self.types, offset = self._read_types(s, offset + 1)
+		else:
+			self.types = None
+			offset += 1
+		
+		# deserialize self.payloads
+		if s[offset]:
+			self.payloads, offset = self._read_payloads(s, offset + 1)
+		else:
+			self.payloads = None
+			offset += 1
+		
+		return offset
+	
@@ -0,0 +1,469 @@
+# -*- coding: utf-8 -*-
+
+# python imports
+import os
+import re
+import sys
+import struct
+
+# Generates python codecs of ks schema files, e.g. ks/models.py and ks/commands.py are regenerated by:
+#     python ksgen.py ks/models.ks ks/commands.ks
+# Wire format is the same as chillin's generated code, decoding is batched instead:
+# each run of fixed width fields is read with one precompiled struct when all of its fields are present,
+# enums are looked up in tables and lists of fixed width items are unpacked in one go.
+
+PRIMITIVES = {
+    'bool': '?',
+    'byte': 'b',
+    'ubyte': 'B',
+    'short': 'h',
+    'ushort': 'H',
+    'int': 'i',
+    'uint': 'I',
+    'long': 'q',
+    'ulong': 'Q',
+    'float': 'f',
+    'double': 'd',
+}
+
+HEADER = '''# -*- coding: utf-8 -*-
+# Generated by ksgen.py from %s, edit the schema and regenerate this file instead.
+
+# python imports
+import sys
+import struct
+from enum import Enum
+'''
+
+HELPERS = '''_BIG_ENDIAN = sys.byteorder == 'big'
+
+
+def _read_length(s, offset):
+	# Lengths are native unsigned ints without their trailing zero bytes, prefixed by their byte count.
+	n = s[offset]
+	value = int.from_bytes(s[offset + 1:offset + 1 + n], sys.byteorder)
+	return (value << 8 * (4 - n) if _BIG_ENDIAN else value), offset + 1 + n
+
+
+def _write_length(n):
+	tmp = _UINT.pack(n).rstrip(b'\\x00')
+	return bytes((len(tmp),)) + tmp
+'''
+
+
+class Type:
+
+    def __init__(self, kind:str, name:str, args:list=()):
+        # kind is one of primitive, string, enum, class, list and map
+        self.kind = kind
+        self.name = name
+        self.args = list(args)
+
+    @property
+    def key(self):
+        # Identifier of the type in generated function and struct names, e.g. list_list_ECell.
+        return '_'.join([self.kind if self.kind in ('list', 'map') else self.name] + [arg.key for arg in self.args])
+
+
+class EnumDef:
+
+    def __init__(self, name:str, base:str, members:list):
+        self.name = name
+        self.base = base
+        self.members = members
+
+
+class ClassDef:
+
+    def __init__(self, name:str, fields:list):
+        self.name = name
+        self.fields = fields
+
+
+def parse(text:str):
+    # Enums and classes of a schema in their order, field types are resolved against the whole schema.
+    defs, raw_fields = [], {}
+    for name, body in re.findall(r'^\[(\w+)\][ \t]*$(.*?)(?=^\[|\Z)', text, re.M | re.S):
+        enum = re.search(r'_def\s*=\s*enum\s*<\s*(\w+)\s*>\s*\{(.*?)\}', body, re.S)
+        if enum:
+            if enum.group(1) not in PRIMITIVES:
+                raise ValueError("unsupported enum base type %r of %s" % (enum.group(1), name))
+            members, value = [], 0
+            for member in filter(None, (item.strip() for item in enum.group(2).split(','))):
+                if '=' in member:
+                    member, value = [part.strip() for part in member.split('=')]
+                    value = int(value)
+                members.append((member, value))
+                value += 1
+            defs.append(EnumDef(name, enum.group(1), members))
+            continue
+        lines = [line.strip() for line in body.splitlines() if line.strip() and not line.strip().startswith('#')]
+        if not lines or re.sub(r'\s', '', lines[0]) != '_def=class':
+            raise ValueError("unsupported definition of %s: %r" % (name, lines[0] if lines else ''))
+        defs.append(ClassDef(name, []))
+        raw_fields[name] = [tuple(part.strip() for part in line.split('=', 1)) for line in lines[1:]]
+
+    names = {d.name: d for d in defs}
+    for d in defs:
+        if isinstance(d, ClassDef):
+            d.fields = [(field, parse_type(type_name, names)) for field, type_name in raw_fields[d.name]]
+    return defs
+
+
+def parse_type(text:str, names:dict):
+    text = text.replace(' ', '')
+    container = re.match(r'^(list|map)<(.*)>$', text)
+    if container:
+        args, depth, start = [], 0, 0
+        for i, c in enumerate(container.group(2)):
+            depth += {'<': 1, '>': -1}.get(c, 0)
+            if c == ',' and depth == 0:
+                args.append(container.group(2)[start:i])
+                start = i + 1
+        args.append(container.group(2)[start:])
+        if len(args) != (1 if container.group(1) == 'list' else 2):
+            raise ValueError("wrong number of arguments in %r" % text)
+        return Type(container.group(1), text, [parse_type(arg, names) for arg in args])
+    if text in PRIMITIVES:
+        return Type('primitive', text)
+    if text == 'string':
+        return Type('string', text)
+    if text in names:
+        return Type('enum' if isinstance(names[text], EnumDef) else 'class', text)
+    raise ValueError("unknown type %r" % text)
+
+
+def upper(name:str):
+    # ESoundIntensity -> E_SOUND_INTENSITY
+    return re.sub(r'(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])', '_', name).upper()
+
+
+class Generator:
+
+    def __init__(self, defs:list, source:str):
+        self.defs = defs
+        self.source = source
+        self.names = {d.name: d for d in defs}
+        self.structs = {'_UINT': '=I'}
+        self.containers = []
+        self.tmp = 0
+
+    def generate(self):
+        # Top level blocks of the module, separated by two blank lines.
+        classes = [self.class_def(d) for d in self.defs if isinstance(d, ClassDef)]
+        functions, done = [], 0
+        # Container functions can need other containers, e.g. list<list<ECell>> needs list<ECell>:
+        while done < len(self.containers):
+            functions += [self.read_container(self.containers[done]), self.write_container(self.containers[done])]
+            done += 1
+
+        blocks = [HEADER % self.source]
+        tables = []
+        for d in self.defs:
+            if isinstance(d, EnumDef):
+                blocks.append(['class %s(Enum):' % d.name] + ['\t%s = %d' % member for member in d.members])
+                table = '_' + upper(d.name)
+                if self.byte_enum(d):
+                    tables.append('%s = {member.value & 0xff: member for member in %s}' % (table, d.name))
+                    tables.append('%s_ITEMS = {member: bytes((1, member.value & 0xff)) for member in %s}' % (table, d.name))
+                    tables.append("%s_ITEMS[None] = b'\\x00'" % table)
+                else:
+                    tables.append('%s = {member.value: member for member in %s}' % (table, d.name))
+        blocks.append(tables + ["%s = struct.Struct('%s')" % item for item in self.structs.items()])
+        blocks += [HELPERS] + functions + classes
+        return '\n\n\n'.join(block.strip('\n') if isinstance(block, str) else '\n'.join(block).rstrip('\n') for block in blocks) + '\n'
+
+    # Types
+
+    def byte_enum(self, d):
+        return isinstance(d, EnumDef) and struct.calcsize('=' + PRIMITIVES[d.base]) == 1
+
+    def layout(self, t:Type):
+        # Struct format of a present fixed width value and offsets of its nested presence bytes, None if variable.
+        if t.kind == 'primitive':
+            return PRIMITIVES[t.name], []
+        if t.kind == 'enum':
+            base = PRIMITIVES[self.names[t.name].base]
+            return (base.upper() if self.byte_enum(self.names[t.name]) else base), []
+        if t.kind == 'class':
+            record = self.record([field_type for _, field_type in self.names[t.name].fields])
+            return record and (record[0][1:], record[1])
+        return None
+
+    def record(self, types:list):
+        # Struct format of present values each prefixed by its presence byte and offsets of all presence bytes.
+        fmt, presence = '=', []
+        for t in types:
+            layout = self.layout(t)
+            if layout is None:
+                return None
+            presence.append(struct.calcsize(fmt))
+            presence += [struct.calcsize(fmt + 'B') + p for p in layout[1]]
+            fmt += 'B' + layout[0]
+        return fmt, presence
+
+    def unpacked(self, t:Type, target:str=None):
+        # Unpacked struct items of a present value and expression of the value made from them.
+        if t.kind == 'primitive':
+            target = target or self.new_tmp()
+            return [target], target
+        if t.kind == 'enum':
+            name = self.new_tmp()
+            return [name], '_%s[%s]' % (upper(t.name), name)
+        targets, args = [], []
+        for _, field_type in self.names[t.name].fields:
+            sub_targets, arg = self.unpacked(field_type)
+            targets += ['_'] + sub_targets
+            args.append(arg)
+        return targets, '%s(%s)' % (t.name, ', '.join(args))
+
+    def packed(self, t:Type, expr:str):
+        # Struct arguments of a present value and expressions that must not be None.
+        if t.kind == 'primitive':
+            return [expr], [expr]
+        if t.kind == 'enum':
+            return ['%s.value & 0xff' % expr if self.byte_enum(self.names[t.name]) else '%s.value' % expr], [expr]
+        args, checks = [], [expr]
+        for field, field_type in self.names[t.name].fields:
+            sub_args, sub_checks = self.packed(field_type, '%s.%s' % (expr, field))
+            args += ['1'] + sub_args
+            checks += sub_checks
+        return args, checks
+
+    def primitive_struct(self, t:Type):
+        # Struct of a primitive or of an enum's base type, e.g. _INT.
+        base = t.name if t.kind == 'primitive' else self.names[t.name].base
+        name = '_' + upper(base)
+        self.structs[name] = '=' + PRIMITIVES[base]
+        return name
+
+    def container(self, t:Type):
+        if t.key not in [c.key for c in self.containers]:
+            self.containers.append(t)
+        return t.key
+
+    def new_tmp(self):
+        self.tmp += 1
+        return 'tmp%d' % (self.tmp - 1)
+
+    # Reading
+
+    def read_field(self, t:Type, target:str, indent:int, reader:str=None):
+        # Reads a value with its presence byte at offset.
+        tabs = '\t' * indent
+        if t.kind == 'enum' and self.byte_enum(self.names[t.name]):
+            return [
+                tabs + 'if s[offset]:',
+                tabs + '\t%s = _%s[s[offset + 1]]' % (target, upper(t.name)),
+                tabs + '\toffset += 2',
+                tabs + 'else:',
+                tabs + '\t%s = None' % target,
+                tabs + '\toffset += 1',
+            ]
+        return [tabs + 'if s[offset]:'] + self.read_value(t, target, indent + 1, reader) + [
+            tabs + 'else:',
+            tabs + '\t%s = None' % target,
+            tabs + '\toffset += 1',
+        ]
+
+    def read_value(self, t:Type, target:str, indent:int, reader:str=None):
+        # Reads a present value right after its presence byte at offset.
+        tabs = '\t' * indent
+        if t.kind == 'primitive' or t.kind == 'enum':
+            value = '%s.unpack_from(s, offset + 1)[0]' % self.primitive_struct(t)
+            if t.kind == 'enum':
+                value = '_%s[%s]' % (upper(t.name), value)
+            return [tabs + '%s = %s' % (target, value), tabs + 'offset += %d' % (1 + struct.calcsize(self.structs[self.primitive_struct(t)]))]
+        if t.kind == 'string':
+            n = self.new_tmp()
+            return [
+                tabs + '%s, offset = _read_length(s, offset + 1)' % n,
+                tabs + "%s = str(s[offset:offset + %s], 'ISO-8859-1')" % (target, n),
+                tabs + 'offset += %s' % n,
+            ]
+        if t.kind == 'class':
+            return [tabs + '%s = %s()' % (target, t.name), tabs + 'offset = %s.deserialize(s, offset + 1)' % target]
+        return [tabs + '%s, offset = %s(s, offset + 1)' % (target, reader or '_read_' + self.container(t))]
+
+    def read_container(self, t:Type):
+        self.tmp = 0
+        lines = ['def _read_%s(s, offset):' % t.key, '\tn, offset = _read_length(s, offset)']
+        record = self.record(t.args)
+        if t.kind == 'list' and t.args[0].kind == 'enum' and self.byte_enum(self.names[t.args[0].name]):
+            lines += [
+                '\tend = offset + 2 * n',
+                "\tif len(s) >= end and s[offset:end:2] == b'\\x01' * n:",
+                '\t\treturn list(map(_%s.__getitem__, s[offset + 1:end:2])), end' % upper(t.args[0].name),
+            ]
+        elif record is not None:
+            # Items are unpacked in one go when all of their presence bytes are set:
+            item = '_%s_ITEM' % upper(t.key)
+            self.structs[item] = record[0]
+            size = struct.calcsize(record[0])
+            targets, values = [], []
+            for arg in t.args:
+                sub_targets, value = self.unpacked(arg)
+                targets += ['_'] + sub_targets
+                values.append(value)
+            checks = ["s[offset%s:end:%d] == ones" % (' + %d' % p if p else '', size) for p in record[1]]
+            lines += ['\tend = offset + %d * n' % size, "\tones = b'\\x01' * n"]
+            lines.append('\tif len(s) >= end and %s:' % ' and '.join(checks))
+            each = 'for %s in %s.iter_unpack(s[offset:end])' % (', '.join(targets), item)
+            if t.kind == 'list':
+                lines.append('\t\treturn [%s %s], end' % (values[0], each))
+            else:
+                lines.append('\t\treturn {%s: %s %s}, end' % (values[0], values[1], each))
+        if t.kind == 'list':
+            lines += ['\titems = []', '\tfor _ in range(n):']
+            lines += self.read_field(t.args[0], 'item', 2)
+            lines += ['\t\titems.append(item)']
+        else:
+            lines += ['\titems = {}', '\tfor _ in range(n):']
+            lines += self.read_field(t.args[0], 'key', 2) + self.read_field(t.args[1], 'value', 2)
+            lines += ['\t\titems[key] = value']
+        return lines + ['\treturn items, offset']
+
+    # Writing
+
+    def write_field(self, t:Type, expr:str, indent:int):
+        # Writes a value with its presence byte.
+        tabs = '\t' * indent
+        if t.kind == 'enum' and self.byte_enum(self.names[t.name]):
+            return [tabs + 's.append(_%s_ITEMS[%s])' % (upper(t.name), expr)]
+        return [
+            tabs + 'if %s is None:' % expr,
+            tabs + "\ts.append(b'\\x00')",
+            tabs + 'else:',
+            tabs + "\ts.append(b'\\x01')",
+        ] + self.write_value(t, expr, indent + 1)
+
+    def write_value(self, t:Type, expr:str, indent:int):
+        tabs = '\t' * indent
+        if t.kind == 'primitive':
+            return [tabs + 's.append(%s.pack(%s))' % (self.primitive_struct(t), expr)]
+        if t.kind == 'enum':
+            return [tabs + 's.append(%s.pack(%s.value))' % (self.primitive_struct(t), expr)]
+        if t.kind == 'string':
+            return [tabs + 's.append(_write_length(len(%s)))' % expr, tabs + "s.append(%s.encode('ISO-8859-1'))" % expr]
+        if t.kind == 'class':
+            return [tabs + 's.append(%s.serialize())' % expr]
+        return [tabs + '_write_%s(s, %s)' % (self.container(t), expr)]
+
+    def write_container(self, t:Type):
+        lines = ['def _write_%s(s, items):' % t.key, '\ts.append(_write_length(len(items)))']
+        if t.kind == 'list' and t.args[0].kind == 'enum' and self.byte_enum(self.names[t.args[0].name]):
+            return lines + ["\ts.append(b''.join(map(_%s_ITEMS.__getitem__, items)))" % upper(t.args[0].name)]
+        if t.kind == 'list':
+            lines += ['\tfor item in items:'] + self.write_field(t.args[0], 'item', 2)
+        else:
+            lines += ['\tfor key, value in items.items():']
+            lines += self.write_field(t.args[0], 'key', 2) + self.write_field(t.args[1], 'value', 2)
+        return lines
+
+    # Classes
+
+    def runs(self, d:ClassDef):
+        # Fields grouped into runs of consecutive fixed width fields, each variable width field is a run by itself.
+        runs = []
+        for field, t in d.fields:
+            fixed = self.layout(t) is not None
+            if fixed and runs and runs[-1][0]:
+                runs[-1][1].append((field, t))
+            else:
+                runs.append((fixed, [(field, t)]))
+        return runs
+
+    def batched(self, fixed:bool, fields:list):
+        return fixed and (len(fields) > 1 or fields[0][1].kind == 'class')
+
+    def class_def(self, d:ClassDef):
+        fields = [field for field, _ in d.fields]
+        args = ''.join(', %s=None' % field for field in fields)
+        lines = ['class %s(object):' % d.name, '', '\t__slots__ = [%s]' % ', '.join("'%s'" % field for field in fields), '']
+        hooks = [(field, t) for field, t in d.fields if t.kind in ('list', 'map')]
+        if hooks:
+            # Container fields are read by overridable readers, a subclass can decode them into its own types:
+            lines += ['\t_read_%s = staticmethod(_read_%s)' % (field, self.container(t)) for field, t in hooks] + ['']
+        lines += [
+            '\t@staticmethod',
+            '\tdef name():',
+            "\t\treturn '%s'" % d.name,
+            '', '',
+            '\tdef __init__(self%s):' % args,
+            '\t\tself.initialize(%s)' % ', '.join(fields),
+            '\t', '',
+            '\tdef initialize(self%s):' % args,
+        ]
+        lines += ['\t\tself.%s = %s' % (field, field) for field in fields] or ['\t\tpass']
+        lines += ['\t', ''] + self.serialize(d) + ['\t', ''] + self.deserialize(d) + ['\t']
+        return lines
+
+    def serialize(self, d:ClassDef):
+        lines = ['\tdef serialize(self):', '\t\ts = []', '\t\t']
+        for index, (fixed, fields) in enumerate(self.runs(d)):
+            lines.append('\t\t# serialize %s' % ', '.join('self.%s' % field for field, _ in fields))
+            if self.batched(fixed, fields):
+                args, checks = [], []
+                for field, t in fields:
+                    sub_args, sub_checks = self.packed(t, 'self.%s' % field)
+                    args += ['1'] + sub_args
+                    checks += sub_checks
+                name = '_%s_%d' % (upper(d.name), index)
+                self.structs[name] = self.record([t for _, t in fields])[0]
+                lines += [
+                    '\t\tif %s:' % ' and '.join('%s is not None' % check for check in checks),
+                    '\t\t\ts.append(%s.pack(%s))' % (name, ', '.join(args)),
+                    '\t\telse:',
+                ]
+                for field, t in fields:
+                    lines += self.write_field(t, 'self.%s' % field, 3)
+            else:
+                for field, t in fields:
+                    lines += self.write_field(t, 'self.%s' % field, 2)
+            lines.append('\t\t')
+        return lines + ["\t\treturn b''.join(s)"]
+
+    def deserialize(self, d:ClassDef):
+        self.tmp = 0
+        lines = ['\tdef deserialize(self, s, offset=0):']
+        for index, (fixed, fields) in enumerate(self.runs(d)):
+            lines.append('\t\t# deserialize %s' % ', '.join('self.%s' % field for field, _ in fields))
+            if self.batched(fixed, fields):
+                name = '_%s_%d' % (upper(d.name), index)
+                fmt, presence = self.record([t for _, t in fields])
+                self.structs[name] = fmt
+                targets, assignments = [], []
+                for field, t in fields:
+                    sub_targets, value = self.unpacked(t, 'self.%s' % field)
+                    targets += ['_'] + sub_targets
+                    if t.kind != 'primitive':
+                        assignments.append('\t\t\tself.%s = %s' % (field, value))
+                lines += [
+                    '\t\tif %s:' % ' and '.join('s[offset%s]' % (' + %d' % p if p else '') for p in presence),
+                    '\t\t\t%s = %s.unpack_from(s, offset)' % (', '.join(targets), name),
+                ] + assignments + [
+                    '\t\t\toffset += %d' % struct.calcsize(fmt),
+                    '\t\telse:',
+                ]
+                for field, t in fields:
+                    lines += self.read_field(t, 'self.%s' % field, 3)
+            else:
+                for field, t in fields:
+                    lines += self.read_field(t, 'self.%s' % field, 2, 'self._read_%s' % field)
+            lines.append('\t\t')
+        return lines + ['\t\treturn offset']
+
+
+def generate(path:str):
+    # Writes the codec module of a .ks file next to it.
+    with open(path) as f:
+        defs = parse(f.read())
+    code = Generator(defs, os.path.basename(path)).generate()
+    # Line endings of generated files are kept as chillin's generator writes them:
+    with open(os.path.splitext(path)[0] + '.py', 'w', newline='\r\n') as f:
+        f.write(code)
+
+
+if __name__ == '__main__':
+    for path in sys.argv[1:]:
+        generate(path)
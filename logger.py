@@ -0,0 +1,103 @@
+# python imports
+import sys
+import copy
+import atexit
+import logging
+import threading
+from collections import deque
+
+DEFAULT_CONFIG = {
+    "level": "WARNING",
+    "buffer_size": 10000,
+    "flush_interval": 0.1,
+    "stream": "stdout",
+    "format": "%(name)s %(levelname)s: %(message)s",
+}
+
+
+class RingBufferHandler(logging.Handler):
+
+    # Records are kept in a bounded ring buffer, the oldest ones are dropped when it's full.
+    # Formatting and writing happen in a background thread, so a decision thread only appends a record.
+    def __init__(self, stream, buffer_size:int, flush_interval:float):
+        super(RingBufferHandler, self).__init__()
+        self.stream = stream
+        self.buffer = deque(maxlen=buffer_size)
+        # The writer thread drains the buffer every flush_interval, it's woken up early only when the buffer is half full:
+        self.wakeup_size = max(1, buffer_size // 2)
+        self.flush_interval = flush_interval
+        self.wakeup = threading.Event()
+        self.closing = False
+        self.write_lock = threading.Lock()
+        self.thread = threading.Thread(target=self._drain_loop, name="logger", daemon=True)
+        self.thread.start()
+
+    def emit(self, record):
+        try:
+            self.buffer.append(self.prepare(record))
+        except Exception:
+            self.handleError(record)
+        if len(self.buffer) >= self.wakeup_size and not self.wakeup.is_set():
+            self.wakeup.set()
+
+    def prepare(self, record):
+        # Like QueueHandler.prepare, the message is filled in right away since callers may change its arguments
+        # after logging, e.g. popping a logged path. Only formatting the final line is left to the writer thread.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = (self.formatter or logging.Formatter()).formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def flush(self):
+        # Writing all buffered records right now.
+        with self.write_lock:
+            while self.buffer:
+                record = self.buffer.popleft()
+                try:
+                    self.stream.write(self.format(record) + "\n")
+                except Exception:
+                    self.handleError(record)
+            self.stream.flush()
+
+    def _drain_loop(self):
+        while not self.closing:
+            self.wakeup.wait(self.flush_interval)
+            self.wakeup.clear()
+            self.flush()
+
+    def close(self):
+        # Stopping the writer thread after it writes buffered records.
+        self.closing = True
+        self.wakeup.set()
+        if self.thread is not threading.current_thread():
+            self.thread.join()
+        self.flush()
+        super(RingBufferHandler, self).close()
+
+
+_handler = None
+
+def configure(config:dict=None):
+    # Configuring project loggers from the "log" section of game config, e.g. {"level": "DEBUG"}.
+    global _handler
+    config = dict(DEFAULT_CONFIG, **{key: value for key, value in (config or {}).items() if key})
+    root = logging.getLogger()
+    if _handler is not None:
+        root.removeHandler(_handler)
+        _handler.close()
+    stream = sys.stderr if config["stream"] == "stderr" else sys.stdout
+    _handler = RingBufferHandler(stream, config["buffer_size"], config["flush_interval"])
+    _handler.setFormatter(logging.Formatter(config["format"]))
+    root.addHandler(_handler)
+    root.setLevel(getattr(logging, config["level"].upper()))
+    return _handler
+
+
+@atexit.register
+def _flush_at_exit():
+    if _handler is not None:
+        _handler.flush()
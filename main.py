@@ -7,10 +7,13 @@ import sys
 
 # chillin imports
 from chillin_client import GameClient
+from chillin_client.config import Config
 
 # project imports
+import logger
+import profiler
 from ai import AI
-from ks.models import World
+from codec import LazyWorld, install_batch_protocol
 
 
 config_path = os.path.join(
@@ -21,8 +24,20 @@ if len(sys.argv) > 1:
   config_path = sys.argv[1]
 
 
-ai = AI(World())
-
 app = GameClient(config_path)
+logger.configure(Config.config.get("log"))
+profiler.configure(Config.config.get("profile"))
+ai_config = Config.config["ai"]
+# Commands are batched only when chillin's protocol could be patched for it:
+batch_commands = ai_config.get("batch_commands", False) and install_batch_protocol(app)
+ai = AI(LazyWorld(), batch_commands=batch_commands, decision_worker=not ai_config["create_new_thread"],
+        decide_budget=ai_config.get("decide_budget"))
 app.register_ai(ai)
-app.run()
+try:
+    app.run()
+finally:
+    # chillin exits when the connection drops, the decision thread must be stopped then too
+    # or the interpreter waits for it forever:
+    if ai.worker is not None:
+        ai.worker.stop()
+    profiler.dump()
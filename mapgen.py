@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+# python imports
+import sys
+import random
+
+# project imports
+from ks.models import (World, Police, Terrorist, Position, Constants,
+                       ECell, ESoundIntensity, EAgentStatus)
+
+# Bomb sites of a map by default, one per this many cells and no fewer than agents of a side when the board has room:
+CELLS_PER_SITE = 400
+SITE_KINDS = [ECell.SmallBombSite, ECell.MediumBombSite, ECell.LargeBombSite, ECell.VastBombSite]
+
+
+def default_constants():
+    # Sound ranges are in Strong, Normal, Weak order like the server sends them.
+    return Constants(
+        bomb_planting_time=3, bomb_defusion_time=4, bomb_explosion_time=20,
+        bomb_planting_score=10, bomb_defusion_score=10, bomb_explosion_score=20,
+        score_coefficient_small_bomb_site=1.0, score_coefficient_medium_bomb_site=1.5,
+        score_coefficient_large_bomb_site=2.0, score_coefficient_vast_bomb_site=3.0,
+        terrorist_vision_distance=2, terrorist_death_score=5, police_death_score=5, police_vision_distance=2,
+        sound_ranges={ESoundIntensity.Strong: 8, ESoundIntensity.Normal: 12, ESoundIntensity.Weak: 16},
+        max_cycles=300,
+    )
+
+
+def generate(width:int, height:int=None, seed:int=0, wall_density:float=0.2, sites:dict=None, agents:int=5, constants:Constants=None):
+    # A World of a walled board with random inner walls. sites gives the number of bomb sites of each kind, by default
+    # kinds take turns in sites of the map, at least one per agent so that each police starts with a site to guard.
+    # Boards too small for that get fewer, the AI plays on with fewer sites than polices. Empty cells not connected to the
+    # largest open area are walled, bomb sites replace inner walls next to the open area and agents of each side stand
+    # on distinct open cells, so every site is reachable by every agent. The same arguments always give the same World.
+    height = height or width
+    rnd = random.Random(seed)
+    board = [[ECell.Wall if i in (0, height-1) or j in (0, width-1) or rnd.random() < wall_density else ECell.Empty
+              for j in range(width)] for i in range(height)]
+
+    area = largest_area(board)
+    for i in range(height):
+        for j in range(width):
+            if board[i][j] == ECell.Empty and (i, j) not in area:
+                board[i][j] = ECell.Wall
+
+    if sites is None:
+        count = max(agents, width * height // CELLS_PER_SITE)
+        sites = {kind: len(range(k, count, len(SITE_KINDS))) for k, kind in enumerate(SITE_KINDS)}
+    candidates = [(i, j) for i in range(1, height-1) for j in range(1, width-1) if board[i][j] == ECell.Wall and
+                  any((i+di, j+dj) in area for di, dj in ((-1, 0), (1, 0), (0, -1), (0, 1)))]
+    kinds = [kind for kind in SITE_KINDS for _ in range(sites.get(kind, 0))]
+    for (i, j), kind in zip(rnd.sample(candidates, min(len(candidates), len(kinds))), kinds):
+        board[i][j] = kind
+
+    cells = rnd.sample(sorted(area), min(len(area), 2 * agents))
+    positions = lambda cells: [Position(x=j, y=i) for i, j in cells]
+    polices = [Police(k, position, -1, [], [], EAgentStatus.Alive) for k, position in enumerate(positions(cells[:agents]))]
+    terrorists = [Terrorist(k, position, -1, [], EAgentStatus.Alive) for k, position in enumerate(positions(cells[agents:]))]
+    return World(
+        width=width, height=height, board=board,
+        scores={"Police": 0.0, "Terrorist": 0.0},
+        bombs=[], terrorists=terrorists, polices=polices,
+        constants=constants or default_constants(),
+    )
+
+
+def largest_area(board:list):
+    # Largest 4-connected set of empty cells.
+    seen, best = set(), set()
+    for i, row in enumerate(board):
+        for j, cell in enumerate(row):
+            if cell != ECell.Empty or (i, j) in seen:
+                continue
+            area, stack = {(i, j)}, [(i, j)]
+            while stack:
+                x, y = stack.pop()
+                for t in ((x-1, y), (x+1, y), (x, y-1), (x, y+1)):
+                    if t not in area and board[t[0]][t[1]] == ECell.Empty:
+                        area.add(t)
+                        stack.append(t)
+            seen |= area
+            if len(area) > len(best):
+                best = area
+    return best
+
+
+if __name__ == '__main__':
+    # python mapgen.py SIZE SEED PATH: writes a serialized World, e.g. for tournament.py --maps.
+    size, seed, path = int(sys.argv[1]), int(sys.argv[2]), sys.argv[3]
+    with open(path, 'wb') as f:
+        f.write(generate(size, seed=seed).serialize())
@@ -0,0 +1,135 @@
+# python imports
+import sys
+import json
+import time
+import atexit
+import threading
+
+# my imports
+import graph
+
+DEFAULT_CONFIG = {
+    "enabled": False,
+    "output": "stderr",
+}
+
+# Graph searches of each thread, decisions of overlapping snapshots run in different threads:
+_searches = threading.local()
+
+
+class StrategyStats:
+
+    __slots__ = ['calls', 'hits', 'total', 'max', 'searches']
+
+    def __init__(self):
+        self.calls, self.hits, self.total, self.max, self.searches = 0, 0, 0.0, 0.0, 0
+
+    def report(self):
+        return {
+            "calls": self.calls,
+            "hits": self.hits,
+            "total_ms": self.total * 1000,
+            "mean_ms": self.total / self.calls * 1000 if self.calls else 0.0,
+            "max_ms": self.max * 1000,
+            "searches": self.searches,
+        }
+
+
+class Profiler:
+
+    # Statistics of strategy functions by their names, strategies are profiled only when they're wrapped,
+    # so a disabled profiler leaves strategy chains untouched.
+    def __init__(self, output:str):
+        self.output = output
+        self.stats = {}
+        self.lock = threading.Lock()
+        self.dumped = False
+
+    def wrap(self, strategy):
+        name = strategy.__name__
+        stats = self.stats.setdefault(name, StrategyStats())
+        lock = self.lock
+
+        def profiled(agent):
+            searches = getattr(_searches, 'count', 0)
+            start = time.perf_counter()
+            result = strategy(agent)
+            elapsed = time.perf_counter() - start
+            with lock:
+                stats.calls += 1
+                stats.hits += bool(result)
+                stats.total += elapsed
+                stats.max = max(stats.max, elapsed)
+                stats.searches += getattr(_searches, 'count', 0) - searches
+            return result
+
+        profiled.__name__ = name
+        return profiled
+
+    def wrap_all(self, strategies:list):
+        return [self.wrap(strategy) for strategy in strategies]
+
+    def report(self):
+        with self.lock:
+            return {name: stats.report() for name, stats in self.stats.items()}
+
+    def dump(self):
+        # Summary of the game, a .json output gets the report itself and other outputs a table.
+        if self.dumped or not self.stats:
+            return
+        self.dumped = True
+        report = self.report()
+        if self.output.endswith('.json'):
+            with open(self.output, 'w') as f:
+                json.dump(report, f, indent=2)
+            return
+        lines = ["%-28s %8s %8s %12s %10s %10s %9s" % ("strategy", "calls", "hits", "total (ms)", "mean (ms)", "max (ms)", "searches")]
+        for name, r in report.items():
+            lines.append("%-28s %8d %8d %12.3f %10.4f %10.3f %9d" % (
+                name, r["calls"], r["hits"], r["total_ms"], r["mean_ms"], r["max_ms"], r["searches"]))
+        text = "\n".join(lines) + "\n"
+        if self.output in ("stdout", "stderr"):
+            stream = sys.stdout if self.output == "stdout" else sys.stderr
+            stream.write(text)
+            stream.flush()
+        else:
+            with open(self.output, 'w') as f:
+                f.write(text)
+
+
+def _counted(search):
+    def counted(*args, **kwargs):
+        _searches.count = getattr(_searches, 'count', 0) + 1
+        return search(*args, **kwargs)
+    counted.__wrapped__ = search
+    return counted
+
+
+_profiler = None
+
+def configure(config:dict=None):
+    # Configuring profiling from the "profile" section of game config, e.g. {"enabled": true, "output": "profile.json"}.
+    # Graph searches are counted only while profiling is enabled.
+    global _profiler
+    config = dict(DEFAULT_CONFIG, **{key: value for key, value in (config or {}).items() if key})
+    searches = [(graph.ArrayGraph, '_search'), (graph.ListGraph, 'bfs')]
+    for cls, name in searches:
+        method = cls.__dict__[name]
+        if config["enabled"] and not hasattr(method, '__wrapped__'):
+            setattr(cls, name, _counted(method))
+        elif not config["enabled"] and hasattr(method, '__wrapped__'):
+            setattr(cls, name, method.__wrapped__)
+    _profiler = Profiler(config["output"]) if config["enabled"] else None
+    return _profiler
+
+
+def get_profiler():
+    # The enabled Profiler, None when profiling is disabled.
+    return _profiler
+
+
+@atexit.register
+def dump():
+    # Called at game end, and at exit in case the game didn't end normally.
+    if _profiler is not None:
+        _profiler.dump()
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+
+# python imports
+import os
+import sys
+import mmap
+from struct import Struct
+from collections import Counter
+
+# chillin imports
+from chillin_client.helpers.messages import AgentJoined, StartGame, EndGame
+
+# project imports
+from ks.replay import GameInfo, SceneActions
+
+# my imports
+from codec import UINT, read_length
+
+# A .cr replay is a sequence of chillin frames, each one a frame size and a Message with a type name and a payload.
+# Payloads of these types are decoded into their messages, others are given as raw bytes:
+MESSAGES = {cls.name(): cls for cls in [GameInfo, AgentJoined, StartGame, EndGame, SceneActions]}
+# Scene action closing each cycle of a replay:
+END_CYCLE = 'EndCycle'
+
+# Index files are a header of the indexed replay's size and modification time, then the frame offset
+# and the index in that frame's SceneActions of each cycle's first action:
+INDEX_MAGIC = b'CRINDEX1'
+INDEX_HEADER = Struct('=8sQQ')
+INDEX_ENTRY = Struct('=QI')
+
+
+def decode_frame(s, offset:int):
+    # (type, message) of the frame at offset and the offset of the next frame, s can be bytes or a mmap.
+    size, = UINT.unpack_from(s, offset)
+    offset, end = offset + UINT.size, offset + UINT.size + size
+    if end > len(s):
+        raise ValueError("truncated replay frame at %d" % (offset - UINT.size))
+    type_name = None
+    if s[offset]:
+        n, offset = read_length(s, offset + 1)
+        type_name = s[offset:offset + n].decode('ISO-8859-1')
+        offset += n
+    else:
+        offset += 1
+    if not s[offset]:
+        return type_name, None, end
+    n, offset = read_length(s, offset + 1)
+    if type_name not in MESSAGES:
+        return type_name, s[offset:offset + n], end
+    msg = MESSAGES[type_name]()
+    msg.deserialize(s, offset)
+    return type_name, msg, end
+
+
+def read_messages(path:str):
+    # Yields (type, message) of a replay frame by frame, only one frame is in memory at a time.
+    with open(path, 'rb') as f:
+        while True:
+            header = f.read(UINT.size)
+            if not header:
+                return
+            if len(header) < UINT.size:
+                raise ValueError("truncated replay %s" % path)
+            type_name, msg, _ = decode_frame(header + f.read(UINT.unpack(header)[0]), 0)
+            yield type_name, msg
+
+
+class Replay:
+
+    # A memory-mapped replay whose cycles can be read from any cycle on. Cycle k is the scene actions after k EndCycles.
+    # Offsets of cycles are kept in an index file next to the replay, it's rebuilt when the replay changes.
+    def __init__(self, path:str, index_path:str=None):
+        self.path = path
+        self.index_path = index_path or path + '.idx'
+        with open(path, 'rb') as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.cycles = self._load_index()
+        if self.cycles is None:
+            self.cycles = self._build_index()
+            self._save_index()
+
+    def close(self):
+        self.data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return len(self.cycles)
+
+    def messages(self, offset:int=0):
+        # Yields (type, message) of frames from given frame offset on.
+        while offset < len(self.data):
+            type_name, msg, offset = decode_frame(self.data, offset)
+            yield type_name, msg
+
+    def cycle(self, cycle:int):
+        # (type, payload) of each scene action of a cycle, its EndCycle excluded.
+        return next(self.iter_cycles(cycle))
+
+    def iter_cycles(self, start:int=0):
+        # Yields actions of cycles from start on, frames before the start cycle are not decoded.
+        if not 0 <= start < len(self.cycles):
+            raise IndexError("replay cycle out of range")
+        offset, index = self.cycles[start]
+        actions = []
+        while offset < len(self.data):
+            type_name, msg, offset = decode_frame(self.data, offset)
+            if type_name != SceneActions.name() or msg is None:
+                continue
+            for action in zip(msg.types[index:], msg.payloads[index:]):
+                if action[0] == END_CYCLE:
+                    yield actions
+                    actions = []
+                else:
+                    actions.append(action)
+            index = 0
+        if actions:
+            yield actions
+
+    def _build_index(self):
+        # One pass over the replay, only types of scene actions are looked at.
+        cycles, start = [], None
+        offset = 0
+        while offset < len(self.data):
+            frame = offset
+            type_name, msg, offset = decode_frame(self.data, offset)
+            if type_name != SceneActions.name() or msg is None:
+                continue
+            for index, action_type in enumerate(msg.types):
+                if start is None:
+                    start = (frame, index)
+                if action_type == END_CYCLE:
+                    cycles.append(start)
+                    start = None
+        # Actions of a replay cut in the middle of a cycle:
+        if start is not None:
+            cycles.append(start)
+        return cycles
+
+    def _stat(self):
+        stat = os.stat(self.path)
+        return INDEX_MAGIC, stat.st_size, stat.st_mtime_ns
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        if len(data) < INDEX_HEADER.size or (len(data) - INDEX_HEADER.size) % INDEX_ENTRY.size:
+            return None
+        if INDEX_HEADER.unpack_from(data) != self._stat():
+            return None
+        return list(INDEX_ENTRY.iter_unpack(memoryview(data)[INDEX_HEADER.size:]))
+
+    def _save_index(self):
+        # The index is only a cache, a replay in a read-only directory is indexed on every open.
+        data = INDEX_HEADER.pack(*self._stat()) + b''.join(INDEX_ENTRY.pack(*entry) for entry in self.cycles)
+        try:
+            with open(self.index_path + '.tmp', 'wb') as f:
+                f.write(data)
+            os.replace(self.index_path + '.tmp', self.index_path)
+        except OSError:
+            pass
+
+
+if __name__ == '__main__':
+    # python replay.py game.cr [cycle]: message counts of a replay or scene actions of one of its cycles.
+    with Replay(sys.argv[1]) as replay:
+        if len(sys.argv) > 2:
+            for action_type, payload in replay.cycle(int(sys.argv[2])):
+                print(action_type, len(payload))
+        else:
+            print(Counter(type_name for type_name, _ in replay.messages()))
+            print("cycles:", len(replay))
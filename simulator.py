@@ -0,0 +1,354 @@
+# -*- coding: utf-8 -*-
+
+# python imports
+import time
+from collections import deque
+
+# chillin imports
+from chillin_client.helpers.parser import Parser
+from chillin_client.helpers.messages import RealtimeCommand
+
+# project imports
+from ks.models import (World, Police, Terrorist, Bomb, Position, ECell, EAgentStatus)
+from ks.commands import (Move, PlantBomb, DefuseBomb, ECommandDirection)
+
+# my imports
+from codec import COMMAND_TYPES, CommandBatch
+from replay import decode_frame
+
+# A local Search-And-Defuse game, rules are the ones our AI is written against:
+# - Agents move one cell per cycle into an empty cell no other alive agent is in, moving cancels planting or defusing.
+# - A terrorist plants a bomb on an adjacent bomb site in bomb_planting_time cycles, then the bomb explodes after
+#   bomb_explosion_time cycles unless a police next to it defuses it in bomb_defusion_time cycles.
+# - An exploding bomb kills agents next to its site and the site becomes an empty cell.
+# - A terrorist on or next to a police's cell is caught and dies.
+# - Planting, defusion and explosion scores are multiplied by the site's coefficient, a dead agent gives its death score
+#   to the other side.
+# - Agents hear enemies' footsteps by manhattan distance and polices hear planted bombs they don't see by path
+#   distance, intensities are given by sound_ranges. Each side sees enemies within its vision distance, polices see
+#   bombs within theirs.
+# - A game ends after max_cycles or when all agents of a side are dead.
+
+SIDES = ["Police", "Terrorist"]
+
+DIRECTIONS = {
+    ECommandDirection.Up:    (+0, -1),
+    ECommandDirection.Right: (+1, +0),
+    ECommandDirection.Down:  (+0, +1),
+    ECommandDirection.Left:  (-1, +0),
+}
+
+SITE_COEFFICIENTS = {
+    ECell.SmallBombSite: 'score_coefficient_small_bomb_site',
+    ECell.MediumBombSite: 'score_coefficient_medium_bomb_site',
+    ECell.LargeBombSite: 'score_coefficient_large_bomb_site',
+    ECell.VastBombSite: 'score_coefficient_vast_bomb_site',
+}
+
+# ks commands by their names, to decode commands an AI sends:
+COMMANDS = {command_type.name(): command_type for command_type in COMMAND_TYPES}
+
+
+def distance(first:Position, second:Position):
+    return abs(first.x - second.x) + abs(first.y - second.y)
+
+
+class Game:
+
+    # The whole state of a game is a World of ks models, each side gets its own view of it through snapshot().
+    def __init__(self, world:World):
+        self.world = world
+        self.constants = world.constants
+        self.cycle = 0
+        self.done = False
+        self.agents = {
+            "Police": {police.id: police for police in world.polices},
+            "Terrorist": {terrorist.id: terrorist for terrorist in world.terrorists},
+        }
+        # (distance, intensity) of sound ranges from the nearest one:
+        self.ranges = sorted((r, intensity) for intensity, r in self.constants.sound_ranges.items())
+        # Path distances of cells hearing each bomb site, computed when a bomb is first planted on the site:
+        self.site_distances = {}
+        # Serialized width, height and board, the board only changes when a bomb explodes:
+        self._head = None
+        self._update_sounds()
+
+    def step(self, commands:dict):
+        # Plays a cycle with ks commands of each side, only the last command of an agent counts.
+        if self.done:
+            return
+        self.cycle += 1
+        last = {}
+        for side in SIDES:
+            for command in commands.get(side, ()):
+                last[side, command.id] = command
+        occupied = {(agent.position.x, agent.position.y) for agent in self._alive()}
+        for (side, agent_id), command in last.items():
+            agent = self.agents[side].get(agent_id)
+            if agent is None or agent.status == EAgentStatus.Dead:
+                continue
+            if isinstance(command, Move):
+                self._move(agent, command.direction, occupied)
+            elif isinstance(command, PlantBomb) and side == "Terrorist":
+                self._plant(agent, command.direction)
+            elif isinstance(command, DefuseBomb) and side == "Police":
+                self._defuse(agent, command.direction)
+        self._advance_bombs()
+        self._catch()
+        self._update_sounds()
+        alive = {side: any(agent.status == EAgentStatus.Alive for agent in agents.values()) for side, agents in self.agents.items()}
+        self.done = self.cycle >= self.constants.max_cycles or not all(alive.values())
+
+    def winner(self):
+        # Side with the higher score, None for a draw.
+        police, terrorist = self.world.scores["Police"], self.world.scores["Terrorist"]
+        return None if police == terrorist else "Police" if police > terrorist else "Terrorist"
+
+    def snapshot(self, side:str):
+        # Serialized world of a side: its own agents, enemies it sees and bombs it knows about.
+        world, c = self.world, self.constants
+        own = self.agents[side].values()
+        eyes = [agent.position for agent in own if agent.status == EAgentStatus.Alive]
+        if side == "Police":
+            seen = lambda position: any(distance(eye, position) <= c.police_vision_distance for eye in eyes)
+            bombs = [bomb for bomb in world.bombs if seen(bomb.position)]
+            terrorists = [Terrorist(t.id, t.position, t.planting_remaining_time, [], t.status)
+                          for t in world.terrorists if t.status == EAgentStatus.Alive and seen(t.position)]
+            polices = world.polices
+        else:
+            seen = lambda position: any(distance(eye, position) <= c.terrorist_vision_distance for eye in eyes)
+            bombs = world.bombs
+            terrorists = world.terrorists
+            polices = [Police(p.id, p.position, p.defusion_remaining_time, [], [], p.status)
+                       for p in world.polices if p.status == EAgentStatus.Alive and seen(p.position)]
+        if self._head is None:
+            # Fields are serialized one after another, so the head is a world's bytes without its 5 last absent fields:
+            self._head = World(world.width, world.height, world.board).serialize()[:-5]
+        # and the rest is a world's bytes without its 3 first absent fields:
+        tail = World(scores=world.scores, bombs=bombs, terrorists=terrorists, polices=polices, constants=c).serialize()[3:]
+        return self._head + tail
+
+    def _alive(self):
+        return [agent for agents in self.agents.values() for agent in agents.values() if agent.status == EAgentStatus.Alive]
+
+    def _target(self, agent, direction:ECommandDirection):
+        # A command without a valid direction is a bug of the AI that sent it, the server would reject it too:
+        if direction not in DIRECTIONS:
+            raise ValueError("%s %d sent a command with an invalid direction: %r" % (type(agent).__name__, agent.id, direction))
+        dx, dy = DIRECTIONS[direction]
+        x, y = agent.position.x + dx, agent.position.y + dy
+        if 0 <= x < self.world.width and 0 <= y < self.world.height:
+            return x, y
+        return None
+
+    def _bomb_at(self, x:int, y:int):
+        for bomb in self.world.bombs:
+            if bomb.position.x == x and bomb.position.y == y:
+                return bomb
+        return None
+
+    def _move(self, agent, direction:ECommandDirection, occupied:set):
+        target = self._target(agent, direction)
+        if target is None or self.world.board[target[1]][target[0]] != ECell.Empty or target in occupied:
+            return
+        self._cancel(agent)
+        occupied.discard((agent.position.x, agent.position.y))
+        occupied.add(target)
+        agent.position = Position(x=target[0], y=target[1])
+
+    def _plant(self, terrorist:Terrorist, direction:ECommandDirection):
+        target = self._target(terrorist, direction)
+        if terrorist.planting_remaining_time != -1 or target is None:
+            return
+        if self.world.board[target[1]][target[0]] in SITE_COEFFICIENTS and self._bomb_at(*target) is None:
+            self.world.bombs.append(Bomb(Position(x=target[0], y=target[1]), -1, terrorist.id, -1))
+            terrorist.planting_remaining_time = self.constants.bomb_planting_time
+
+    def _defuse(self, police:Police, direction:ECommandDirection):
+        target = self._target(police, direction)
+        if police.defusion_remaining_time != -1 or target is None:
+            return
+        bomb = self._bomb_at(*target)
+        if bomb is not None and bomb.planter_id == -1 and bomb.defuser_id == -1:
+            bomb.defuser_id = police.id
+            police.defusion_remaining_time = self.constants.bomb_defusion_time
+
+    def _cancel(self, agent):
+        # Stops planting or defusing of an agent.
+        if isinstance(agent, Terrorist) and agent.planting_remaining_time != -1:
+            self.world.bombs = [bomb for bomb in self.world.bombs if bomb.planter_id != agent.id]
+            agent.planting_remaining_time = -1
+        elif isinstance(agent, Police) and agent.defusion_remaining_time != -1:
+            for bomb in self.world.bombs:
+                if bomb.defuser_id == agent.id:
+                    bomb.defuser_id = -1
+            agent.defusion_remaining_time = -1
+
+    def _site_score(self, score:int, bomb:Bomb):
+        cell = self.world.board[bomb.position.y][bomb.position.x]
+        return score * getattr(self.constants, SITE_COEFFICIENTS[cell])
+
+    def _advance_bombs(self):
+        c, scores = self.constants, self.world.scores
+        for bomb in list(self.world.bombs):
+            if bomb.planter_id != -1:
+                terrorist = self.agents["Terrorist"][bomb.planter_id]
+                terrorist.planting_remaining_time -= 1
+                if terrorist.planting_remaining_time == 0:
+                    terrorist.planting_remaining_time = -1
+                    bomb.planter_id, bomb.explosion_remaining_time = -1, c.bomb_explosion_time
+                    scores["Terrorist"] += self._site_score(c.bomb_planting_score, bomb)
+                continue
+            if bomb.defuser_id != -1:
+                police = self.agents["Police"][bomb.defuser_id]
+                police.defusion_remaining_time -= 1
+                if police.defusion_remaining_time == 0:
+                    police.defusion_remaining_time = -1
+                    self.world.bombs.remove(bomb)
+                    scores["Police"] += self._site_score(c.bomb_defusion_score, bomb)
+                    continue
+            bomb.explosion_remaining_time -= 1
+            if bomb.explosion_remaining_time == 0:
+                self._explode(bomb)
+
+    def _explode(self, bomb:Bomb):
+        self.world.scores["Terrorist"] += self._site_score(self.constants.bomb_explosion_score, bomb)
+        self.world.bombs.remove(bomb)
+        self.world.board[bomb.position.y][bomb.position.x] = ECell.Empty
+        self._head = None
+        for agent in self._alive():
+            if distance(agent.position, bomb.position) <= 1:
+                self._kill(agent)
+
+    def _catch(self):
+        polices = [police for police in self.world.polices if police.status == EAgentStatus.Alive]
+        for terrorist in self.world.terrorists:
+            if terrorist.status == EAgentStatus.Alive and any(distance(police.position, terrorist.position) <= 1 for police in polices):
+                self._kill(terrorist)
+
+    def _kill(self, agent):
+        self._cancel(agent)
+        agent.status = EAgentStatus.Dead
+        if isinstance(agent, Police):
+            self.world.scores["Terrorist"] += self.constants.police_death_score
+        else:
+            self.world.scores["Police"] += self.constants.terrorist_death_score
+
+    def _intensity(self, d:int):
+        for r, intensity in self.ranges:
+            if d <= r:
+                return intensity
+        return None
+
+    def _update_sounds(self):
+        c = self.constants
+        polices = [police for police in self.world.polices if police.status == EAgentStatus.Alive]
+        terrorists = [terrorist for terrorist in self.world.terrorists if terrorist.status == EAgentStatus.Alive]
+        planted = [bomb for bomb in self.world.bombs if bomb.planter_id == -1]
+        for police in polices:
+            police.footstep_sounds = [s for s in (self._intensity(distance(police.position, t.position)) for t in terrorists) if s]
+            police.bomb_sounds = []
+            for bomb in planted:
+                d = self._site_distance(bomb.position, police.position)
+                if d is not None and d > c.police_vision_distance:
+                    sound = self._intensity(d)
+                    if sound:
+                        police.bomb_sounds.append(sound)
+        for terrorist in terrorists:
+            terrorist.footstep_sounds = [s for s in (self._intensity(distance(terrorist.position, p.position)) for p in polices) if s]
+
+    def _site_distance(self, site:Position, position:Position):
+        # Sound goes through every cell except walls, up to the farthest sound range.
+        key = (site.x, site.y)
+        if key not in self.site_distances:
+            board, width, height = self.world.board, self.world.width, self.world.height
+            limit = self.ranges[-1][0] if self.ranges else 0
+            distances, queue = {key: 0}, deque([key])
+            while queue:
+                x, y = queue.popleft()
+                d = distances[x, y] + 1
+                if d > limit:
+                    continue
+                for dx, dy in DIRECTIONS.values():
+                    t = (x + dx, y + dy)
+                    if 0 <= t[0] < width and 0 <= t[1] < height and t not in distances and board[t[1]][t[0]] != ECell.Wall:
+                        distances[t] = d
+                        queue.append(t)
+            self.site_distances[key] = distances
+        return self.site_distances[key].get((position.x, position.y))
+
+
+class LocalSnapshot:
+
+    # Fields of chillin's RealtimeSnapshot that RealtimeAI.update reads.
+    def __init__(self, world_payload:str, current_cycle:int, cycle_duration:float):
+        self.world_payload = world_payload
+        self.current_cycle = current_cycle
+        self.cycle_duration = cycle_duration
+
+
+class LocalClient:
+
+    # Plays a RealtimeAI like chillin's Core does but in the calling thread and without a network:
+    # snapshots are given to update, initialize runs on the first one and decide on each one.
+    # It stands in for chillin's command send queue too, commands are decoded back into ks commands.
+    def __init__(self, ai, side:str, cycle_duration:float=0.0):
+        self.ai = ai
+        self.cycle_duration = cycle_duration
+        self.messages = []
+        self.initialized = False
+        # Seconds taken by initialize and by update and decide of each snapshot:
+        self.initialize_time = 0.0
+        self.tick_times = []
+        ai.my_side = side
+        ai.sides = {name: ["0"] for name in SIDES}
+        ai.other_sides = [name for name in SIDES if name != side]
+        ai.other_side = ai.other_sides[0]
+        ai.set_command_send_queue(self)
+
+    def put(self, msg):
+        self.messages.append(msg)
+
+    def play(self, payload:bytes, cycle:int):
+        # ks commands the AI sends for a snapshot.
+        start = time.perf_counter()
+        self.ai.update(LocalSnapshot(Parser.get_string(payload), cycle, self.cycle_duration))
+        if not self.initialized:
+            self.initialized = True
+            initialize_start = time.perf_counter()
+            self.ai.initialize()
+            self.initialize_time = time.perf_counter() - initialize_start
+            start += self.initialize_time
+        self.ai.decide()
+        self.tick_times.append(time.perf_counter() - start)
+        messages, self.messages = self.messages, []
+        return [command for msg in messages for command in LocalClient._commands(msg)]
+
+    @staticmethod
+    def _commands(msg):
+        if isinstance(msg, CommandBatch):
+            offset, data = 0, msg.data
+            while offset < len(data):
+                # Frames of a batch are Messages of RealtimeCommands:
+                _, payload, offset = decode_frame(data, offset)
+                inner = RealtimeCommand()
+                inner.deserialize(payload)
+                yield LocalClient._command(inner.type, inner.payload)
+        else:
+            yield LocalClient._command(msg.type, msg.payload)
+
+    @staticmethod
+    def _command(type_name:str, payload:str):
+        command = COMMANDS[type_name]()
+        command.deserialize(Parser.get_bytes(payload))
+        return command
+
+
+def play(world:World, police_ai=None, terrorist_ai=None, cycles:int=None):
+    # Plays a game between two AIs, a side without an AI stays idle. Returns the finished Game and LocalClients by side.
+    game = Game(world)
+    clients = {side: LocalClient(ai, side) for side, ai in (("Police", police_ai), ("Terrorist", terrorist_ai)) if ai is not None}
+    while not game.done and (cycles is None or game.cycle < cycles):
+        commands = {side: client.play(game.snapshot(side), game.cycle) for side, client in clients.items()}
+        game.step(commands)
+    return game, clients
@@ -1,50 +1,216 @@
+from array import array
+
 from ks.models import (World, ECell, ESoundIntensity)
+from codec import Board
+
+# Sound codes of a cell heard from a bomb site:
+NONE, WEAK, NORMAL, STRONG, VISION = range(5)
+
+INTENSITIES = [
+    (WEAK, ESoundIntensity.Weak),
+    (NORMAL, ESoundIntensity.Normal),
+    (STRONG, ESoundIntensity.Strong),
+]
+
+CODES = {
+    ESoundIntensity.Weak: WEAK,
+    ESoundIntensity.Normal: NORMAL,
+    ESoundIntensity.Strong: STRONG,
+    "VISION": VISION,
+}
 
 class Sound:
 
     def __init__(self, world:World, bomb_sites:list):
         self.world = world
-        self.sound_board = [[[] for j in range(world.width)] for i in range(world.height)]
-        self.bomb_sites = bomb_sites
-        self.X, self.Y, self.Z = tuple(world.constants.sound_ranges.values())     
-    
+        self.width = world.width
+        self.size = world.width * world.height
+        self.bomb_sites = list(bomb_sites)
+        self.site_index = {site: index for index, site in enumerate(self.bomb_sites)}
+        self.X, self.Y, self.Z = tuple(world.constants.sound_ranges.values())
+        # Sound code of each distance from a bomb site:
+        self.depth_code = bytearray(self._code(depth) for depth in range(self.Z + 1))
+        # Sound goes through every cell except walls:
+        self.open_cells = Sound._open_cells(world)
+        # Cells reached by each bomb site's sound and their sound codes, ring by ring:
+        self.rings = {}
+        # Number of bomb sites heard with each intensity and sum of their indexes, a single site's index is the sum itself:
+        self.count = [array('H', [0]) * self.size for code in range(VISION)]
+        self.site_sum = [array('i', [0]) * self.size for code in range(VISION)]
+        # Bomb sites indexes seen from each cell:
+        self.vision = {}
+        # Cells of each (bomb site, intensity) where the sound is unambiguous:
+        self.site_cells_cache = {}
+        self.sound_board = SoundBoard(self)
+
     def fill(self):
-        for bombsite in self.bomb_sites:
+        for index in self.site_index.values():
             # Extracting each bombsite's sounds:
-            self._bfs(bombsite)
-        for i in range(self.world.height):
-            for j in range(self.world.width):
-                l, new = self.sound_board[i][j], []
-                for sound in [ESoundIntensity.Weak, ESoundIntensity.Normal, ESoundIntensity.Strong]:
-                    # Duplicate sounds are useless...
-                    if  [t[0] for t in l].count(sound) == 1:
-                        for item in l:
-                            if item[0] == sound:
-                                new.append(item)
-                for item in l:
-                    if item[0] == "VISION":
-                        new.append(item)
-                self.sound_board[i][j] = new
+            self._bfs(index)
+            self._add(index)
         return self.sound_board
-    
-    def _bfs(self, bombsite:tuple):
-        queue, visited, cnt = [bombsite], [bombsite], 1
+
+    def add_site(self, pos:tuple):
+        # Adding only this bomb site's sounds, affected cells are rebuilt on next access.
+        if pos in self.site_index:
+            return
+        index = len(self.bomb_sites)
+        self.bomb_sites.append(pos)
+        self.site_index[pos] = index
+        self._bfs(index)
+        self._add(index)
+        self.sound_board.forget(self.rings[index][0])
+        self.site_cells_cache.clear()
+
+    def remove_site(self, pos:tuple):
+        # Subtracting only this bomb site's sounds, e.g. when its bomb explodes.
+        index = self.site_index.pop(pos, None)
+        if index is None:
+            return
+        self._remove(index)
+        self.sound_board.forget(self.rings.pop(index)[0])
+        self.site_cells_cache.clear()
+
+    def outdated(self, world:World):
+        # Sites can be added or removed while walls of the board don't change.
+        return Sound._open_cells(world) != self.open_cells
+
+    @staticmethod
+    def _open_cells(world:World):
+        if isinstance(world.board, Board):
+            return world.board.mask([cell for cell in ECell if cell != ECell.Wall])
+        return bytearray(cell != ECell.Wall for row in world.board for cell in row)
+
+    def sounds(self, i:int, j:int):
+        # Duplicate sounds are useless, an intensity is kept only if it's heard from exactly one bomb site.
+        l = []
+        for code, intensity in INTENSITIES:
+            site = self.heard_site(i, j, intensity)
+            if site:
+                l.append((intensity, site[0], site[1]))
+        for site in self.seen_sites(i, j):
+            l.append(("VISION", site[0], site[1]))
+        return l
+
+    def heard_site(self, i:int, j:int, intensity:ESoundIntensity):
+        # The only bomb site heard from a cell with an intensity, None means no site or more than one.
+        v, code = i * self.width + j, CODES[intensity]
+        if self.count[code][v] == 1:
+            return self.bomb_sites[self.site_sum[code][v]]
+        return None
+
+    def seen_sites(self, i:int, j:int):
+        return [self.bomb_sites[index] for index in self.vision.get(i * self.width + j, ())]
+
+    def site_cells(self, site:tuple, intensity):
+        # Cells hearing a bomb site with an intensity unambiguously, "VISION" intensity gives cells seeing the site.
+        key = (site, intensity)
+        if key not in self.site_cells_cache:
+            cells, codes = self.rings[self.site_index[site]]
+            code = CODES[intensity]
+            count = self.count[code] if code != VISION else None
+            self.site_cells_cache[key] = [divmod(v, self.width) for v, c in zip(cells, codes) if c == code and (code == VISION or count[v] == 1)]
+        return self.site_cells_cache[key]
+
+    def _code(self, depth:int):
+        if depth <= self.world.constants.police_vision_distance:
+            return VISION
+        elif depth <= self.X:
+            return STRONG
+        elif depth <= self.Y:
+            return NORMAL
+        elif depth <= self.Z:
+            return WEAK
+        return NONE
+
+    def _add(self, index:int):
+        cells, codes = self.rings[index]
+        count, site_sum = self.count, self.site_sum
+        for v, code in zip(cells, codes):
+            if code == VISION:
+                self.vision.setdefault(v, []).append(index)
+            elif code != NONE:
+                count[code][v] += 1
+                site_sum[code][v] += index
+
+    def _remove(self, index:int):
+        cells, codes = self.rings[index]
+        count, site_sum = self.count, self.site_sum
+        for v, code in zip(cells, codes):
+            if code == VISION:
+                self.vision[v].remove(index)
+                if not self.vision[v]:
+                    del self.vision[v]
+            elif code != NONE:
+                count[code][v] -= 1
+                site_sum[code][v] -= index
+
+    def _bfs(self, index:int):
+        width, size, open_cells, depth_code = self.width, self.size, self.open_cells, self.depth_code
+        x, y = self.bomb_sites[index]
+        source = x * width + y
+        cells, codes, visited = array('i'), bytearray(), {source}
+        queue, cnt = [source], 1
         while queue and cnt <= self.Z:
-            frontier = []
-            for node in queue:
-                x, y = node
-                adjacent = [(x-1, y), (x+1, y), (x, y-1), (x, y+1)]
+            frontier, code = [], depth_code[cnt]
+            for v in queue:
+                col = v % width
+                adjacent = (
+                    v - width if v >= width else -1,
+                    v + width if v + width < size else -1,
+                    v - 1 if col > 0 else -1,
+                    v + 1 if col < width - 1 else -1,
+                )
                 for t in adjacent:
-                    if self.world.board[t[0]][t[1]] != ECell.Wall and t not in visited:
-                        if cnt <= self.world.constants.police_vision_distance:
-                            self.sound_board[t[0]][t[1]].append(("VISION", bombsite[0], bombsite[1]))
-                        elif cnt <= self.X:
-                            self.sound_board[t[0]][t[1]].append((ESoundIntensity.Strong, bombsite[0], bombsite[1]))
-                        elif cnt <= self.Y:
-                            self.sound_board[t[0]][t[1]].append((ESoundIntensity.Normal, bombsite[0], bombsite[1]))
-                        elif cnt <= self.Z:
-                            self.sound_board[t[0]][t[1]].append((ESoundIntensity.Weak, bombsite[0], bombsite[1]))
-                        visited.append(t)
+                    if t != -1 and open_cells[t] and t not in visited:
+                        visited.add(t)
                         frontier.append(t)
+            cells.extend(frontier)
+            codes.extend(bytes([code]) * len(frontier))
             queue = frontier
             cnt += 1
+        self.rings[index] = (cells, codes)
+
+
+class SoundBoard:
+
+    # A board[i][j] view of sounds, each cell's sound list is built on first access.
+    def __init__(self, sound:Sound):
+        self.sound = sound
+        self.cells = {}
+        self.rows = [SoundRow(self, i) for i in range(sound.world.height)]
+
+    def __getitem__(self, i:int):
+        return self.rows[i]
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def cell(self, i:int, j:int):
+        v = i * self.sound.width + j
+        if v not in self.cells:
+            self.cells[v] = self.sound.sounds(i, j)
+        return self.cells[v]
+
+    def forget(self, cells):
+        for v in cells:
+            self.cells.pop(v, None)
+
+
+class SoundRow:
+
+    def __init__(self, board:SoundBoard, i:int):
+        self.board = board
+        self.i = i
+
+    def __getitem__(self, j:int):
+        return self.board.cell(self.i, j)
+
+    def __len__(self):
+        return self.board.sound.width
+
+    def __iter__(self):
+        return (self.board.cell(self.i, j) for j in range(len(self)))
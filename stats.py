@@ -0,0 +1,13 @@
+# Latency and size percentiles shared by the decision worker, the tournament and the benchmarks.
+PERCENTILES = [50, 95, 99]
+
+
+def percentiles(values, scale:float=1.0):
+    # Nearest rank percentiles, max and mean of values times scale, e.g. 1000 to report seconds in ms. No values give {}.
+    values = sorted(values)
+    if not values:
+        return {}
+    report = {"p%d" % p: values[min(len(values) - 1, len(values) * p // 100)] * scale for p in PERCENTILES}
+    report["max"] = values[-1] * scale
+    report["mean"] = sum(values) / len(values) * scale
+    return report
@@ -20,6 +20,6 @@ from sound import Sound
 class Strategy(AI):
 
     def __init__(self, world):
-        super(self).__init__(world)
+        super(Strategy, self).__init__(world)
     
     
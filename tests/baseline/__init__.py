@@ -0,0 +1,3 @@
+# -*- coding: utf-8 -*-
+# ks models and commands as chillin generated them, the reference wire format of ksgen.py codecs,
+# and the AI's first sound.py, the reference sound board of Sound.
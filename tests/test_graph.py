@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+# python imports
+import random
+import unittest
+
+# project imports
+from ks.models import ECell
+
+# my imports
+from graph import ListGraph, ArrayGraph
+from mapgen import generate
+
+SIZES = [5, 12, 30]
+SEEDS = range(10)
+
+
+def make_searches(size, seed):
+    # A generated map and searches from each agent, blocked by other agents around it like the AI's graphs are.
+    world = generate(size, seed=seed)
+    rnd = random.Random(seed)
+    agents = [(agent.position.y, agent.position.x) for agent in world.polices + world.terrorists]
+    sites = [(i, j) for i, row in enumerate(world.board) for j, cell in enumerate(row) if cell not in (ECell.Empty, ECell.Wall)]
+    empty = [(i, j) for i, row in enumerate(world.board) for j, cell in enumerate(row) if cell == ECell.Empty]
+    for source in agents:
+        black_pos = [t for t in agents if t != source and rnd.random() < 0.5]
+        yield world, source, black_pos, sites + rnd.sample(empty, min(len(empty), 5))
+
+
+class GraphTest(unittest.TestCase):
+
+    # ArrayGraph must find the same paths and distances as ListGraph, the AI's first backend.
+
+    def test_paths(self):
+        for size in SIZES:
+            for seed in SEEDS:
+                for world, source, black_pos, destinations in make_searches(size, seed):
+                    for destination in destinations:
+                        for pop_destination in [True, False]:
+                            with self.subTest(size=size, seed=seed, source=source, destination=destination, pop=pop_destination):
+                                self.assertEqual(ArrayGraph(world, source, black_pos).bfs(destination, pop_destination),
+                                                 ListGraph(world, source, black_pos).bfs(destination, pop_destination))
+
+    def test_no_destination(self):
+        world = generate(12)
+        source = (world.polices[0].position.y, world.polices[0].position.x)
+        self.assertIsNone(ArrayGraph(world, source).bfs(None))
+        self.assertIsNone(ListGraph(world, source).bfs(None))
+
+    def test_distances(self):
+        for size in SIZES:
+            for seed in SEEDS:
+                for world, source, black_pos, _ in make_searches(size, seed):
+                    with self.subTest(size=size, seed=seed, source=source):
+                        array_graph, list_graph = ArrayGraph(world, source, black_pos), ListGraph(world, source, black_pos)
+                        self.assertEqual([[array_graph.distance((i, j)) for j in range(size)] for i in range(size)],
+                                         [[list_graph.distance((i, j)) for j in range(size)] for i in range(size)])
+
+    def test_distance_after_bfs(self):
+        # A targeted search first leaves ArrayGraph's search state half done.
+        for seed in SEEDS:
+            for world, source, black_pos, destinations in make_searches(30, seed):
+                with self.subTest(seed=seed, source=source):
+                    graph = ArrayGraph(world, source, black_pos)
+                    graph.bfs(destinations[0])
+                    for destination in destinations:
+                        self.assertEqual(graph.distance(destination), ListGraph(world, source, black_pos).distance(destination))
+
+
+if __name__ == '__main__':
+    unittest.main()
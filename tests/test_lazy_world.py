@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+# python imports
+import enum
+import random
+import unittest
+
+# project imports
+from ks import models
+
+# my imports
+from codec import LazyWorld
+from mapgen import generate
+from tests.test_serialize import make_world
+
+SEEDS = range(40)
+FIELDS = ['width', 'height', 'board', 'scores', 'bombs', 'terrorists', 'polices', 'constants']
+
+
+def plain(value):
+    # Lists, dicts and enum items of a model's fields, so the eager and lazy worlds compare by value.
+    if value is None or isinstance(value, (int, float, str, enum.Enum)):
+        return value
+    if isinstance(value, dict):
+        return {plain(key): plain(item) for key, item in value.items()}
+    if hasattr(type(value), '__slots__') and not hasattr(value, '__len__'):
+        return {name: plain(getattr(value, name)) for name in type(value).__slots__}
+    return [plain(item) for item in value]
+
+
+def decode(world_type, s):
+    world = world_type()
+    world.deserialize(s)
+    return world
+
+
+class LazyWorldTest(unittest.TestCase):
+
+    # LazyWorld must read every field of a snapshot like the generated World does.
+
+    def assertFields(self, lazy, expected, fields=FIELDS):
+        for name in fields:
+            self.assertEqual(plain(getattr(lazy, name)), plain(getattr(expected, name)), name)
+
+    def test_random_worlds(self):
+        # Missing fields and ragged boards included.
+        for seed in SEEDS:
+            with self.subTest(seed=seed):
+                s = make_world(models, seed).serialize()
+                self.assertFields(decode(LazyWorld, s), decode(models.World, s))
+
+    def test_game(self):
+        # One LazyWorld decodes a game's snapshots, fields are read in a different order on each tick and some are skipped.
+        world = generate(30, seed=1)
+        lazy, rnd = LazyWorld(), random.Random(1)
+        for tick in range(40):
+            for agent in world.polices + world.terrorists:
+                agent.position = models.Position(x=agent.position.x, y=agent.position.y + rnd.choice([-1, 0, 1]))
+            world.scores = {"Police": float(tick), "Terrorist": 0.0}
+            if tick % 10 == 9:
+                world.board[0][0] = models.ECell.SmallBombSite if world.board[0][0] == models.ECell.Wall else models.ECell.Wall
+            s = world.serialize()
+            lazy.deserialize(s)
+            fields = rnd.sample(FIELDS, rnd.randrange(len(FIELDS) + 1))
+            with self.subTest(tick=tick, fields=fields):
+                self.assertFields(lazy, decode(models.World, s), fields)
+        self.assertFields(lazy, decode(models.World, s))
+
+    def test_round_trip(self):
+        for seed in SEEDS:
+            with self.subTest(seed=seed):
+                s = make_world(models, seed).serialize()
+                self.assertEqual(decode(LazyWorld, s).serialize(), s)
+
+
+if __name__ == '__main__':
+    unittest.main()
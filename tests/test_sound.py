@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+# python imports
+import random
+import unittest
+
+# project imports
+from ks.models import ECell, ESoundIntensity
+
+# my imports
+from mapgen import generate
+from sound import Sound
+from tests.baseline import sound as baseline_sound
+
+SIZES = [5, 12, 30, 50]
+SEEDS = range(10)
+INTENSITIES = [ESoundIntensity.Weak, ESoundIntensity.Normal, ESoundIntensity.Strong, "VISION"]
+
+
+def make_world(size, seed):
+    # A generated map and its bomb sites in the AI's (i, j) form.
+    world = generate(size, seed=seed)
+    sites = [(i, j) for i, row in enumerate(world.board) for j, cell in enumerate(row) if cell not in (ECell.Empty, ECell.Wall)]
+    return world, sites
+
+
+def baseline_board(world, sites):
+    return baseline_sound.Sound(world, list(sites)).fill()
+
+
+class SoundTest(unittest.TestCase):
+
+    # Sound must give the same sound board as the AI's first sound.py, kept in tests/baseline.
+
+    def assertBoard(self, board, expected):
+        self.assertEqual([list(row) for row in board], expected)
+
+    def test_fill(self):
+        for size in SIZES:
+            for seed in SEEDS:
+                with self.subTest(size=size, seed=seed):
+                    world, sites = make_world(size, seed)
+                    self.assertBoard(Sound(world, sites).fill(), baseline_board(world, sites))
+
+    def test_site_changes(self):
+        # Adding and removing sites one by one must end where a new fill of the remaining sites does.
+        for seed in SEEDS:
+            world, sites = make_world(30, seed)
+            rnd = random.Random(seed)
+            sound = Sound(world, sites[:len(sites) // 2])
+            board = sound.fill()
+            current = list(sound.bomb_sites)
+            for _ in range(6):
+                if current and rnd.random() < 0.5:
+                    site = rnd.choice(current)
+                    sound.remove_site(site)
+                    current.remove(site)
+                else:
+                    site = rnd.choice(sites)
+                    sound.add_site(site)
+                    if site not in current:
+                        current.append(site)
+                with self.subTest(seed=seed, sites=list(current)):
+                    self.assertBoard(board, baseline_board(world, current))
+
+    def test_site_cells(self):
+        # Cells of a site and intensity are the cells whose sound list names the site with the intensity.
+        for seed in SEEDS:
+            world, sites = make_world(30, seed)
+            sound, expected = Sound(world, sites), baseline_board(world, sites)
+            sound.fill()
+            for site in sites:
+                for intensity in INTENSITIES:
+                    with self.subTest(seed=seed, site=site, intensity=intensity):
+                        cells = [(i, j) for i, row in enumerate(expected) for j, l in enumerate(row)
+                                 if (intensity, site[0], site[1]) in l]
+                        self.assertEqual(sorted(sound.site_cells(site, intensity)), cells)
+
+
+if __name__ == '__main__':
+    unittest.main()
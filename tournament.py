@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+
+# python imports
+import os
+import json
+import time
+import argparse
+import importlib
+import traceback
+import multiprocessing
+from array import array
+from collections import defaultdict
+
+# project imports
+from ks.models import World
+
+# my imports
+from mapgen import generate
+from codec import LazyWorld
+from simulator import SIDES, play
+from stats import percentiles
+
+# Players are given as module.Class of an AI subclass, e.g. ai.AI or strategy.Strategy.
+PLAYERS = ["ai.AI", "strategy.Strategy"]
+
+# Serialized worlds of maps, loaded once in each worker:
+_maps = []
+
+
+def load_map(spec:str):
+    # A map is a file of a serialized World or SIZE:SEED of a generated one.
+    if os.path.exists(spec):
+        with open(spec, 'rb') as f:
+            return f.read()
+    size, seed = spec.split(':')
+    return generate(int(size), seed=int(seed)).serialize()
+
+
+def player(spec:str):
+    module, name = spec.rsplit('.', 1)
+    return getattr(importlib.import_module(module), name)
+
+
+def _init_worker(map_specs):
+    global _maps
+    _maps = [load_map(spec) for spec in map_specs]
+
+
+def run_match(match):
+    # Plays a match in a worker, (map index, police player, terrorist player, cycles) -> result.
+    # A failing match gives a result with its traceback, the other matches of the tournament go on.
+    map_index, police, terrorist, cycles = match
+    try:
+        world = World()
+        world.deserialize(_maps[map_index])
+        game, clients = play(world, player(police)(LazyWorld()), player(terrorist)(LazyWorld()), cycles)
+    except Exception:
+        return {
+            "map": map_index,
+            "players": {"Police": police, "Terrorist": terrorist},
+            "cycles": 0,
+            "error": traceback.format_exc(),
+        }
+    return {
+        "map": map_index,
+        "players": {"Police": police, "Terrorist": terrorist},
+        "error": None,
+        "scores": dict(game.world.scores),
+        "winner": game.winner(),
+        "cycles": game.cycle,
+        "initialize": {side: client.initialize_time for side, client in clients.items()},
+        # Tick times are sent back as compact arrays, thousands of games give millions of ticks:
+        "ticks": {side: array('d', client.tick_times) for side, client in clients.items()},
+    }
+
+
+def matches(map_count:int, players:list, games:int, cycles:int):
+    # Each pair of players meets on every map on both sides, games times.
+    return [(map_index, police, terrorist, cycles)
+            for _ in range(games)
+            for map_index in range(map_count)
+            for police in players
+            for terrorist in players]
+
+
+def summarize(results):
+    # Scores and tick latencies of each player on each side.
+    # Failed matches count as errors of both players, they don't have scores or ticks:
+    stats = defaultdict(lambda: {"games": 0, "errors": 0, "wins": 0, "draws": 0, "score": 0.0, "initialize": 0.0, "ticks": array('d')})
+    for result in results:
+        for side in SIDES:
+            s = stats[result["players"][side], side]
+            if result["error"]:
+                s["errors"] += 1
+                continue
+            s["games"] += 1
+            s["wins"] += result["winner"] == side
+            s["draws"] += result["winner"] is None
+            s["score"] += result["scores"][side]
+            s["initialize"] += result["initialize"][side]
+            s["ticks"].extend(result["ticks"][side])
+    summary = []
+    for (name, side), s in sorted(stats.items()):
+        summary.append({
+            "player": name,
+            "side": side,
+            "games": s["games"],
+            "errors": s["errors"],
+            "wins": s["wins"],
+            "draws": s["draws"],
+            "mean_score": s["score"] / s["games"] if s["games"] else 0.0,
+            "initialize_ms": s["initialize"] / s["games"] * 1000 if s["games"] else 0.0,
+            "tick_ms": percentiles(s["ticks"], 1000),
+        })
+    return summary
+
+
+def run(map_specs:list, players:list, games:int, cycles:int, processes:int=None):
+    todo = matches(len(map_specs), players, games, cycles)
+    start = time.perf_counter()
+    with multiprocessing.Pool(processes, _init_worker, (map_specs,)) as pool:
+        # Matches take about the same time, small chunks keep all workers busy till the end:
+        results = list(pool.imap_unordered(run_match, todo, chunksize=max(1, len(todo) // (8 * (processes or os.cpu_count())))))
+    elapsed = time.perf_counter() - start
+    return {
+        "maps": map_specs,
+        "matches": len(results),
+        "failures": [{"map": result["map"], "players": result["players"], "error": result["error"]} for result in results if result["error"]],
+        "seconds": elapsed,
+        "cycles_per_second": sum(result["cycles"] for result in results) / elapsed,
+        "players": summarize(results),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Self-play tournament of AIs on local games.")
+    parser.add_argument("--players", nargs="+", default=PLAYERS, help="module.Class of each player")
+    parser.add_argument("--maps", nargs="+", default=["30:%d" % seed for seed in range(4)],
+                        help="files of serialized worlds or SIZE:SEED of generated maps")
+    parser.add_argument("--games", type=int, default=1, help="rounds of matches on each map")
+    parser.add_argument("--cycles", type=int, default=300, help="cycles of a match at most")
+    parser.add_argument("--processes", type=int, default=None, help="workers, all cores by default")
+    parser.add_argument("--output", help="JSON file of the report")
+    args = parser.parse_args()
+
+    report = run(args.maps, args.players, args.games, args.cycles, args.processes)
+    print("%d matches in %.1f s, %.0f cycles/s" % (report["matches"], report["seconds"], report["cycles_per_second"]))
+    print("%-20s %-10s %6s %6s %6s %6s %10s %10s %10s" % ("player", "side", "games", "errors", "wins", "draws", "score", "tick p50", "tick p99"))
+    for p in report["players"]:
+        print("%-20s %-10s %6d %6d %6d %6d %10.1f %10.3f %10.3f" % (
+            p["player"], p["side"], p["games"], p["errors"], p["wins"], p["draws"], p["mean_score"],
+            p["tick_ms"].get("p50", 0.0), p["tick_ms"].get("p99", 0.0)))
+    for failure in report["failures"][:1]:
+        print("%d matches failed, first on map %d with %s:\n%s" % (
+            len(report["failures"]), failure["map"], failure["players"], failure["error"]))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+from ks.models import (World, ECell, EAgentStatus)
+
+# World change events, each one is a (kind, value) tuple:
+SITE_REMOVED = "site_removed"    # value: bomb site position
+AGENT_DIED = "agent_died"        # value: (side, agent id)
+
+BOMBSITES_ECELL = {
+    ECell.SmallBombSite,
+    ECell.MediumBombSite,
+    ECell.LargeBombSite,
+    ECell.VastBombSite,
+}
+
+class Tracker:
+
+    def __init__(self, world:World):
+        self.world = world
+        # Bomb sites never appear during a game, so the board is scanned only once:
+        self.sites = []
+        for i in range(world.height):
+            for j in range(world.width):
+                if world.board[i][j] in BOMBSITES_ECELL:
+                    self.sites.append((i, j))
+        # Positions of planted bombs in the last snapshot:
+        self.bombs = self._bombs()
+        self.status = self._status()
+
+    def update(self):
+        # Comparing current snapshot with the previous one, events are sorted by position like a board scan.
+        events = []
+        board = self.world.board
+        sites = []
+        for site in self.sites:
+            if board[site[0]][site[1]] in BOMBSITES_ECELL:
+                sites.append(site)
+            else:
+                events.append((SITE_REMOVED, site))
+        self.sites = sites
+
+        self.bombs = self._bombs()
+
+        status = self._status()
+        for agent, agent_status in status.items():
+            if agent_status == EAgentStatus.Dead and self.status.get(agent) != EAgentStatus.Dead:
+                events.append((AGENT_DIED, agent))
+        self.status = status
+        return events
+
+    def _bombs(self):
+        return {(bomb.position.y, bomb.position.x) for bomb in self.world.bombs or []}
+
+    def _status(self):
+        status = {}
+        for agent in self.world.polices or []:
+            status[("Police", agent.id)] = agent.status
+        for agent in self.world.terrorists or []:
+            status[("Terrorist", agent.id)] = agent.status
+        return status
+
+
+class Occupancy:
+
+    def __init__(self, world:World, side:str):
+        # Alive agents of our side on a flat grid, built once per tick.
+        self.width, self.height = world.width, world.height
+        self.grid = bytearray(world.width * world.height)
+        for agent in (world.polices if side == "Police" else world.terrorists) or []:
+            if agent.status == EAgentStatus.Alive:
+                self.grid[agent.position.y * self.width + agent.position.x] = 1
+
+    def has(self, pos:tuple):
+        return 0 <= pos[0] < self.height and 0 <= pos[1] < self.width and self.grid[pos[0] * self.width + pos[1]] != 0
+
+    def neighbours(self, pos:tuple):
+        # Adjacent cells of a position occupied by our agents.
+        x, y = pos
+        return [t for t in ((x-1, y), (x+1, y), (x, y-1), (x, y+1)) if self.has(t)]
@@ -0,0 +1,122 @@
+# python imports
+import time
+import logging
+import threading
+from array import array
+
+# my imports
+from stats import percentiles
+
+log = logging.getLogger("worker")
+
+
+class Mailbox:
+
+    # A one-slot mailbox of the latest snapshot: posting replaces a snapshot that wasn't taken yet,
+    # so a slow decision is followed by the newest state instead of a queue of stale ones.
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.item = None
+        self.closed = False
+        self.skipped = 0
+
+    def post(self, item):
+        with self.condition:
+            if self.item is not None:
+                self.skipped += 1
+            self.item = item
+            self.condition.notify()
+
+    def take(self):
+        # Waits for the latest item, None once the mailbox is closed.
+        with self.condition:
+            while self.item is None and not self.closed:
+                self.condition.wait()
+            item, self.item = self.item, None
+            return item
+
+    def pending(self):
+        with self.condition:
+            return self.item is not None
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.condition.notify()
+
+
+class DecisionWorker:
+
+    # A single long-lived decision thread of an AI. After initialize, AI.update posts snapshots to the mailbox
+    # and only this thread applies them to the world and decides, so decisions never overlap.
+    # Lateness of a decision is the time from receiving its snapshot to sending its commands,
+    # a decision is late when it takes longer than a cycle and stale when a newer snapshot arrived meanwhile.
+    def __init__(self, ai):
+        self.ai = ai
+        self.mailbox = Mailbox()
+        self.running = False
+        self.thread = None
+        self.stopped = threading.Event()
+        self.lock = threading.Lock()
+        self.decisions, self.late, self.stale = 0, 0, 0
+        self.lateness = array('d')
+
+    def start(self):
+        # Snapshots received from now on are left to the worker.
+        self.running = True
+
+    def post(self, snapshot):
+        self.mailbox.post((snapshot, time.perf_counter()))
+
+    def run(self):
+        # Decides the current world, then the latest snapshot each time, until stop. Runs in chillin's decision thread,
+        # decision threads started while a worker is running return right away.
+        with self.lock:
+            if self.stopped.is_set() or self.thread is not None:
+                return
+            self.thread = threading.current_thread()
+        received = time.perf_counter()
+        try:
+            while True:
+                self._decide(received)
+                item = self.mailbox.take()
+                if item is None:
+                    break
+                snapshot, received = item
+                self.ai.apply_snapshot(snapshot)
+        finally:
+            self.stopped.set()
+
+    def _decide(self, received:float):
+        try:
+            self.ai.decide_tick()
+        except Exception:
+            log.exception("Decision of cycle %d failed.", self.ai.current_cycle)
+        lateness = time.perf_counter() - received
+        self.decisions += 1
+        self.lateness.append(lateness)
+        if self.ai.cycle_duration and lateness > self.ai.cycle_duration:
+            self.late += 1
+            log.warning("Decision of cycle %d took %.1f ms, longer than a cycle.", self.ai.current_cycle, lateness * 1000)
+        if self.mailbox.pending():
+            self.stale += 1
+
+    def stop(self, timeout:float=None):
+        # Ends the decision loop and logs a summary of the game.
+        self.mailbox.close()
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join(timeout)
+        self.stopped.set()
+        log.info("Decisions: %s", self.report())
+
+    def report(self):
+        report = {
+            "decisions": self.decisions,
+            "skipped": self.mailbox.skipped,
+            "late": self.late,
+            "stale": self.stale,
+            "fallbacks": self.ai.fallbacks,
+        }
+        if self.lateness:
+            report["lateness_ms"] = percentiles(self.lateness, 1000)
+        return report